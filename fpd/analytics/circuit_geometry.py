@@ -0,0 +1,255 @@
+# fpd/analytics/circuit_geometry.py
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from fpd.analytics.corner_detect import detect_corner_ranges
+from fpd.analytics.sector_matrix import SECTOR_MATRIX_COLUMNS, get_sector_matrix
+from fpd.core.logging import get_logger
+from fpd.data.circuit_db import (
+    CircuitCorner,
+    CircuitGeometry,
+    circuit_key,
+    read_geometry,
+    session_season,
+    write_geometry,
+)
+from fpd.data.session_cache import SingleFlight
+from fpd.data.telemetry_store import lap_telemetry
+
+
+log = get_logger(__name__)
+
+OUTLINE_STEP_M = 10.0            # outline resolution stored in the circuit DB
+CORNER_BEFORE_M = 200.0          # corner range around a FastF1 apex when no detected range covers it
+CORNER_AFTER_M = 150.0
+
+# One build per circuit key at a time (several pages may ask for the same circuit at once);
+# builds of different circuits run concurrently
+_BUILDS = SingleFlight()
+
+# Circuit keys whose build failed in this process (not retried until restart)
+_MISSES: set[str] = set()
+_MISSES_LOCK = threading.Lock()
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def get_circuit_geometry(session, lap=None) -> CircuitGeometry | None:
+    """
+    Circuit geometry for the session's layout (see circuit_db.circuit_key).
+
+    Read from the circuit DB when it exists (no telemetry touched). Otherwise built
+    once from the session's fastest valid lap and written to the DB:
+      - corners: FastF1 circuit info numbers/apexes when available, braking/traction
+        ranges from detect_corner_ranges; detected corners only when circuit info is missing
+      - sector boundaries: Sector1/2SessionTime of the lap located on its telemetry
+      - outline + rotation
+    Concurrent misses for the same key share one build (SingleFlight per key), and a
+    failed build is remembered for the key for the life of the process.
+    lap is only used when the session has no circuit key (nothing is shared);
+    DB entries never depend on which lap a caller happened to pass.
+    None if the geometry cannot be built (no laps / position data).
+    """
+    key = circuit_key(session)
+    if key is None:
+        return build_circuit_geometry(session, "", lap=lap)
+
+    with _MISSES_LOCK:
+        if key in _MISSES:
+            return None
+    geometry = read_geometry(key)
+    if geometry is not None:
+        return geometry
+    return _BUILDS.do(key, lambda: _build_and_write(session, key))
+
+
+def build_circuit_geometry(session, key: str, lap=None) -> CircuitGeometry | None:
+    if lap is None:
+        lap = _fastest_valid_lap(session)
+        if lap is None:
+            return None
+
+    try:
+        tel = lap_telemetry(lap, ("Speed", "X", "Y", "SessionTime"))
+    except Exception as e:
+        log.info("No telemetry to build circuit geometry %s: %s", key, e)
+        return None
+    if tel is None or tel.empty or not {"X", "Y"}.issubset(tel.columns):
+        return None
+
+    tel = tel.dropna(subset=["Distance", "X", "Y"]).sort_values("Distance")
+    if len(tel) < 10:
+        return None
+    dist = tel["Distance"].to_numpy(dtype=float)
+    x = tel["X"].to_numpy(dtype=float)
+    y = tel["Y"].to_numpy(dtype=float)
+    length = float(dist[-1])
+
+    detected = detect_corner_ranges(tel) if "Speed" in tel.columns else []
+    info = _circuit_info(session)
+    rotation = 0.0
+    apexes = labels = None
+    if info is not None:
+        rotation = float(getattr(info, "rotation", 0.0) or 0.0)
+        apexes, labels = _info_corners(info, length)
+
+    if apexes is not None and len(apexes):
+        starts, ends = _ranges_around(apexes, detected, length)
+        source = "circuit_info"
+    else:
+        apexes = np.array([a for a, _, _ in detected], dtype=float)
+        starts = np.array([s for _, s, _ in detected], dtype=float)
+        ends = np.array([e for _, _, e in detected], dtype=float)
+        labels = [str(i + 1) for i in range(len(apexes))]
+        source = "detected"
+
+    corners = tuple(
+        CircuitCorner(
+            number=i + 1,
+            label=labels[i],
+            start_m=float(starts[i]),
+            end_m=float(ends[i]),
+            apex_m=float(apexes[i]),
+            x=float(np.interp(apexes[i], dist, x)),
+            y=float(np.interp(apexes[i], dist, y)),
+        )
+        for i in range(len(apexes))
+    )
+
+    grid = np.arange(0.0, length, OUTLINE_STEP_M)
+    outline = pd.DataFrame({"Distance": grid, "X": np.interp(grid, dist, x), "Y": np.interp(grid, dist, y)})
+
+    event = getattr(session, "event", None)
+    try:
+        location = str(event.get("Location") or event.get("EventName") or "")
+    except Exception:
+        location = ""
+
+    return CircuitGeometry(
+        key=key,
+        location=location,
+        season=session_season(session),
+        lap_length_m=length,
+        rotation_deg=rotation,
+        corners=corners,
+        sector_boundaries_m=_sector_boundaries(lap, tel),
+        outline=outline,
+        source=source,
+    )
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _build_and_write(session, key: str) -> CircuitGeometry | None:
+    # A build for key may have finished between our DB miss and becoming leader
+    geometry = read_geometry(key)
+    if geometry is not None:
+        return geometry
+
+    geometry = build_circuit_geometry(session, key)
+    if geometry is None:
+        with _MISSES_LOCK:
+            _MISSES.add(key)
+    else:
+        write_geometry(geometry)
+    return geometry
+
+
+def _fastest_valid_lap(session):
+    """
+    The session's fastest lap not flagged Deleted (session.laps row), None without timed laps.
+    """
+    matrix = get_sector_matrix(session)
+    if matrix is None:
+        return None
+    lap_s = np.where(matrix.deleted, np.nan, matrix.times[:, SECTOR_MATRIX_COLUMNS.index("Lap")])
+    if not np.isfinite(lap_s).any():
+        return None
+    return session.laps.iloc[int(np.nanargmin(lap_s))]
+
+
+def _circuit_info(session):
+    # FastF1 >= 3.1 only, and needs laps + position data; stored sessions have none
+    get_info = getattr(session, "get_circuit_info", None)
+    if get_info is None:
+        return None
+    try:
+        return get_info()
+    except Exception:
+        return None
+
+
+def _info_corners(info, length: float) -> tuple[np.ndarray | None, list[str] | None]:
+    """
+    FastF1 circuit info corners -> (apex distances, labels like "9" / "9a"), sorted by distance.
+    """
+    df = getattr(info, "corners", None)
+    if df is None or len(df) == 0 or "Distance" not in df.columns:
+        return None, None
+    df = df.assign(Distance=pd.to_numeric(df["Distance"], errors="coerce")).dropna(subset=["Distance"])
+    df = df[(df["Distance"] >= 0) & (df["Distance"] <= length)].sort_values("Distance", kind="stable")
+    if df.empty:
+        return None, None
+
+    numbers = df["Number"].astype(int).tolist() if "Number" in df.columns else list(range(1, len(df) + 1))
+    letters = df["Letter"].fillna("").astype(str).tolist() if "Letter" in df.columns else [""] * len(df)
+    labels = [f"{n}{letter}" for n, letter in zip(numbers, letters)]
+    return df["Distance"].to_numpy(dtype=float), labels
+
+
+def _ranges_around(apexes: np.ndarray, detected: list[tuple[float, float, float]], length: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Corner ranges for known apexes: the detected braking/traction range containing the apex,
+    else half-way to the neighbouring apexes, capped at CORNER_BEFORE_M / CORNER_AFTER_M.
+    """
+    mids = (apexes[1:] + apexes[:-1]) / 2.0
+    starts = np.maximum(np.r_[0.0, mids], apexes - CORNER_BEFORE_M)
+    ends = np.minimum(np.r_[mids, length], apexes + CORNER_AFTER_M)
+
+    if detected:
+        d = np.asarray(detected, dtype=float)                        # (n, 3): apex, start, end
+        inside = (d[None, :, 1] <= apexes[:, None]) & (apexes[:, None] <= d[None, :, 2])
+        has = inside.any(axis=1)
+        # Nearest detected apex among the ranges that contain the corner
+        gap = np.where(inside, np.abs(d[None, :, 0] - apexes[:, None]), np.inf)
+        pick = np.argmin(gap, axis=1)
+        starts = np.where(has, d[pick, 1], starts)
+        ends = np.where(has, d[pick, 2], ends)
+
+    return starts, ends
+
+
+def _sector_boundaries(lap, tel: pd.DataFrame) -> tuple[float, ...]:
+    """
+    Distance at the end of S1 and S2: the lap's Sector1/2SessionTime interpolated on
+    its telemetry SessionTime. Empty if the lap has no sector times.
+    """
+    if "SessionTime" not in tel.columns:
+        return ()
+    t = pd.to_timedelta(tel["SessionTime"], errors="coerce").dt.total_seconds().to_numpy(dtype=float)
+    d = tel["Distance"].to_numpy(dtype=float)
+    ok = np.isfinite(t) & np.isfinite(d)
+    if ok.sum() < 2:
+        return ()
+    order = np.argsort(t[ok], kind="stable")
+    t, d = t[ok][order], d[ok][order]
+
+    out = []
+    for col in ("Sector1SessionTime", "Sector2SessionTime"):
+        try:
+            value = lap.get(col)
+        except Exception:
+            value = None
+        if value is None or pd.isna(value):
+            return ()
+        ts = pd.to_timedelta(value).total_seconds()
+        if not t[0] <= ts <= t[-1]:
+            return ()
+        out.append(float(np.interp(ts, t, d)))
+    return tuple(out)
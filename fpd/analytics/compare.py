@@ -1,14 +1,37 @@
 # fpd/analytics/compare.py
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property, partial
+import threading
 from typing import Iterable, Literal
 
 import numpy as np
 import pandas as pd
 
+from fpd.analytics.lap_index import get_lap_index
+from fpd.core.config import CONFIG
+from fpd.core.logging import get_logger
+from fpd.core.parallel import parallel_map
+from fpd.data.session_loader import fetch_session
+from fpd.data.session_memo import session_memo
+from fpd.data.telemetry_store import lap_telemetry
+
+
+log = get_logger(__name__)
 
 CompareMode = Literal["current", "all_time"]
+DeltaMethod = Literal["time", "speed"]
+
+# Lap-relative elapsed time channel of FastF1 telemetry, always extracted for the delta
+ELAPSED_CHANNEL = "Time"
+
+# Channels Lap Compare aligns by default (other views reuse the same CompareSession)
+DEFAULT_CHANNELS: tuple[str, ...] = ("Speed", "Throttle", "Brake", "Gear", "RPM")
+
+# Compare channel -> FastF1 telemetry column it is read from (others share their name)
+TELEMETRY_COLUMNS: dict[str, str] = {"Gear": "nGear"}
 
 
 # -----------------------------
@@ -19,24 +42,127 @@ class LapRef:
     driver: str                  # e.g., "VER"
     lap_number: int | None = None  # if None => fastest lap
 
+    # All-time mode only: the session this lap comes from
+    season: int | None = None
+    event_name: str | None = None
+    session_name: str | None = None  # e.g., "Q", "R"
+    event_key: int | None = None     # schedule row (same session cache key as the pages)
+    test_number: int | None = None   # testing events only
+
 
 @dataclass(frozen=True)
 class CompareRequest:
     mode: CompareMode
     laps: list[LapRef]
-    channels: tuple[str, ...] = ("Speed", "Throttle", "Brake", "Gear", "RPM")
+    channels: tuple[str, ...] = DEFAULT_CHANNELS
     resample_m: float = 1.0      # distance grid step (meters)
 
 
+@dataclass(frozen=True, eq=False)
+class AlignedTraces:
+    """
+    Every compared lap resampled on one Distance grid, as a dense array:
+      values[lap, channel, point] (float32, NaN where a lap lacks a channel)
+    DataFrame views are only built when something (plots/tables) asks for them.
+    """
+    drivers: tuple[str, ...]      # one per lap (row of values)
+    channels: tuple[str, ...]
+    grid: np.ndarray              # Distance (m)
+    values: np.ndarray            # (laps, channels, grid)
+    elapsed: np.ndarray | None = None  # (laps, grid) float64 lap time (s) at each point, NaN if no Time channel
+
+    def channel(self, name: str) -> np.ndarray | None:
+        """
+        (laps, grid) view of one channel, or None if it was not requested.
+        """
+        if name not in self.channels:
+            return None
+        return self.values[:, self.channels.index(name), :]
+
+    @cached_property
+    def long(self) -> pd.DataFrame:
+        """
+        Distance, Driver, <channels...> — one row per lap and grid point.
+        """
+        n_laps, n_ch, n_pts = self.values.shape
+        df = pd.DataFrame(
+            self.values.transpose(0, 2, 1).reshape(n_laps * n_pts, n_ch).astype(float),
+            columns=list(self.channels),
+        )
+        df.insert(0, "Driver", np.repeat(self.drivers, n_pts))
+        df.insert(0, "Distance", np.tile(self.grid, n_laps))
+
+        # Convert Gear to integer-ish if present
+        if "Gear" in df.columns:
+            df["Gear"] = df["Gear"].round().astype("Int64")
+        return df
+
+    def wide(self, channel: str) -> pd.DataFrame:
+        """
+        Distance-indexed frame with one column per lap (driver) for one channel.
+        """
+        vals = self.channel(channel)
+        if vals is None:
+            return pd.DataFrame(index=pd.Index(self.grid, name="Distance"))
+        return pd.DataFrame(vals.T.astype(float), index=pd.Index(self.grid, name="Distance"), columns=list(self.drivers))
+
+
+@dataclass(frozen=True, eq=False)
+class DeltaTraces:
+    """
+    Delta time vs the baseline lap on the shared grid:
+      seconds[lap, point] (positive => slower than baseline at that distance)
+    - method per lap: "time" (from the Time channel) or "speed" (integrated, when Time is missing)
+    - drift per lap: speed-integrated lap time minus Time-channel lap time over the grid (s),
+      i.e. how far the old integration would have been off; NaN when there is no Time channel
+    """
+    drivers: tuple[str, ...]
+    grid: np.ndarray
+    seconds: np.ndarray           # (laps, grid) float64
+    methods: tuple[DeltaMethod, ...]
+    drift: np.ndarray             # (laps,) float64
+    baseline: int = 0             # row of the baseline lap
+
+    @cached_property
+    def long(self) -> pd.DataFrame:
+        """
+        Distance, Driver, DeltaSeconds — one row per lap and grid point.
+        """
+        return pd.DataFrame(
+            {
+                "Distance": np.tile(self.grid, len(self.drivers)),
+                "Driver": np.repeat(self.drivers, len(self.grid)),
+                "DeltaSeconds": self.seconds.ravel(),
+            }
+        )
+
+
 @dataclass(frozen=True)
 class CompareResult:
     """
-    Plot-ready dataframes.
-    All dfs are aligned on the same Distance grid.
+    Plot-ready results.
+    Everything is aligned on the same Distance grid.
     """
-    telemetry: pd.DataFrame       # long format: Distance, Driver, Speed, Throttle, Brake, Gear, RPM
-    delta: pd.DataFrame           # long format: Distance, Driver, DeltaSeconds (vs baseline)
+    traces: AlignedTraces         # dense (laps x channels x grid) telemetry
+    deltas: DeltaTraces | None    # delta time vs baseline (None without Time and Speed)
     meta: pd.DataFrame            # per driver info: Driver, LapNumber, LapTime, Compound, Team, IsBaseline
+    skipped: tuple[str, ...] = () # all-time mode: requested laps/sessions left out, with the reason
+
+    @property
+    def telemetry(self) -> pd.DataFrame:
+        """
+        Long format: Distance, Driver, Speed, Throttle, Brake, Gear, RPM (built on first use).
+        """
+        return self.traces.long
+
+    @property
+    def delta(self) -> pd.DataFrame:
+        """
+        Long format: Distance, Driver, DeltaSeconds (vs baseline).
+        """
+        if self.deltas is None:
+            return pd.DataFrame(columns=["Distance", "Driver", "DeltaSeconds"])
+        return self.deltas.long
 
 
 # -----------------------------
@@ -45,14 +171,13 @@ class CompareResult:
 def build_compare(session, req: CompareRequest) -> CompareResult:
     """
     Main entry point.
-    For now, supports 'current' mode (FastF1 session provided).
-    'all_time' mode is scaffolded (raise if session is None).
+    - 'current': laps from the given FastF1 session. Aligned laps are reused
+      across calls with the same channels/step (see CompareSession).
+    - 'all_time': every LapRef carries its own season/event/session; session is ignored
+      (see build_all_time_compare).
     """
     if req.mode == "all_time":
-        raise NotImplementedError(
-            "All-time mode needs your data source (multiple seasons). "
-            "Use current mode first."
-        )
+        return build_all_time_compare(req)
 
     if session is None:
         raise ValueError("Session is required for current mode compare.")
@@ -60,48 +185,285 @@ def build_compare(session, req: CompareRequest) -> CompareResult:
     if not req.laps:
         raise ValueError("CompareRequest.laps must contain at least 1 LapRef.")
 
-    # 1) Resolve laps to actual FastF1 Lap objects
-    lap_objs = _resolve_laps(session, req.laps)
+    return get_compare_session(session, req.channels, req.resample_m).compare(req.laps)
 
-    # 2) Extract telemetry per lap (distance-based), keep only channels we need
-    per_driver_tel = []
-    meta_rows = []
-    for lap in lap_objs:
-        driver = str(lap.get("Driver", "")).strip() or "UNK"
-        tel = _extract_telemetry_distance(lap, req.channels)
 
-        if tel is None or tel.empty:
-            continue
+def get_compare_session(session, channels: Iterable[str], resample_m: float = 1.0) -> CompareSession:
+    """
+    The CompareSession for (session, channels, resample_m), shared by reruns/users of the session.
+    """
+    channels = tuple(channels)
+    name = f"compare_session::{','.join(channels)}::{float(resample_m)}"
+    return session_memo(session, name, lambda: CompareSession(session, channels, resample_m))
 
-        # Standardize
-        tel["Driver"] = driver
-        per_driver_tel.append(tel)
 
-        meta_rows.append(_lap_meta_row(lap))
+# -----------------------------
+# Incremental compare
+# -----------------------------
+@dataclass(frozen=True, eq=False)
+class _AlignedLap:
+    """
+    One lap resampled on its own grid 0..(its max Distance), step resample_m.
+    """
+    driver: str
+    values: np.ndarray            # (channels, points) float32
+    elapsed: np.ndarray           # (points,) float64
+    meta: dict
 
-    if not per_driver_tel:
-        raise ValueError("No telemetry found for requested laps.")
 
-    meta = pd.DataFrame(meta_rows)
-    meta = _ensure_meta_types(meta)
+class CompareSession:
+    """
+    Lap Compare state for one session + channel set + grid step.
+
+    - Every lap is aligned once and kept (LRU, keyed by driver + lap number),
+      so adding a driver only extracts/interpolates the new lap(s), in one batch
+    - Grids all start at 0 with the same step, so the common grid (up to the
+      shortest lap) is a prefix of every lap's own grid: adding/removing laps
+      truncates/extends it instead of re-interpolating
+    - Only the delta vs the baseline is recomputed on each compare()
+    """
 
-    # 3) Choose baseline = first LapRef in request order
-    baseline_driver = req.laps[0].driver.strip().upper()
-    meta["IsBaseline"] = meta["Driver"].astype(str).str.upper().eq(baseline_driver)
+    def __init__(
+        self,
+        session,
+        channels: Iterable[str],
+        resample_m: float = 1.0,
+        max_laps: int = CONFIG.compare_cache_max_laps,
+    ):
+        self.session = session
+        self.channels = tuple(c for c in channels if c != ELAPSED_CHANNEL)
+        self.step_m = resample_m if resample_m > 0 else 1.0
+        self.max_laps = max(1, int(max_laps))
+        self._laps: OrderedDict[tuple[str, float], _AlignedLap] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compare(self, lap_refs: list[LapRef]) -> CompareResult:
+        if not lap_refs:
+            raise ValueError("CompareRequest.laps must contain at least 1 LapRef.")
+
+        # 1) Resolve laps to actual FastF1 Lap objects
+        lap_objs = _resolve_laps(self.session, lap_refs)
+
+        # 2) Reuse aligned laps; extract + align only the new ones
+        keys = [_lap_key(lap) for lap in lap_objs]
+        aligned = [self._get(k) for k in keys]
+
+        missing = [i for i, a in enumerate(aligned) if a is None]
+        if missing:
+            new = _align_laps([lap_objs[i] for i in missing], self.channels, self.step_m)
+            for i, a in zip(missing, new):
+                aligned[i] = a
+                if a is not None and keys[i] is not None:
+                    self._put(keys[i], a)
+
+        aligned = [a for a in aligned if a is not None]
+        if not aligned:
+            raise ValueError("No telemetry found for requested laps.")
+
+        meta = _ensure_meta_types(pd.DataFrame([a.meta for a in aligned]))
+
+        # 3) Choose baseline = first LapRef in request order
+        baseline_driver = lap_refs[0].driver.strip().upper()
+        meta["IsBaseline"] = meta["Driver"].astype(str).str.upper().eq(baseline_driver)
+
+        # 4) Common grid = prefix shared by every lap
+        traces = _stack_traces(aligned, self.channels, self.step_m)
+
+        # 5) Compute delta time trace vs baseline driver
+        deltas = _compute_delta_time(traces, baseline_driver=baseline_driver)
+
+        return CompareResult(
+            traces=traces,
+            deltas=deltas,
+            meta=meta,
+        )
 
-    # 4) Align all telemetry to a shared distance grid
-    distance_grid = _make_distance_grid(per_driver_tel, step_m=req.resample_m)
-    aligned = _align_all_to_grid(per_driver_tel, distance_grid, req.channels)
+    def clear(self) -> None:
+        with self._lock:
+            self._laps.clear()
 
-    # 5) Compute delta time trace vs baseline driver
-    delta = _compute_delta_time(aligned, baseline_driver=baseline_driver)
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._laps)
+
+    def _get(self, key: tuple[str, float] | None) -> _AlignedLap | None:
+        if key is None:
+            return None
+        with self._lock:
+            a = self._laps.get(key)
+            if a is not None:
+                self._laps.move_to_end(key)
+            return a
+
+    def _put(self, key: tuple[str, float], a: _AlignedLap) -> None:
+        with self._lock:
+            self._laps[key] = a
+            self._laps.move_to_end(key)
+            while len(self._laps) > self.max_laps:
+                self._laps.popitem(last=False)
+
+
+def _lap_key(lap) -> tuple[str, float] | None:
+    """
+    (driver, lap number); None for laps without a number (not cached).
+    """
+    driver = str(lap.get("Driver", "")).strip().upper()
+    try:
+        lap_number = float(lap.get("LapNumber"))
+    except Exception:
+        return None
+    if pd.isna(lap_number):
+        return None
+    return driver, lap_number
+
+
+# -----------------------------
+# All-time compare
+# -----------------------------
+def build_all_time_compare(req: CompareRequest) -> CompareResult:
+    """
+    Lap Compare across seasons/events.
+
+    - Distinct sessions are loaded on up to CONFIG.compare_load_workers threads
+      (fetch_session: SESSION_CACHE, then the fpd store, then FastF1, whose loads the
+      loader runs one at a time) with the "laps+telemetry" profile; each worker also
+      resolves and extracts its own laps. event_key / test_number on the LapRef are
+      passed through, so sessions share cache entries with the pages and testing
+      sessions can be resolved
+    - Distance is normalized to lap fraction and mapped onto the baseline lap's length,
+      so laps from slightly different track layouts line up
+    - Traces/meta are labelled "<DRIVER> <season>"; baseline = first LapRef
+    - Sessions that fail to load and laps that cannot be found are listed in
+      CompareResult.skipped (raises if nothing is left)
+    """
+    refs = [r for r in req.laps if r.driver.strip()]
+    if not refs:
+        raise ValueError("CompareRequest.laps must contain at least 1 LapRef.")
+    if any(r.season is None or not r.event_name or not r.session_name for r in refs):
+        raise ValueError("All-time mode needs season, event_name and session_name on every LapRef.")
+
+    channels = tuple(c for c in req.channels if c != ELAPSED_CHANNEL)
+    laps, skipped = _load_all_time_laps(refs, channels)
+    if not laps:
+        raise ValueError("No telemetry found for requested laps. " + "; ".join(skipped))
+
+    # 1) Normalize Distance: lap fraction x baseline lap length
+    ref_length = laps[0][2]
+    step_m = req.resample_m if req.resample_m > 0 else 1.0
+    grid = _distance_grid(ref_length, step_m)
+
+    xs = [tel["Distance"].to_numpy(dtype=float) * (ref_length / length) for _, tel, length, _ in laps]
+    ys = [_channel_matrix(tel, (*channels, ELAPSED_CHANNEL)) for _, tel, _, _ in laps]
+
+    # 2) Align all laps on the shared grid in one batch
+    values = _interp_batch(xs, ys, grid, dtype=np.float64)
+    traces = AlignedTraces(
+        drivers=tuple(label for label, _, _, _ in laps),
+        channels=channels,
+        grid=grid,
+        values=values[:, :-1, :].astype(np.float32),
+        elapsed=values[:, -1, :],
+    )
+
+    meta = _ensure_meta_types(pd.DataFrame([row for _, _, _, row in laps]))
+    meta["IsBaseline"] = np.arange(len(meta)) == 0
+
+    # 3) Delta vs the first lap
+    deltas = _compute_delta_time(traces, baseline_driver=traces.drivers[0])
 
     return CompareResult(
-        telemetry=aligned,
-        delta=delta,
+        traces=traces,
+        deltas=deltas,
         meta=meta,
+        skipped=tuple(skipped),
+    )
+
+
+def _load_all_time_laps(
+    refs: list[LapRef], channels: tuple[str, ...]
+) -> tuple[list[tuple[str, pd.DataFrame, float, dict]], list[str]]:
+    """
+    ([(label, telemetry, lap length (m), meta row)] in request order, [skipped: reason]).
+    Laps/sessions that fail are left out and reported in the second list.
+    """
+    by_session: dict[tuple, list[int]] = {}
+    for i, ref in enumerate(refs):
+        sid = (int(ref.season), ref.event_name, ref.session_name, ref.event_key, ref.test_number)
+        by_session.setdefault(sid, []).append(i)
+
+    sessions = list(by_session.items())
+    loaded = parallel_map(
+        partial(_session_laps_or_error, refs=refs, channels=channels),
+        sessions,
+        pool="thread",
+        workers=CONFIG.compare_load_workers,
+    )
+
+    found: dict[int, tuple[str, pd.DataFrame, float, dict]] = {}
+    skipped: list[str] = []
+    for (sid, idx), (laps, error) in zip(sessions, loaded):
+        if error is not None:
+            log.warning("All-time compare: skipping %s: %s", sid, error)
+            skipped.append(f"{_session_label(sid)}: {error}")
+            continue
+        for i, lap in zip(idx, laps):
+            if lap is None:
+                skipped.append(f"{refs[i].driver.strip().upper()} {_session_label(sid)}: lap not found or no telemetry")
+            else:
+                found[i] = lap
+
+    return [found[i] for i in sorted(found)], skipped
+
+
+def _session_laps_or_error(item: tuple[tuple, list[int]], refs: list[LapRef], channels: tuple[str, ...]) -> tuple[list, str | None]:
+    sid, idx = item
+    try:
+        return _session_laps(sid, [refs[i] for i in idx], channels), None
+    except Exception as e:
+        return [], str(e) or type(e).__name__
+
+
+def _session_label(session_id: tuple) -> str:
+    season, event_name, session_name, _, test_number = session_id
+    test = f" (test {test_number})" if test_number is not None else ""
+    return f"{season} {event_name}{test} {session_name}"
+
+
+def _session_laps(session_id: tuple, refs: list[LapRef], channels: tuple[str, ...]) -> list:
+    """
+    Worker: load one session, then resolve + extract each of its LapRefs (None if unavailable).
+    FastF1 loads are serialized by the session loader; store reads and extraction run concurrently.
+    """
+    season, event_name, session_name, event_key, test_number = session_id
+    session = fetch_session(
+        season,
+        event_name,
+        session_name,
+        test_number=test_number,
+        event_key=event_key,
+        profile="laps+telemetry",
     )
 
+    out = []
+    for ref in refs:
+        try:
+            lap = _resolve_laps(session, [ref])[0]
+        except ValueError:
+            out.append(None)
+            continue
+
+        tel = _extract_telemetry_distance(lap, channels)
+        length = float(tel["Distance"].max()) if not tel.empty else np.nan
+        if not np.isfinite(length) or length <= 0:
+            out.append(None)
+            continue
+
+        label = f"{str(lap.get('Driver', ref.driver)).strip().upper()} {season}"
+        row = _lap_meta_row(lap)
+        row.update({"Driver": label, "Season": season, "Event": event_name, "Session": session_name, "LapLength(m)": round(length, 1)})
+        out.append((label, tel, length, row))
+    return out
+
 
 # -----------------------------
 # Lap resolution
@@ -110,10 +472,11 @@ def _resolve_laps(session, lap_refs: list[LapRef]):
     """
     Turns LapRef selections into FastF1 lap objects.
     - If lap_number is None => fastest lap for that driver
-    - Else => specific lap number for that driver
+    - Else => specific lap number for that driver (nearest if missing)
+    Lookups go through the session LapIndex.
     """
-    laps = session.laps
-    if laps is None or len(laps) == 0:
+    index = get_lap_index(session)
+    if index is None:
         raise ValueError("Session has no laps.")
 
     out = []
@@ -122,26 +485,10 @@ def _resolve_laps(session, lap_refs: list[LapRef]):
         if not drv:
             continue
 
-        drv_laps = laps.pick_driver(drv)
-        if drv_laps is None or len(drv_laps) == 0:
+        lap = index.pick(drv, ref.lap_number)
+        if lap is None:
             continue
 
-        if ref.lap_number is None:
-            lap = drv_laps.pick_fastest()
-            if hasattr(lap, "iloc"):
-                lap = lap.iloc[0]
-        else:
-            # LapNumber in FastF1 is numeric (float sometimes); best-effort match
-            ln = ref.lap_number
-            match = drv_laps[pd.to_numeric(drv_laps["LapNumber"], errors="coerce") == ln]
-            if match is None or len(match) == 0:
-                # fallback: nearest
-                nums = pd.to_numeric(drv_laps["LapNumber"], errors="coerce")
-                idx = (nums - ln).abs().idxmin()
-                lap = drv_laps.loc[idx]
-            else:
-                lap = match.iloc[0]
-
         out.append(lap)
 
     if not out:
@@ -157,32 +504,31 @@ def _extract_telemetry_distance(lap, channels: Iterable[str]) -> pd.DataFrame:
     """
     Returns telemetry dataframe with:
       - Distance (meters)
-      - channels requested (if present)
-    Uses add_distance() and interpolates missing numeric telemetry lightly.
+      - channels requested (if present; read from their FastF1 column, see TELEMETRY_COLUMNS)
+      - Time as lap-relative seconds (for the delta), if present
+    Telemetry comes from the session TelemetryStore (Distance already added)
+    and missing numeric telemetry is interpolated lightly.
     """
+    channels = tuple(dict.fromkeys((*channels, ELAPSED_CHANNEL)))
+    sources = {c: TELEMETRY_COLUMNS.get(c, c) for c in channels}
     try:
-        tel = lap.get_telemetry()
+        tel = lap_telemetry(lap, tuple(dict.fromkeys(sources.values())))
     except Exception:
         return pd.DataFrame()
 
     if tel is None or len(tel) == 0:
         return pd.DataFrame()
 
-    # Ensure Distance exists
-    if "Distance" not in tel.columns:
-        try:
-            tel = tel.add_distance()
-        except Exception:
-            return pd.DataFrame()
-
-    keep = ["Distance"]
-    for c in channels:
-        if c in tel.columns:
-            keep.append(c)
-
-    df = tel[keep].copy()
+    # Read FastF1 column names (e.g. nGear), hand back compare channel names (e.g. Gear)
+    found = {c: src for c, src in sources.items() if src in tel.columns}
+    df = pd.DataFrame({"Distance": tel["Distance"].to_numpy()}, index=tel.index)
+    for c, src in found.items():
+        df[c] = tel[src].to_numpy()
     df = df.dropna(subset=["Distance"]).sort_values("Distance")
 
+    if ELAPSED_CHANNEL in df.columns:
+        df[ELAPSED_CHANNEL] = pd.to_timedelta(df[ELAPSED_CHANNEL], errors="coerce").dt.total_seconds()
+
     # Make numeric where possible (Speed etc). Gear can be int-ish.
     for c in df.columns:
         if c == "Distance":
@@ -201,158 +547,227 @@ def _extract_telemetry_distance(lap, channels: Iterable[str]) -> pd.DataFrame:
 # -----------------------------
 # Alignment / Resampling
 # -----------------------------
-def _make_distance_grid(per_driver_tel: list[pd.DataFrame], step_m: float = 1.0) -> np.ndarray:
+def _distance_grid(max_distance: float, step_m: float = 1.0) -> np.ndarray:
     """
-    Build a common distance grid from 0..min(max_distance across drivers).
-    We use the minimum max distance so all traces overlap.
+    Distance grid 0..max_distance. Grids with the same step are prefixes of each other.
     """
-    if step_m <= 0:
-        step_m = 1.0
+    return np.arange(0.0, max(0.0, max_distance) + step_m, step_m, dtype=float)
 
-    max_dists = []
-    for df in per_driver_tel:
-        if "Distance" in df.columns and len(df) > 0:
-            max_dists.append(float(df["Distance"].max()))
 
-    if not max_dists:
-        raise ValueError("No valid distance found in telemetry.")
+def _align_laps(laps: list, channels: tuple[str, ...], step_m: float) -> list[_AlignedLap | None]:
+    """
+    Extracts telemetry for laps concurrently (see parallel_map), then aligns them in one
+    batched interpolation, each on its own grid 0..(its max Distance).
+    None for laps without telemetry.
+    """
+    out: list[_AlignedLap | None] = [None] * len(laps)
 
-    max_common = max(0.0, min(max_dists))
-    return np.arange(0.0, max_common + step_m, step_m, dtype=float)
+    tels = parallel_map(partial(_extract_telemetry_distance, channels=channels), laps)
 
+    rows, frames, max_dists = [], [], []
+    for i, tel in enumerate(tels):
+        if tel is None or tel.empty:
+            continue
+        max_d = float(tel["Distance"].max())
+        if not np.isfinite(max_d):
+            continue
+        rows.append(i)
+        frames.append(tel)
+        max_dists.append(max_d)
+
+    if not rows:
+        return out
+
+    grid = _distance_grid(max(max_dists), step_m)
+    xs = [df["Distance"].to_numpy(dtype=float) for df in frames]
+    ys = [_channel_matrix(df, (*channels, ELAPSED_CHANNEL)) for df in frames]
+
+    # float64 here so elapsed time keeps ms precision; channels are stored as float32
+    values = _interp_batch(xs, ys, grid, dtype=np.float64)
+
+    for k, (i, max_d) in enumerate(zip(rows, max_dists)):
+        n = len(_distance_grid(max_d, step_m))
+        lap = laps[i]
+        out[i] = _AlignedLap(
+            driver=str(lap.get("Driver", "")).strip() or "UNK",
+            values=values[k, :-1, :n].astype(np.float32),
+            elapsed=values[k, -1, :n],
+            meta=_lap_meta_row(lap),
+        )
+    return out
 
-def _align_all_to_grid(
-    per_driver_tel: list[pd.DataFrame],
-    grid: np.ndarray,
-    channels: Iterable[str],
-) -> pd.DataFrame:
+
+def _stack_traces(aligned: list[_AlignedLap], channels: tuple[str, ...], step_m: float) -> AlignedTraces:
     """
-    Returns long dataframe aligned on grid:
-      Distance, Driver, <channels...>
-    Uses linear interpolation for numeric channels.
+    AlignedTraces on the common grid: every lap truncated to the shortest lap's grid.
     """
-    out_frames = []
-    channels = tuple(channels)
+    n = min(len(a.elapsed) for a in aligned)
+    return AlignedTraces(
+        drivers=tuple(a.driver for a in aligned),
+        channels=channels,
+        grid=np.arange(n, dtype=float) * step_m,
+        values=np.stack([a.values[:, :n] for a in aligned]),
+        elapsed=np.stack([a.elapsed[:n] for a in aligned]),
+    )
 
-    for df in per_driver_tel:
-        if df is None or df.empty:
-            continue
 
-        driver = str(df.get("Driver", pd.Series(["UNK"])).iloc[0])
+def _channel_matrix(df: pd.DataFrame, channels: tuple[str, ...]) -> np.ndarray:
+    """
+    (samples, channels) float64; NaN columns for channels the lap does not have.
+    """
+    out = np.full((len(df), len(channels)), np.nan, dtype=float)
+    for j, c in enumerate(channels):
+        if c in df.columns:
+            out[:, j] = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float)
+    return out
 
-        aligned = pd.DataFrame({"Distance": grid})
-        x = df["Distance"].to_numpy(dtype=float)
 
-        for c in channels:
-            if c not in df.columns:
-                aligned[c] = np.nan
-                continue
+def _interp_batch(
+    xs: list[np.ndarray],
+    ys: list[np.ndarray],
+    grid: np.ndarray,
+    dtype: type = np.float32,
+) -> np.ndarray:
+    """
+    Linear interpolation of every lap/channel onto grid -> (laps, channels, grid) array of dtype.
+
+    Laps are stacked on one axis with a per-lap offset added to Distance, so one
+    np.searchsorted finds the bracketing samples for every lap at once. Same rules
+    as np.interp per channel: NaNs are skipped, ends are held at the edge value,
+    channels with < 2 finite samples are NaN.
+    """
+    grid = np.asarray(grid, dtype=float)
+    n_ch = ys[0].shape[1] if ys else 0
+    out = np.full((len(xs), n_ch, len(grid)), np.nan, dtype=dtype)
+
+    rows, seg_x, seg_y = [], [], []
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        x, y = _prepare_lap(x, y)
+        if x is None:
+            continue
+        rows.append(i)
+        seg_x.append(x)
+        seg_y.append(y)
 
-            y = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float)
+    if not rows or len(grid) == 0:
+        return out
 
-            # Interpolate y over grid
-            aligned[c] = _interp_1d(x, y, grid)
+    lengths = np.array([len(x) for x in seg_x])
+    start = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    end = start + lengths
 
-        aligned["Driver"] = driver
-        out_frames.append(aligned)
+    # Offset each lap past the previous one so the concatenated x stays sorted
+    lo_x = min(float(x[0]) for x in seg_x)
+    hi_x = max(float(x[-1]) for x in seg_x)
+    span = max(hi_x, float(grid.max())) - min(lo_x, float(grid.min())) + 1.0
+    shift = np.arange(len(rows), dtype=float) * span
 
-    if not out_frames:
-        raise ValueError("No telemetry could be aligned.")
+    x_cat = np.concatenate([x + s for x, s in zip(seg_x, shift)])
+    y_cat = np.concatenate(seg_y)
+    q = grid[None, :] + shift[:, None]                             # (laps, grid)
 
-    wide = pd.concat(out_frames, ignore_index=True)
+    lo = np.searchsorted(x_cat, q, side="right") - 1
+    lo = np.clip(lo, start[:, None], end[:, None] - 2)
+    hi = lo + 1
 
-    # Convert Gear to integer-ish if present
-    if "Gear" in wide.columns:
-        wide["Gear"] = pd.to_numeric(wide["Gear"], errors="coerce").round().astype("Int64")
+    x0 = x_cat[lo]
+    t = np.clip((q - x0) / (x_cat[hi] - x0), 0.0, 1.0)[..., None]  # edge hold outside the lap
+    vals = y_cat[lo] * (1.0 - t) + y_cat[hi] * t                   # (laps, grid, channels)
 
-    # Long format not strictly required, but easier for plotly overlays
-    return wide[["Distance", "Driver", *[c for c in channels if c in wide.columns]]]
+    out[rows] = vals.transpose(0, 2, 1)
+    return out
 
 
-def _interp_1d(x: np.ndarray, y: np.ndarray, x_new: np.ndarray) -> np.ndarray:
+def _prepare_lap(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray | None, np.ndarray | None]:
     """
-    Safe linear interpolation that handles NaNs.
+    Sorted, de-duplicated Distance with NaN gaps in each channel filled linearly,
+    so a single (x, y) pair per lap serves every channel.
     """
+    mask = np.isfinite(x)
+    x, y = x[mask], y[mask]
     if len(x) < 2:
-        return np.full_like(x_new, np.nan, dtype=float)
-
-    mask = np.isfinite(x) & np.isfinite(y)
-    x2 = x[mask]
-    y2 = y[mask]
-
-    if len(x2) < 2:
-        return np.full_like(x_new, np.nan, dtype=float)
+        return None, None
 
-    # Ensure strictly increasing x
-    order = np.argsort(x2)
-    x2 = x2[order]
-    y2 = y2[order]
+    order = np.argsort(x, kind="stable")
+    x, first = np.unique(x[order], return_index=True)
+    y = y[order][first]
+    if len(x) < 2:
+        return None, None
 
-    # np.interp requires monotonic x; it will extrapolate ends with edge values
-    return np.interp(x_new, x2, y2)
+    y = y.copy()
+    for j in range(y.shape[1]):
+        finite = np.isfinite(y[:, j])
+        if finite.all():
+            continue
+        if finite.sum() < 2:
+            y[:, j] = np.nan
+        else:
+            y[:, j] = np.interp(x, x[finite], y[finite, j])
+    return x, y
 
 
 # -----------------------------
 # Delta time computation
 # -----------------------------
-def _compute_delta_time(aligned: pd.DataFrame, baseline_driver: str) -> pd.DataFrame:
+def _compute_delta_time(traces: AlignedTraces, baseline_driver: str) -> DeltaTraces | None:
     """
-    Computes cumulative delta time vs baseline using speed traces:
-      dt ≈ dDistance / Speed
+    Delta time vs baseline for all laps at once.
 
-    - Speed assumed km/h; convert to m/s
+    - Elapsed lap time is read off the Time channel (interpolated onto the grid),
+      rebased to 0 at the grid start, then the baseline row is subtracted
+    - Laps without Time fall back to integrating speed:
+        dt ≈ dDistance / Speed  (km/h -> m/s)
     - DeltaSeconds positive => slower than baseline at that distance
     """
-    if "Speed" not in aligned.columns:
-        # Without speed, we can't compute delta. Return empty.
-        return pd.DataFrame(columns=["Distance", "Driver", "DeltaSeconds"])
+    if len(traces.grid) < 2 or not traces.drivers:
+        return None
 
     base = baseline_driver.strip().upper()
+    drivers_upper = [d.upper() for d in traces.drivers]
+    base_row = drivers_upper.index(base) if base in drivers_upper else 0  # fallback: first lap
 
-    # Pivot to get per-driver Speed arrays on same Distance grid
-    pivot = aligned.pivot_table(index="Distance", columns="Driver", values="Speed", aggfunc="mean")
-    if pivot.empty:
-        return pd.DataFrame(columns=["Distance", "Driver", "DeltaSeconds"])
+    n_laps = len(traces.drivers)
+    nan = np.full((n_laps, len(traces.grid)), np.nan)
 
-    # Find actual baseline column (case-insensitive)
-    cols_upper = {str(c).upper(): c for c in pivot.columns}
-    if base not in cols_upper:
-        # fallback: first driver as baseline
-        base_col = pivot.columns[0]
+    from_time = nan if traces.elapsed is None else traces.elapsed - traces.elapsed[:, :1]
+    from_speed = _integrate_speed(traces)
+
+    has_time = np.isfinite(from_time).all(axis=1)
+    if not has_time.any() and from_speed is None:
+        # Without Time or Speed, we can't compute delta.
+        return None
+
+    elapsed = np.where(has_time[:, None], from_time, from_speed if from_speed is not None else nan)
+
+    if from_speed is not None:
+        drift = np.where(has_time, from_speed[:, -1] - from_time[:, -1], np.nan)
     else:
-        base_col = cols_upper[base]
+        drift = np.full(n_laps, np.nan)
+
+    return DeltaTraces(
+        drivers=traces.drivers,
+        grid=traces.grid,
+        seconds=elapsed - elapsed[base_row],
+        methods=tuple("time" if t else "speed" for t in has_time),
+        drift=drift,
+        baseline=base_row,
+    )
 
-    dist = pivot.index.to_numpy(dtype=float)
 
-    # Distance step (assume uniform)
-    if len(dist) < 2:
-        return pd.DataFrame(columns=["Distance", "Driver", "DeltaSeconds"])
+def _integrate_speed(traces: AlignedTraces) -> np.ndarray | None:
+    """
+    (laps, grid) elapsed time from cumulative dDistance / Speed, or None without Speed.
+    """
+    speed = traces.channel("Speed")
+    if speed is None:
+        return None
 
+    dist = traces.grid
     d_dist = np.diff(dist, prepend=dist[0])
-    d_dist[0] = d_dist[1] if len(d_dist) > 1 else 0.0
-
-    def to_time_seconds(speed_kmh: np.ndarray) -> np.ndarray:
-        speed_ms = np.maximum(0.1, speed_kmh / 3.6)  # avoid div0
-        dt = d_dist / speed_ms
-        return np.cumsum(dt)
-
-    base_time = to_time_seconds(pivot[base_col].to_numpy(dtype=float))
-
-    rows = []
-    for drv in pivot.columns:
-        t = to_time_seconds(pivot[drv].to_numpy(dtype=float))
-        delta = t - base_time
-        rows.append(
-            pd.DataFrame(
-                {
-                    "Distance": dist,
-                    "Driver": drv,
-                    "DeltaSeconds": delta,
-                }
-            )
-        )
+    d_dist[0] = 0.0
 
-    return pd.concat(rows, ignore_index=True)
+    speed_ms = np.maximum(0.1, speed.astype(float) / 3.6)  # avoid div0
+    return np.cumsum(d_dist / speed_ms, axis=1)
 
 
 # -----------------------------
@@ -0,0 +1,138 @@
+# fpd/analytics/corner_detect.py
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+# Corner detection (see detect_corner_ranges)
+DETECT_STEP_M = 5.0                # resampling step of the reference lap
+MIN_PROMINENCE_KMH = 12.0          # speed dip needed for a braking corner
+MIN_APEX_GAP_M = 100.0             # closer speed minima are one corner (chicanes keep the lower)
+MAX_HALF_LENGTH_M = 400.0          # cap on braking / traction zone around an apex
+MIN_HEADING_RATE = 0.15            # deg/m (radius ~380 m) for flat-out corners from X/Y
+MIN_HEADING_CHANGE = 30.0          # deg turned for a flat-out corner to count
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def detect_corner_ranges(tel: pd.DataFrame) -> list[tuple[float, float, float]]:
+    """
+    Real turns from one lap of telemetry (Distance + Speed, X/Y optional), as
+    (apex_m, start_m, end_m) in lap order:
+      - braking corners: speed minima with at least MIN_PROMINENCE_KMH of dip,
+        from the braking point (previous speed peak) to where speed has recovered
+        90% of the way to the next peak
+      - flat-out corners: stretches where the X/Y heading turns faster than
+        MIN_HEADING_RATE for at least MIN_HEADING_CHANGE degrees, not already covered
+    Returns [] if the lap is unusable.
+    """
+    dist = pd.to_numeric(tel["Distance"], errors="coerce").to_numpy(dtype=float)
+    speed = pd.to_numeric(tel["Speed"], errors="coerce").to_numpy(dtype=float)
+    ok = np.isfinite(dist) & np.isfinite(speed)
+    if ok.sum() < 10:
+        return []
+
+    order = np.argsort(dist[ok], kind="stable")
+    d_raw, v_raw = dist[ok][order], speed[ok][order]
+    grid = np.arange(0.0, d_raw[-1], DETECT_STEP_M)
+    if len(grid) < 10:
+        return []
+
+    v = _smooth(np.interp(grid, d_raw, v_raw), 5)
+    found = [(grid[a], grid[lo], grid[hi]) for a, lo, hi in _speed_corners(v)]
+
+    if {"X", "Y"}.issubset(tel.columns):
+        x = pd.to_numeric(tel["X"], errors="coerce").to_numpy(dtype=float)
+        y = pd.to_numeric(tel["Y"], errors="coerce").to_numpy(dtype=float)
+        xy_ok = ok & np.isfinite(x) & np.isfinite(y)
+        if xy_ok.sum() >= 10:
+            o = np.argsort(dist[xy_ok], kind="stable")
+            gx = np.interp(grid, dist[xy_ok][o], x[xy_ok][o])
+            gy = np.interp(grid, dist[xy_ok][o], y[xy_ok][o])
+            for a, lo, hi in _heading_corners(gx, gy):
+                if not any(s <= grid[a] <= e for _, s, e in found):
+                    found.append((grid[a], grid[lo], grid[hi]))
+
+    found.sort()
+    return [(float(a), float(s), float(e)) for a, s, e in found]
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _smooth(values: np.ndarray, window: int) -> np.ndarray:
+    if window <= 1 or len(values) < window:
+        return values
+    pad = window // 2
+    padded = np.pad(values, pad, mode="edge")
+    return np.convolve(padded, np.ones(window) / window, mode="valid")[: len(values)]
+
+
+def _speed_corners(v: np.ndarray) -> list[tuple[int, int, int]]:
+    """
+    (apex, start, end) grid indices of braking corners on a smoothed speed trace.
+    """
+    n = len(v)
+    is_min = np.zeros(n, dtype=bool)
+    is_min[1:-1] = (v[1:-1] < v[:-2]) & (v[1:-1] <= v[2:])
+    cands = np.flatnonzero(is_min)
+
+    # Prominence: climb from the minimum until a lower point (or lap end) on each side
+    keep = []
+    for i in cands:
+        left_lower = np.flatnonzero(v[:i] < v[i])
+        right_lower = np.flatnonzero(v[i + 1 :] < v[i])
+        left_peak = v[(left_lower[-1] + 1 if len(left_lower) else 0) : i + 1].max()
+        right_peak = v[i : (i + 1 + right_lower[0] if len(right_lower) else n)].max()
+        if min(left_peak, right_peak) - v[i] >= MIN_PROMINENCE_KMH:
+            keep.append(i)
+
+    # Minima too close together are one corner: keep the slowest
+    gap = max(1, int(MIN_APEX_GAP_M / DETECT_STEP_M))
+    apexes: list[int] = []
+    for i in keep:
+        if apexes and i - apexes[-1] < gap:
+            if v[i] < v[apexes[-1]]:
+                apexes[-1] = i
+            continue
+        apexes.append(i)
+
+    half = int(MAX_HALF_LENGTH_M / DETECT_STEP_M)
+    out = []
+    for k, a in enumerate(apexes):
+        prev_a = apexes[k - 1] if k > 0 else 0
+        next_a = apexes[k + 1] if k + 1 < len(apexes) else n - 1
+
+        # Braking point: last sample still within 3 km/h of the top speed before the apex
+        lo_bound = max(prev_a, a - half)
+        before = v[lo_bound : a + 1]
+        start = lo_bound + int(np.flatnonzero(before >= before.max() - 3.0)[-1])
+
+        hi_bound = min(next_a, a + half)
+        peak = v[a : hi_bound + 1].max()
+        recovered = np.flatnonzero(v[a : hi_bound + 1] >= v[a] + 0.9 * (peak - v[a]))
+        end = a + int(recovered[0]) if len(recovered) else hi_bound
+        out.append((a, start, max(end, a + 1)))
+    return out
+
+
+def _heading_corners(x: np.ndarray, y: np.ndarray) -> list[tuple[int, int, int]]:
+    """
+    (apex, start, end) grid indices of sustained turning on the X/Y trace.
+    """
+    heading = np.degrees(np.unwrap(np.arctan2(np.gradient(y), np.gradient(x))))
+    rate = _smooth(np.abs(np.gradient(heading)) / DETECT_STEP_M, 5)
+    turning = rate > MIN_HEADING_RATE
+
+    edges = np.diff(np.concatenate(([0], turning.astype(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    out = []
+    for s, e in zip(starts, ends):
+        if abs(heading[e - 1] - heading[s]) < MIN_HEADING_CHANGE:
+            continue
+        apex = s + int(np.argmax(rate[s:e]))
+        out.append((apex, s, e - 1))
+    return out
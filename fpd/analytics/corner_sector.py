@@ -7,6 +7,16 @@ from typing import Dict, Iterable, Literal, Optional
 import numpy as np
 import pandas as pd
 
+from fpd.analytics.circuit_geometry import get_circuit_geometry
+from fpd.analytics.corner_detect import detect_corner_ranges
+from fpd.analytics.lap_index import LapIndex, get_lap_index
+from fpd.analytics.sector_matrix import SECTOR_MATRIX_COLUMNS, get_sector_matrix
+from fpd.analytics.session_samples import SessionSamples, get_session_samples
+from fpd.core.config import CONFIG
+from fpd.data.circuit_db import CircuitGeometry
+from fpd.core.parallel import parallel_map
+from fpd.data.telemetry_store import lap_telemetry
+
 
 CornerGroup = Literal["Low-speed", "Medium-speed", "High-speed"]
 
@@ -19,12 +29,13 @@ class CornerDef:
     """
     Corner segment definition in distance space.
 
-    You can later replace these with real corner markers from a track database.
-    For now, we can generate approximate segments (equal slices) as a fallback.
+    Read from the circuit DB (see circuit_corners); equal slices
+    (build_fallback_corners) are only used when the circuit has no corners.
     """
     corner_number: int
     start_m: float
     end_m: float
+    apex_m: float | None = None
 
 
 @dataclass(frozen=True)
@@ -50,6 +61,18 @@ class SectorSummaryResult:
     winners: pd.DataFrame      # Sector, Winner, MarginSeconds
 
 
+@dataclass(frozen=True)
+class FieldCornerResult:
+    """
+    Corner metrics for every representative lap of every driver.
+      - per_lap: Driver, LapNumber, Corner, MinSpeed, CornerTime(s)
+      - distribution: Driver, Corner, Type, Laps, MinSpeed p10/p50/p90, CornerTime(s) p10/p50/p90
+        (Type from the median min speed)
+    """
+    per_lap: pd.DataFrame
+    distribution: pd.DataFrame
+
+
 @dataclass(frozen=True)
 class CornerBreakdownResult:
     """
@@ -70,7 +93,7 @@ def compute_sector_summary(
 ) -> SectorSummaryResult:
     """
     Compute sector times for selected drivers and deltas vs baseline.
-    Uses lap sector times if available (fast, reliable).
+    Uses lap sector times from the session sector matrix (see sector_matrix).
 
     baseline_driver:
       - if None: first driver in drivers list
@@ -93,39 +116,29 @@ def compute_sector_summary(
         baseline_driver = drivers_u[0]
     baseline_driver = baseline_driver.strip().upper()
 
-    rows = []
-    for d in drivers_u:
-        lap = _pick_driver_lap(laps, d, use_fastest_laps=use_fastest_laps)
-        if lap is None:
-            continue
+    # One row of the session sector matrix per driver; deltas are a slice minus the baseline row
+    matrix = get_sector_matrix(session)
+    index = get_lap_index(session)
+    picked = [(d, _pick_driver_pos(index, d, use_fastest_laps=use_fastest_laps)) for d in drivers_u]
+    picked = [(d, pos) for d, pos in picked if pos is not None]
+    if not picked:
+        raise ValueError("No sector data available for selected drivers.")
 
-        s1 = lap.get("Sector1Time", None)
-        s2 = lap.get("Sector2Time", None)
-        s3 = lap.get("Sector3Time", None)
-        lt = lap.get("LapTime", None)
-
-        rows.append(
-            {
-                "Driver": d,
-                "S1": _td_sec(s1),
-                "S2": _td_sec(s2),
-                "S3": _td_sec(s3),
-                "Lap": _td_sec(lt),
-            }
-        )
+    names = [d for d, _ in picked]
+    pos = np.array([p for _, p in picked], dtype=np.int64)
+    cols = list(SECTOR_MATRIX_COLUMNS)
 
-    per = pd.DataFrame(rows)
-    if per.empty:
-        raise ValueError("No sector data available for selected drivers.")
+    per = pd.DataFrame(matrix.times[pos], columns=cols)
+    per.insert(0, "Driver", names)
 
     # Baseline row
-    if baseline_driver not in per["Driver"].values:
-        baseline_driver = per["Driver"].iloc[0]
+    if baseline_driver not in names:
+        baseline_driver = names[0]
+    base_pos = pos[names.index(baseline_driver)]
 
-    base = per[per["Driver"] == baseline_driver].iloc[0]
-
-    for col in ["S1", "S2", "S3", "Lap"]:
-        per[f"d{col}"] = per[col] - float(base[col])
+    deltas = matrix.deltas(pos, base_pos)
+    for j, col in enumerate(cols):
+        per[f"d{col}"] = deltas[:, j]
 
     # Winners: sector best time among selected drivers
     winners = []
@@ -155,7 +168,8 @@ def compute_corner_breakdown(
     Compute per-corner metrics using telemetry distance space.
 
     Inputs:
-      - corners: If None, creates approximate corner segments (equal slices).
+      - corners: If None, corners come from the circuit DB (detected from the baseline lap on first use),
+          falling back to equal slices.
       - min_speed_thresholds: (low_max, med_max) km/h thresholds based on MIN SPEED
           min <= low_max  -> Low-speed
           low_max < min <= med_max -> Medium-speed
@@ -180,9 +194,9 @@ def compute_corner_breakdown(
     baseline_driver = baseline_driver.strip().upper()
 
     # Get a reference distance length from baseline lap
-    base_lap = _pick_driver_lap(laps, baseline_driver, use_fastest_laps=use_fastest_laps)
+    base_lap = _pick_driver_lap(session, baseline_driver, use_fastest_laps=use_fastest_laps)
     if base_lap is None:
-        base_lap = _pick_driver_lap(laps, drivers_u[0], use_fastest_laps=use_fastest_laps)
+        base_lap = _pick_driver_lap(session, drivers_u[0], use_fastest_laps=use_fastest_laps)
 
     base_tel = _get_tel(base_lap)
     if base_tel is None or base_tel.empty:
@@ -190,32 +204,22 @@ def compute_corner_breakdown(
 
     lap_len = float(base_tel["Distance"].max())
     if corners is None:
-        corners = build_fallback_corners(lap_len, n_corners=18)
+        corners = circuit_corners(session, base_lap) or build_fallback_corners(lap_len, n_corners=18)
+
+    # Telemetry for every driver's lap, extracted concurrently (order kept)
+    picked = [(d, _pick_driver_lap(session, d, use_fastest_laps=use_fastest_laps)) for d in drivers_u]
+    picked = [(d, lap) for d, lap in picked if lap is not None]
+    tels = parallel_map(_get_tel, [lap for _, lap in picked])
 
     # Compute per driver
     corner_rows = []
     group_rows = []
 
-    for d in drivers_u:
-        lap = _pick_driver_lap(laps, d, use_fastest_laps=use_fastest_laps)
-        if lap is None:
-            continue
-
-        tel = _get_tel(lap)
+    for (d, _), tel in zip(picked, tels):
         if tel is None or tel.empty:
             continue
 
-        per_corner = []
-        for c in corners:
-            seg = tel[(tel["Distance"] >= c.start_m) & (tel["Distance"] <= c.end_m)].copy()
-            if seg.empty:
-                per_corner.append(_empty_corner_row(d, c.corner_number))
-                continue
-
-            metrics = _compute_corner_metrics(seg, c.corner_number, min_speed_thresholds)
-            per_corner.append(metrics)
-
-        corners_df = pd.DataFrame([_metrics_to_row(d, m) for m in per_corner])
+        corners_df = _corner_metrics_frame(d, tel, corners, min_speed_thresholds)
         corner_rows.append(corners_df)
 
         group_df = (
@@ -238,10 +242,91 @@ def compute_corner_breakdown(
     return CornerBreakdownResult(corners=corners_all, group_avgs=groups_all)
 
 
+def compute_field_corner_breakdown(
+    session,
+    drivers: Iterable[str] | None = None,
+    corners: list[CornerDef] | None = None,
+    max_pct_of_best: float = 107.0,
+    min_speed_thresholds: tuple[float, float] = (120.0, 190.0),
+    batch_laps: int = CONFIG.corner_batch_laps,
+) -> FieldCornerResult:
+    """
+    Min speed and corner time of every corner on every representative lap, field-wide.
+
+    Representative laps: timed, not deleted, not pit in/out laps, and within
+    max_pct_of_best of the driver's fastest lap.
+
+    Works on the session samples (see session_samples) instead of per-lap telemetry frames:
+      - laps are processed batch_laps at a time (samples of consecutive laps are one
+        contiguous slice), so only one batch of intermediates is alive at once
+      - per batch: lap distance from a trapezoidal cumsum of Speed restarted per lap,
+        normalized to lap fraction; corner bounds (scaled from the reference lap) are
+        located for every (lap, corner) with one np.searchsorted on lap_index * 2 + fraction
+      - min speed = one reduceat over the (lap, corner) ranges, corner time = session time
+        interpolated at the corner exit minus at the corner entry
+    """
+    per_cols = ["Driver", "LapNumber", "Corner", "MinSpeed", "CornerTime(s)"]
+    if session is None:
+        raise ValueError("Session required.")
+
+    samples = get_session_samples(session)
+    speed = samples.channels.get("Speed")
+    if speed is None or samples.n_laps == 0:
+        raise ValueError("No car data available for a field-wide corner breakdown.")
+
+    keep = _representative_laps(session, samples, max_pct_of_best)
+    if drivers is not None:
+        keep &= samples.laps["Driver"].isin({d.strip().upper() for d in drivers if d and d.strip()}).to_numpy()
+    rows = np.flatnonzero(keep)
+    if len(rows) == 0:
+        raise ValueError("No representative laps to analyse.")
+
+    geometry = get_circuit_geometry(session)
+    ref_len = geometry.lap_length_m if geometry is not None else np.nan
+    if corners is None:
+        corners = _geometry_corners(geometry)
+    if not np.isfinite(ref_len) or ref_len <= 0:
+        ref_len = float(np.nanmedian(_lap_lengths(samples, speed, rows)))
+    if not np.isfinite(ref_len) or ref_len <= 0:
+        raise ValueError("Could not determine the lap length.")
+    if not corners:
+        corners = build_fallback_corners(ref_len, n_corners=18)
+
+    f_lo = np.clip(np.array([c.start_m for c in corners], dtype=float) / ref_len, 0.0, 1.0)
+    f_hi = np.clip(np.array([c.end_m for c in corners], dtype=float) / ref_len, 0.0, 1.0)
+
+    batch_laps = max(1, int(batch_laps))
+    frames = []
+    for b in range(0, len(rows), batch_laps):
+        frames.append(_field_corner_batch(samples, speed, rows[b:b + batch_laps], f_lo, f_hi, corners))
+
+    per_lap = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=per_cols)
+    return FieldCornerResult(per_lap=per_lap, distribution=_corner_distribution(per_lap, min_speed_thresholds))
+
+
+def circuit_corners(session, lap=None) -> list[CornerDef]:
+    """
+    Corners of the session's circuit layout from the circuit DB (see circuit_geometry),
+    built from the session's fastest valid lap the first time the circuit is seen
+    (lap only matters for sessions without a circuit key). Empty list if not available.
+    """
+    return _geometry_corners(get_circuit_geometry(session, lap=lap))
+
+
+def detect_corners(tel: pd.DataFrame) -> list[CornerDef]:
+    """
+    Corners detected from one lap of telemetry (see corner_detect), numbered in lap order.
+    """
+    return [
+        CornerDef(corner_number=i + 1, start_m=s, end_m=e, apex_m=a)
+        for i, (a, s, e) in enumerate(detect_corner_ranges(tel))
+    ]
+
+
 def build_fallback_corners(lap_length_m: float, n_corners: int = 18) -> list[CornerDef]:
     """
     Creates approximate corner segments by slicing lap distance into n segments.
-    This is a placeholder until you add real corner definitions per track.
+    Only used when corners cannot be detected from telemetry.
     """
     n_corners = max(6, int(n_corners))
     seg = lap_length_m / n_corners
@@ -256,46 +341,177 @@ def build_fallback_corners(lap_length_m: float, n_corners: int = 18) -> list[Cor
 # -----------------------------
 # Internals
 # -----------------------------
-def _pick_driver_lap(laps, driver: str, use_fastest_laps: bool = True):
-    driver = driver.strip().upper()
-    drv_laps = laps.pick_driver(driver)
-    if drv_laps is None or len(drv_laps) == 0:
+def _geometry_corners(geometry: CircuitGeometry | None) -> list[CornerDef]:
+    if geometry is None:
+        return []
+    return [
+        CornerDef(corner_number=c.number, start_m=c.start_m, end_m=c.end_m, apex_m=c.apex_m)
+        for c in geometry.corners
+        if np.isfinite(c.start_m) and np.isfinite(c.end_m)
+    ]
+
+
+def _representative_laps(session, samples: SessionSamples, max_pct_of_best: float) -> np.ndarray:
+    """
+    Mask over SessionSamples laps: timed, not deleted, no pit in/out, within max_pct_of_best
+    of the driver's fastest lap.
+    """
+    laps = session.laps
+    pos = samples.laps["RowPos"].to_numpy(dtype=np.int64)
+    lap_time = pd.to_timedelta(laps["LapTime"], errors="coerce").dt.total_seconds().to_numpy(dtype=float)[pos]
+    keep = np.isfinite(lap_time)
+    for col in ("PitInTime", "PitOutTime"):
+        if col in laps.columns:
+            keep &= laps[col].isna().to_numpy()[pos]
+    if "Deleted" in laps.columns:
+        keep &= ~laps["Deleted"].fillna(False).astype(bool).to_numpy()[pos]
+
+    best = pd.Series(np.where(keep, lap_time, np.nan)).groupby(samples.laps["Driver"].to_numpy()).transform("min")
+    return keep & (lap_time <= best.to_numpy() * max_pct_of_best / 100.0)
+
+
+def _lap_lengths(samples: SessionSamples, speed: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Integrated distance (m) of some SessionSamples laps (one bincount over all samples).
+    """
+    lap_idx = samples.lap_idx
+    v_ms = (speed[1:] + speed[:-1]) / 2.0 / 3.6
+    step = np.where((lap_idx[1:] == lap_idx[:-1]) & np.isfinite(v_ms), v_ms * np.diff(samples.time_s), 0.0)
+    lengths = np.bincount(lap_idx[1:], weights=step, minlength=samples.n_laps)
+    return np.where(samples.counts()[rows] >= 2, lengths[rows], np.nan)
+
+
+def _field_corner_batch(
+    samples: SessionSamples,
+    speed: np.ndarray,
+    rows: np.ndarray,
+    f_lo: np.ndarray,
+    f_hi: np.ndarray,
+    corners: list[CornerDef],
+) -> pd.DataFrame:
+    """
+    Per (lap, corner) MinSpeed and CornerTime(s) for a batch of SessionSamples laps.
+    Only the samples between the batch's first and last lap are touched.
+    """
+    first, last = int(rows[0]), int(rows[-1])
+    s0, s1 = samples.offsets[first], samples.offsets[last + 1]
+    lap_idx = samples.lap_idx[s0:s1] - first
+    t = samples.time_s[s0:s1]
+    v = speed[s0:s1]
+    offsets = samples.offsets[first:last + 2] - s0
+    n_c = len(corners)
+
+    # Lap fraction per sample (distance since the lap's first sample / lap distance)
+    same_lap = lap_idx[1:] == lap_idx[:-1]
+    v_ms = (v[1:] + v[:-1]) / 2.0 / 3.6
+    step = np.where(same_lap & np.isfinite(v_ms), v_ms * np.diff(t), 0.0)
+    cum = np.concatenate(([0.0], np.cumsum(step)))
+    dist = cum - cum[offsets[:-1][lap_idx]]
+    counts = np.diff(offsets)
+    total = np.full(len(counts), np.nan)
+    nonempty = counts > 0
+    total[nonempty] = dist[offsets[1:][nonempty] - 1]
+    frac = np.nan_to_num(dist / np.where(total > 0, total, np.nan)[lap_idx], nan=0.0)
+    key = lap_idx * 2.0 + frac                                      # sorted: laps apart, fraction within
+
+    local = rows - first
+    ok_lap = (counts[local] >= 2) & (total[local] > 0)
+    start = offsets[local][:, None]
+    end = offsets[local + 1][:, None]                              # exclusive
+    q_lo = local[:, None] * 2.0 + f_lo[None, :]                    # (laps, corners)
+    q_hi = local[:, None] * 2.0 + f_hi[None, :]
+    lo = np.clip(np.searchsorted(key, q_lo, side="left"), start, end)
+    hi = np.clip(np.searchsorted(key, q_hi, side="right"), lo, end)
+
+    min_speed = _range_reduce(v, lo.ravel(), hi.ravel(), np.fmin).reshape(lo.shape)
+    corner_time = _interp_on_key(key, t, q_hi, start, end - 1) - _interp_on_key(key, t, q_lo, start, end - 1)
+
+    valid = ok_lap[:, None] & (hi > lo)
+    laps = samples.laps.iloc[rows]
+    return pd.DataFrame(
+        {
+            "Driver": np.repeat(laps["Driver"].to_numpy(), n_c),
+            "LapNumber": np.repeat(laps["LapNumber"].to_numpy(), n_c),
+            "Corner": np.tile([c.corner_number for c in corners], len(rows)),
+            "MinSpeed": np.where(valid, min_speed, np.nan).ravel(),
+            "CornerTime(s)": np.where(valid, corner_time, np.nan).ravel(),
+        }
+    )
+
+
+def _interp_on_key(key: np.ndarray, t: np.ndarray, q: np.ndarray, start: np.ndarray, last: np.ndarray) -> np.ndarray:
+    """
+    t linearly interpolated at q on a sorted key, neighbours clamped to each lap's [start, last].
+    """
+    hi = np.clip(np.searchsorted(key, q, side="left"), start, last)
+    lo = np.clip(hi - 1, start, last)
+    span = key[hi] - key[lo]
+    w = np.divide(q - key[lo], span, out=np.zeros_like(q), where=span > 0)
+    return t[lo] + (t[hi] - t[lo]) * np.clip(w, 0.0, 1.0)
+
+
+def _corner_distribution(per_lap: pd.DataFrame, thresholds: tuple[float, float]) -> pd.DataFrame:
+    """
+    per_lap -> p10/p50/p90 of MinSpeed and CornerTime(s) per (Driver, Corner).
+    """
+    metrics = ["MinSpeed", "CornerTime(s)"]
+    quantiles = {"p10": 0.1, "p50": 0.5, "p90": 0.9}
+    cols = ["Driver", "Corner", "Type", "Laps"] + [f"{m} {q}" for m in metrics for q in quantiles]
+    df = per_lap.dropna(subset=metrics, how="all")
+    if df.empty:
+        return pd.DataFrame(columns=cols)
+
+    grouped = df.groupby(["Driver", "Corner"], sort=True)
+    q = grouped[metrics].quantile(list(quantiles.values())).unstack()
+    names = {v: k for k, v in quantiles.items()}
+    q.columns = [f"{m} {names[v]}" for m, v in q.columns]
+    out = q.reset_index()
+    out.insert(2, "Laps", grouped.size().to_numpy())
+
+    low_max, med_max = thresholds
+    p50 = out["MinSpeed p50"].to_numpy(dtype=float)
+    out.insert(
+        2,
+        "Type",
+        np.select(
+            [np.isnan(p50), p50 <= low_max, p50 <= med_max],
+            ["Medium-speed", "Low-speed", "Medium-speed"],
+            default="High-speed",
+        ),
+    )
+    return out[cols]
+
+
+def _pick_driver_lap(session, driver: str, use_fastest_laps: bool = True):
+    index = get_lap_index(session)
+    pos = _pick_driver_pos(index, driver, use_fastest_laps=use_fastest_laps)
+    return None if pos is None else index.laps.iloc[pos]
+
+
+def _pick_driver_pos(index: LapIndex | None, driver: str, use_fastest_laps: bool = True) -> int | None:
+    """
+    Row position in session.laps of the driver's fastest lap (or first timed lap).
+    """
+    if index is None:
         return None
 
-    if use_fastest_laps:
-        try:
-            lap = drv_laps.pick_fastest()
-            if hasattr(lap, "iloc"):
-                lap = lap.iloc[0]
-            return lap
-        except Exception:
-            pass
+    driver = driver.strip().upper()
+    if use_fastest_laps and driver in index.fastest:
+        return index.fastest[driver]
 
     # fallback: first timed lap
-    try:
-        timed = drv_laps.dropna(subset=["LapTime"])
-        if len(timed) > 0:
-            return timed.iloc[0]
-        return drv_laps.iloc[0]
-    except Exception:
-        return None
+    return index.first.get(driver)
 
 
 def _get_tel(lap) -> pd.DataFrame:
     try:
-        tel = lap.get_telemetry()
+        tel = lap_telemetry(lap, ("Speed", "Throttle", "Brake"))
     except Exception:
         return pd.DataFrame()
 
     if tel is None or len(tel) == 0:
         return pd.DataFrame()
 
-    if "Distance" not in tel.columns:
-        try:
-            tel = tel.add_distance()
-        except Exception:
-            return pd.DataFrame()
-
     # Need at least Speed, and ideally Brake/Throttle
     keep = [c for c in ["Distance", "Speed", "Throttle", "Brake"] if c in tel.columns]
     df = tel[keep].copy().dropna(subset=["Distance"]).sort_values("Distance")
@@ -312,146 +528,123 @@ def _get_tel(lap) -> pd.DataFrame:
     return df
 
 
-def _compute_corner_metrics(seg: pd.DataFrame, corner_no: int, thresholds: tuple[float, float]) -> CornerMetrics:
+def _corner_metrics_frame(
+    driver: str,
+    tel: pd.DataFrame,
+    corners: list[CornerDef],
+    thresholds: tuple[float, float],
+) -> pd.DataFrame:
     """
-    Compute entry/min/exit speeds + braking/throttle points + segment time.
-    Assumes seg is sorted by Distance.
+    Entry/min/exit speeds + braking/throttle points + segment time for every corner at once.
+
+    Corner sample ranges [lo, hi) come from one np.searchsorted on Distance (inclusive ends,
+    corners may overlap); metrics are grouped reductions over those ranges (reduceat,
+    prefix sums, next-true lookups). Assumes tel is sorted by Distance.
+    Columns: Driver, Corner, Type, EntrySpeed, MinSpeed, ExitSpeed, BrakeStart(m), ThrottleOn(m), CornerTime(s)
     """
     low_max, med_max = thresholds
-
-    speed = seg["Speed"].to_numpy(dtype=float) if "Speed" in seg.columns else None
-    dist = seg["Distance"].to_numpy(dtype=float)
-
-    entry_speed = float(np.nanmean(speed[: max(3, len(speed) // 10)])) if speed is not None and len(speed) > 0 else np.nan
-    exit_speed = float(np.nanmean(speed[-max(3, len(speed) // 10) :])) if speed is not None and len(speed) > 0 else np.nan
-    min_speed = float(np.nanmin(speed)) if speed is not None and len(speed) > 0 else np.nan
-
-    group: CornerGroup
-    if np.isnan(min_speed):
-        group = "Medium-speed"
-    elif min_speed <= low_max:
-        group = "Low-speed"
-    elif min_speed <= med_max:
-        group = "Medium-speed"
-    else:
-        group = "High-speed"
-
-    brake_start_m = _brake_start(seg)
-    throttle_on_m = _throttle_on(seg)
-
-    # Segment time: integrate dt = dDist / v
-    seg_time = _segment_time_seconds(dist, speed)
-
-    return CornerMetrics(
-        corner_number=corner_no,
-        group=group,
-        entry_speed=_nan_to_none(entry_speed),
-        min_speed=_nan_to_none(min_speed),
-        exit_speed=_nan_to_none(exit_speed),
-        brake_start_m=_nan_to_none(brake_start_m),
-        throttle_on_m=_nan_to_none(throttle_on_m),
-        segment_time_s=_nan_to_none(seg_time),
+    n_c = len(corners)
+
+    dist = tel["Distance"].to_numpy(dtype=float)
+    n = len(dist)
+    starts = np.array([c.start_m for c in corners], dtype=float)
+    ends = np.array([c.end_m for c in corners], dtype=float)
+    lo = np.searchsorted(dist, starts, side="left")
+    hi = np.maximum(np.searchsorted(dist, ends, side="right"), lo)
+    size = hi - lo
+    has = size > 0
+
+    nan = np.full(n_c, np.nan)
+    entry = exit_ = min_speed = seg_time = throttle_on = nan
+    speed = tel["Speed"].to_numpy(dtype=float) if "Speed" in tel.columns else None
+
+    if speed is not None and n > 0:
+        # Entry/exit: mean of the first/last max(3, n // 10) samples of each corner
+        m = np.maximum(3, size // 10)
+        entry = _range_nanmean(speed, lo, np.minimum(lo + m, hi))
+        exit_ = _range_nanmean(speed, np.maximum(hi - m, lo), hi)
+        min_speed = np.where(has, _range_reduce(speed, lo, hi, np.fmin), np.nan)
+
+        # Segment time: sum of dDist / v, the first sample taking the second one's step
+        v_ms = np.maximum(0.1, speed / 3.6)
+        dd = np.diff(dist, prepend=dist[0])
+        step_t = np.concatenate(([0.0], np.cumsum(np.nan_to_num(dd / v_ms, nan=0.0))))
+        first = np.minimum(lo + 1, n - 1)
+        first_t = np.nan_to_num((dist[first] - dist[np.minimum(lo, n - 1)]) / v_ms[np.minimum(lo, n - 1)], nan=0.0)
+        seg_time = np.where(size >= 2, step_t[hi] - step_t[np.minimum(lo + 1, hi)] + first_t, np.nan)
+
+        # Throttle on: first Throttle > 0.6 at/after the apex (first minimum speed sample)
+        if "Throttle" in tel.columns:
+            throttle = tel["Throttle"].to_numpy(dtype=float)
+            rank = np.empty(n, dtype=np.int64)
+            order = np.lexsort((np.arange(n), speed))     # NaN speeds sort last
+            rank[order] = np.arange(n)
+            apex = order[np.minimum(_range_reduce(rank, lo, hi, np.minimum, fill=n - 1), n - 1)]
+            on = _next_true(throttle > 0.6)[apex]
+            ok = (size >= 3) & np.isfinite(speed[apex]) & (on < hi)
+            throttle_on = np.where(ok, dist[np.minimum(on, n - 1)], np.nan)
+
+    # Brake start: first Brake > 0.1, else first sharp speed drop (step < -2.5 km/h)
+    brake_start = nan
+    if n > 0:
+        if "Brake" in tel.columns:
+            b = _next_true(tel["Brake"].to_numpy(dtype=float) > 0.1)[lo]
+            brake_start = np.where(b < hi, dist[np.minimum(b, n - 1)], np.nan)
+        if speed is not None:
+            # The first sample of a corner has no in-corner step, so search from lo + 1
+            drop = _next_true(np.diff(speed, prepend=speed[0]) < -2.5)[np.minimum(lo + 1, n)]
+            by_speed = np.where(drop < hi, dist[np.minimum(drop, n - 1)], np.nan)
+            brake_start = np.where(np.isnan(brake_start), by_speed, brake_start)
+
+    brake_start = np.where(has, brake_start, np.nan)
+    group = np.select(
+        [np.isnan(min_speed), min_speed <= low_max, min_speed <= med_max],
+        ["Medium-speed", "Low-speed", "Medium-speed"],
+        default="High-speed",
     )
 
-
-def _segment_time_seconds(dist: np.ndarray, speed_kmh: np.ndarray | None) -> float:
-    if speed_kmh is None or len(dist) < 2 or len(speed_kmh) < 2:
-        return np.nan
-
-    d = np.diff(dist, prepend=dist[0])
-    d[0] = d[1] if len(d) > 1 else 0.0
-
-    v_ms = np.maximum(0.1, speed_kmh / 3.6)
-    dt = d / v_ms
-    return float(np.nansum(dt))
+    return pd.DataFrame(
+        {
+            "Driver": driver,
+            "Corner": [c.corner_number for c in corners],
+            "Type": group,
+            "EntrySpeed": np.where(has, entry, np.nan),
+            "MinSpeed": min_speed,
+            "ExitSpeed": np.where(has, exit_, np.nan),
+            "BrakeStart(m)": brake_start,
+            "ThrottleOn(m)": np.where(has, throttle_on, np.nan),
+            "CornerTime(s)": np.where(has, seg_time, np.nan),
+        }
+    )
 
 
-def _brake_start(seg: pd.DataFrame) -> float:
+def _range_reduce(values: np.ndarray, lo: np.ndarray, hi: np.ndarray, ufunc: np.ufunc, fill=np.nan) -> np.ndarray:
     """
-    Distance where braking starts (proxy):
-      - if Brake channel exists: first point where Brake > 0.1
-      - else: first point where speed drops sharply
+    ufunc.reduce(values[lo[i]:hi[i]]) for every range at once (ranges may overlap).
+    Empty ranges get fill.
     """
-    if "Brake" in seg.columns:
-        br = seg["Brake"].to_numpy(dtype=float)
-        dist = seg["Distance"].to_numpy(dtype=float)
-        idx = np.where(br > 0.1)[0]
-        if len(idx) > 0:
-            return float(dist[idx[0]])
+    if len(lo) == 0:
+        return np.zeros(0, dtype=values.dtype)
+    padded = np.append(values, values[-1:] if len(values) else [fill])
+    # reduceat over interleaved [lo0, hi0, lo1, hi1, ...]; even slots are the ranges
+    idx = np.column_stack([np.minimum(lo, len(values)), np.minimum(hi, len(values))]).ravel()
+    out = ufunc.reduceat(padded, idx)[::2]
+    return np.where(hi > lo, out, fill)
 
-    # speed drop proxy
-    if "Speed" in seg.columns:
-        sp = seg["Speed"].to_numpy(dtype=float)
-        dist = seg["Distance"].to_numpy(dtype=float)
-        dsp = np.diff(sp, prepend=sp[0])
-        idx = np.where(dsp < -2.5)[0]  # km/h step threshold (rough)
-        if len(idx) > 0:
-            return float(dist[idx[0]])
 
-    return np.nan
+def _range_nanmean(values: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    finite = np.isfinite(values)
+    total = np.concatenate(([0.0], np.cumsum(np.where(finite, values, 0.0))))
+    count = np.concatenate(([0], np.cumsum(finite)))
+    cnt = count[hi] - count[lo]
+    return np.divide(total[hi] - total[lo], cnt, out=np.full(len(lo), np.nan), where=cnt > 0)
 
 
-def _throttle_on(seg: pd.DataFrame) -> float:
+def _next_true(mask: np.ndarray) -> np.ndarray:
     """
-    Distance where throttle ramps up after apex (proxy):
-      - first point where Throttle > 0.6 after minimum speed index
+    For every position i (and len(mask)): smallest j >= i with mask[j], else len(mask).
     """
-    if "Throttle" not in seg.columns or "Speed" not in seg.columns:
-        return np.nan
-
-    th = seg["Throttle"].to_numpy(dtype=float)
-    sp = seg["Speed"].to_numpy(dtype=float)
-    dist = seg["Distance"].to_numpy(dtype=float)
-
-    if len(sp) < 3:
-        return np.nan
-
-    apex_idx = int(np.nanargmin(sp))
-    after = np.where(th[apex_idx:] > 0.6)[0]
-    if len(after) == 0:
-        return np.nan
-
-    return float(dist[apex_idx + after[0]])
-
+    n = len(mask)
+    idx = np.where(mask, np.arange(n), n)
+    return np.append(np.minimum.accumulate(idx[::-1])[::-1], n)
 
-def _metrics_to_row(driver: str, m: CornerMetrics) -> dict:
-    return {
-        "Driver": driver,
-        "Corner": m.corner_number,
-        "Type": m.group,
-        "EntrySpeed": m.entry_speed,
-        "MinSpeed": m.min_speed,
-        "ExitSpeed": m.exit_speed,
-        "BrakeStart(m)": m.brake_start_m,
-        "ThrottleOn(m)": m.throttle_on_m,
-        "CornerTime(s)": m.segment_time_s,
-    }
-
-
-def _empty_corner_row(driver: str, corner_no: int) -> CornerMetrics:
-    return CornerMetrics(
-        corner_number=corner_no,
-        group="Medium-speed",
-        entry_speed=None,
-        min_speed=None,
-        exit_speed=None,
-        brake_start_m=None,
-        throttle_on_m=None,
-        segment_time_s=None,
-    )
-
-
-def _td_sec(x) -> float:
-    if x is None or pd.isna(x):
-        return np.nan
-    try:
-        return float(pd.to_timedelta(x).total_seconds())
-    except Exception:
-        return np.nan
-
-
-def _nan_to_none(x: float) -> float | None:
-    try:
-        return None if np.isnan(x) else float(x)
-    except Exception:
-        return None
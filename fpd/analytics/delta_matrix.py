@@ -0,0 +1,150 @@
+# fpd/analytics/delta_matrix.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from fpd.analytics.compare import DEFAULT_CHANNELS, LapRef, get_compare_session
+from fpd.analytics.lap_index import get_lap_index
+
+
+PAIR_COLUMNS: list[str] = [
+    "Driver",
+    "Rival",
+    "FinalDelta(s)",
+    "MaxGain(s)",
+    "MaxGainAt(m)",
+    "MaxLoss(s)",
+    "MaxLossAt(m)",
+]
+
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True, eq=False)
+class DeltaMatrix:
+    """
+    Pairwise delta summaries for N fastest laps (row driver vs column rival).
+
+    Arrays are (N, N); entry [i, j] is driver i vs rival j:
+      - final: lap-time delta over the common grid (s), positive => i slower
+      - gain / gain_at: most time i gains on j within any window_m stretch (s, >= 0) and where it starts (m)
+      - loss / loss_at: most time i loses to j within any window_m stretch (s, >= 0) and where it starts (m)
+    The diagonal is 0 / NaN.
+    """
+    drivers: tuple[str, ...]
+    window_m: float
+    final: np.ndarray
+    gain: np.ndarray
+    gain_at: np.ndarray
+    loss: np.ndarray
+    loss_at: np.ndarray
+
+    def final_frame(self) -> pd.DataFrame:
+        """
+        N x N frame of final deltas (index = driver, columns = rival).
+        """
+        return pd.DataFrame(self.final, index=list(self.drivers), columns=list(self.drivers))
+
+    @cached_property
+    def pairs(self) -> pd.DataFrame:
+        """
+        One row per ordered pair (i != j): Driver, Rival, FinalDelta(s), MaxGain(s), MaxGainAt(m), MaxLoss(s), MaxLossAt(m)
+        """
+        n = len(self.drivers)
+        i, j = np.nonzero(~np.eye(n, dtype=bool))
+        names = np.asarray(self.drivers, dtype=object)
+        return pd.DataFrame(
+            {
+                "Driver": names[i],
+                "Rival": names[j],
+                "FinalDelta(s)": self.final[i, j],
+                "MaxGain(s)": self.gain[i, j],
+                "MaxGainAt(m)": self.gain_at[i, j],
+                "MaxLoss(s)": self.loss[i, j],
+                "MaxLossAt(m)": self.loss_at[i, j],
+            },
+            columns=PAIR_COLUMNS,
+        )
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def fastest_lap_delta_matrix(
+    session,
+    drivers: Optional[Iterable[str]] = None,
+    resample_m: float = 1.0,
+    window_m: float = 50.0,
+) -> DeltaMatrix:
+    """
+    N x N delta summaries between every driver's fastest lap (all drivers by default).
+
+    Laps are aligned through the session CompareSession for DEFAULT_CHANNELS, the one
+    Lap Compare uses, so laps it already aligned are reused (and vice versa). Every pair
+    is then computed in one broadcast over the (N x grid) delta-vs-baseline array:
+    delta_ij(d) = delta_i(d) - delta_j(d).
+    """
+    index = get_lap_index(session)
+    if index is None:
+        raise ValueError("Session has no laps.")
+
+    if drivers is None:
+        drivers = sorted(index.fastest, key=lambda d: index.fastest_lap(d).get("LapTime"))
+    refs = [LapRef(driver=d) for d in drivers if d and d.strip()]
+    if len(refs) < 2:
+        raise ValueError("Need at least 2 drivers with a fastest lap.")
+
+    result = get_compare_session(session, DEFAULT_CHANNELS, resample_m).compare(refs)
+    if result.deltas is None:
+        raise ValueError("No Time/Speed telemetry to compute deltas.")
+
+    d = result.deltas
+    return build_delta_matrix(d.drivers, d.grid, d.seconds, window_m=window_m)
+
+
+def build_delta_matrix(
+    drivers: tuple[str, ...],
+    grid: np.ndarray,
+    seconds: np.ndarray,
+    window_m: float = 50.0,
+) -> DeltaMatrix:
+    """
+    seconds: (N, grid) elapsed time or delta vs any common baseline (the baseline cancels out).
+    """
+    n, n_pts = seconds.shape
+    if n_pts < 2:
+        raise ValueError("Delta traces are too short for a delta matrix.")
+    step = float(grid[1] - grid[0]) if len(grid) > 1 else 1.0
+    w = int(np.clip(round(window_m / step), 1, max(1, n_pts - 1)))
+
+    s = seconds.astype(np.float32)
+    final = s[:, -1][:, None] - s[:, -1][None, :]
+
+    # Time each lap takes over every window, then pairwise: (N, N, n_pts - w)
+    win = s[:, w:] - s[:, :-w]
+    rel = win[:, None, :] - win[None, :, :]
+
+    filled_min = np.where(np.isnan(rel), np.inf, rel)
+    filled_max = np.where(np.isnan(rel), -np.inf, rel)
+    i_gain = np.argmin(filled_min, axis=-1)
+    i_loss = np.argmax(filled_max, axis=-1)
+
+    gain = -np.take_along_axis(rel, i_gain[..., None], axis=-1)[..., 0]
+    loss = np.take_along_axis(rel, i_loss[..., None], axis=-1)[..., 0]
+
+    diag = np.eye(n, dtype=bool)
+    return DeltaMatrix(
+        drivers=tuple(drivers),
+        window_m=w * step,
+        final=final.astype(float),
+        gain=np.where(diag, np.nan, np.maximum(gain, 0.0)).astype(float),
+        gain_at=np.where(diag, np.nan, grid[:-w][i_gain]),
+        loss=np.where(diag, np.nan, np.maximum(loss, 0.0)).astype(float),
+        loss_at=np.where(diag, np.nan, grid[:-w][i_loss]),
+    )
@@ -0,0 +1,148 @@
+# fpd/analytics/downsample.py
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from fpd.analytics.compare import CompareResult
+from fpd.core.config import CONFIG
+
+
+DownsampleMethod = Literal["minmax", "lttb"]
+
+DELTA_CHART = "DeltaSeconds"
+
+# Point budget per chart, in points per pixel of chart width (shared by its traces)
+POINTS_PER_PX = 2
+# Floor per trace, so charts with many laps still show each lap's shape
+MIN_TRACE_POINTS = 256
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def compare_plot_payload(
+    result: CompareResult,
+    width_px: int = CONFIG.plot_width_px,
+    method: DownsampleMethod = "minmax",
+) -> dict[str, pd.DataFrame]:
+    """
+    Plot-sized views of a CompareResult, one long frame per chart:
+      {channel: Distance, Driver, <channel>} + {"DeltaSeconds": Distance, Driver, DeltaSeconds}
+
+    Every chart gets about POINTS_PER_PX * width_px points (the chart's pixel width),
+    split between its traces (at least MIN_TRACE_POINTS each), instead of one per grid metre.
+    The CompareResult itself keeps the full-resolution arrays server-side.
+    Laps with no data for a channel are left out of that channel's frame.
+    """
+    traces = result.traces
+    out = {
+        ch: downsample_frame(traces.grid, traces.values[:, j, :], traces.drivers, ch, width_px, method)
+        for j, ch in enumerate(traces.channels)
+    }
+    if result.deltas is not None:
+        d = result.deltas
+        out[DELTA_CHART] = downsample_frame(d.grid, d.seconds, d.drivers, DELTA_CHART, width_px, method)
+    return out
+
+
+def downsample_frame(
+    x: np.ndarray,
+    values: np.ndarray,
+    labels: tuple[str, ...],
+    name: str,
+    width_px: int = CONFIG.plot_width_px,
+    method: DownsampleMethod = "minmax",
+) -> pd.DataFrame:
+    """
+    (traces, points) on a shared x -> long frame: Distance, Driver, <name>.
+    """
+    n_points = trace_points(width_px, len(labels))
+    if method == "minmax":
+        # All traces share x, and min/max buckets keep the same count per trace: one batched call
+        idx = minmax_indices(values, n_points // 2)
+    else:
+        idx = [lttb_indices(x, values[i], n_points) for i in range(len(labels))]
+
+    # One frame for all traces (no per-trace frames + concat)
+    ys = [values[i, keep] for i, keep in enumerate(idx)]
+    keep = [i for i, y in enumerate(ys) if np.isfinite(y).any()]
+    if not keep:
+        return pd.DataFrame(columns=["Distance", "Driver", name])
+    return pd.DataFrame(
+        {
+            "Distance": np.concatenate([x[idx[i]] for i in keep]),
+            "Driver": np.repeat(np.asarray(labels, dtype=object)[keep], [len(ys[i]) for i in keep]),
+            name: np.concatenate([ys[i] for i in keep]).astype(float),
+        }
+    )
+
+
+def trace_points(width_px: int, n_traces: int) -> int:
+    """
+    Points per trace for a chart width_px wide with n_traces overlaid traces.
+    """
+    return max(MIN_TRACE_POINTS, POINTS_PER_PX * int(width_px) // max(1, n_traces))
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Min/max bucket downsampling, vectorized over leading axes.
+
+    y: (..., n) -> (..., 2 * n_buckets) sorted indices into the last axis:
+    the min and the max of each of n_buckets equal-width buckets, in x order.
+    NaNs are ignored (all-NaN buckets keep their first point).
+    Returns every index when there is nothing to reduce.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.shape[-1]
+    n_buckets = max(1, int(n_buckets))
+    if n <= 2 * n_buckets:
+        return np.broadcast_to(np.arange(n), y.shape).copy()
+
+    size = -(-n // n_buckets)
+    # Last bucket is padded by repeating the final point
+    pos = np.minimum(np.arange(n_buckets * size), n - 1).reshape(n_buckets, size)
+
+    buckets = y[..., pos]                                                  # (..., n_buckets, size)
+    nan = np.isnan(buckets)
+    i_min = np.argmin(np.where(nan, np.inf, buckets), axis=-1)
+    i_max = np.argmax(np.where(nan, -np.inf, buckets), axis=-1)
+
+    rows = np.arange(n_buckets)
+    lo = pos[rows, np.minimum(i_min, i_max)]
+    hi = pos[rows, np.maximum(i_min, i_max)]
+    return np.stack([lo, hi], axis=-1).reshape(*y.shape[:-1], 2 * n_buckets)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of n_out points (first and last always kept)
+    that best preserve the visual shape of one trace.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+
+        # Third vertex: average of the next bucket (the last point for the final bucket)
+        avg_x = x[end:nxt_end].mean()
+        avg_y = np.nanmean(y[end:nxt_end]) if np.isfinite(y[end:nxt_end]).any() else np.nan
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        out[i + 1] = a
+
+    return out
@@ -0,0 +1,133 @@
+# fpd/analytics/lap_digest.py
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from fpd.analytics.session_samples import SessionSamples, get_session_samples
+from fpd.data import session_store
+from fpd.data.session_memo import session_memo
+
+
+DIGEST_COLUMNS: list[str] = [
+    "Driver",
+    "LapNumber",
+    "MaxSpeed(km/h)",
+    "MinSpeed(km/h)",
+    "FullThrottle(frac)",
+    "Braking(frac)",
+    "GearChanges",
+    "Distance(m)",
+    "Samples",
+    "Completeness",
+]
+
+FULL_THROTTLE_MIN = 98.0   # Throttle (%) counted as flat out
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def lap_digest(session) -> pd.DataFrame:
+    """
+    One row per lap of the session with per-lap telemetry scalars:
+      Driver, LapNumber, MaxSpeed(km/h), MinSpeed(km/h), FullThrottle(frac), Braking(frac),
+      GearChanges, Distance(m), Samples, Completeness
+
+    Built once per session in a vectorized pass over session car data
+    (see session_samples), and persisted next to the session in the fpd store,
+    so later processes read it back without touching telemetry.
+    Completeness = sample count vs. the session's typical sampling rate (capped at 1).
+    """
+    if session is None:
+        return pd.DataFrame(columns=DIGEST_COLUMNS)
+    return session_memo(session, "lap_digest", lambda: _load_or_build(session))
+
+
+def top_speed_leaderboard(session) -> pd.DataFrame:
+    """
+    Driver, TopSpeed(km/h), LapNumber — best lap top speed per driver, fastest first.
+    """
+    dg = lap_digest(session).dropna(subset=["MaxSpeed(km/h)"])
+    if dg.empty:
+        return pd.DataFrame(columns=["Driver", "TopSpeed(km/h)", "LapNumber"])
+
+    best = dg.loc[dg.groupby("Driver")["MaxSpeed(km/h)"].idxmax()]
+    return (
+        best.rename(columns={"MaxSpeed(km/h)": "TopSpeed(km/h)"})[["Driver", "TopSpeed(km/h)", "LapNumber"]]
+        .sort_values("TopSpeed(km/h)", ascending=False)
+        .reset_index(drop=True)
+    )
+
+
+# -----------------------------
+# Build
+# -----------------------------
+def _load_or_build(session) -> pd.DataFrame:
+    stored = session_store.read_extra(session, "lap_digest")
+    if stored is not None:
+        return stored
+
+    df = build_lap_digest(get_session_samples(session))
+    if df["Samples"].sum() > 0:
+        session_store.write_extra(session, "lap_digest", df)
+    return df
+
+
+def build_lap_digest(samples: SessionSamples) -> pd.DataFrame:
+    n = samples.n_laps
+    counts = samples.counts()
+    ch = samples.channels
+    nan = np.full(n, np.nan)
+
+    out = samples.laps[["Driver", "LapNumber"]].copy()
+    if n == 0:
+        return out.reindex(columns=DIGEST_COLUMNS)
+
+    safe_counts = np.where(counts > 0, counts, np.nan)
+
+    speed = ch.get("Speed")
+    out["MaxSpeed(km/h)"] = samples.reduce(speed, np.fmax) if speed is not None else nan
+    out["MinSpeed(km/h)"] = samples.reduce(speed, np.fmin) if speed is not None else nan
+
+    throttle = ch.get("Throttle")
+    out["FullThrottle(frac)"] = (
+        _per_lap_sum(samples, throttle >= FULL_THROTTLE_MIN) / safe_counts if throttle is not None else nan
+    )
+
+    brake = ch.get("Brake")
+    out["Braking(frac)"] = _per_lap_sum(samples, brake > 0) / safe_counts if brake is not None else nan
+
+    # Consecutive samples within the same lap
+    same_lap = samples.lap_idx[1:] == samples.lap_idx[:-1]
+    pair_lap = samples.lap_idx[1:][same_lap]
+
+    gear = ch.get("nGear")
+    if gear is not None:
+        changed = (gear[1:] != gear[:-1])[same_lap] & np.isfinite(gear[1:][same_lap]) & np.isfinite(gear[:-1][same_lap])
+        out["GearChanges"] = np.bincount(pair_lap[changed], minlength=n)
+    else:
+        out["GearChanges"] = nan
+
+    dt = np.diff(samples.time_s)[same_lap]
+    if speed is not None:
+        # Trapezoidal integration of speed over time
+        v_ms = (speed[1:] + speed[:-1])[same_lap] / 2.0 / 3.6
+        step = np.where(np.isfinite(v_ms), v_ms * dt, 0.0)
+        out["Distance(m)"] = np.bincount(pair_lap, weights=step, minlength=n)
+        out.loc[counts < 2, "Distance(m)"] = np.nan
+    else:
+        out["Distance(m)"] = nan
+
+    out["Samples"] = counts
+
+    duration = (samples.laps["LapEnd(s)"] - samples.laps["LapStart(s)"]).to_numpy(dtype=float)
+    rate = counts / np.where(duration > 0, duration, np.nan)
+    typical = np.nanmedian(rate[counts > 0]) if (counts > 0).any() else np.nan
+    out["Completeness"] = np.clip(rate / typical, 0.0, 1.0) if typical and np.isfinite(typical) else nan
+
+    return out[DIGEST_COLUMNS].reset_index(drop=True)
+
+
+def _per_lap_sum(samples: SessionSamples, mask: np.ndarray) -> np.ndarray:
+    return np.bincount(samples.lap_idx, weights=mask.astype(float), minlength=samples.n_laps)
@@ -0,0 +1,142 @@
+# fpd/analytics/lap_index.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from fpd.data.session_memo import session_memo
+
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True, eq=False)
+class LapIndex:
+    """
+    Lap lookups for one session.laps frame, without filtering the frame per query.
+
+    - rows: (DRIVER, lap number) -> row position in laps (first row wins on duplicates)
+    - fastest: DRIVER -> row of the fastest lap (personal-best laps first, like
+      Laps.pick_fastest(); fastest timed lap if none is flagged)
+    - first: DRIVER -> row of the first timed lap (first lap if none is timed)
+    - numbers: DRIVER -> (sorted lap numbers, their rows) for nearest-lap queries
+    """
+    laps: pd.DataFrame
+    rows: dict[tuple[str, float], int]
+    fastest: dict[str, int]
+    first: dict[str, int]
+    numbers: dict[str, tuple[np.ndarray, np.ndarray]]
+
+    def pick(self, driver: str, lap_number: int | float | None = None):
+        """
+        Lap row for a driver:
+          - lap_number None => fastest lap
+          - else => exact lap number, or the closest one (lower number on ties)
+        None if the driver has no laps.
+        """
+        if lap_number is None:
+            lap = self.fastest_lap(driver)
+            return lap if lap is not None else self.first_timed_lap(driver)
+        return self.nearest_lap(driver, lap_number)
+
+    def get(self, driver: str, lap_number: int | float):
+        pos = self.rows.get((_norm(driver), float(lap_number)))
+        return self._row(pos)
+
+    def fastest_lap(self, driver: str):
+        return self._row(self.fastest.get(_norm(driver)))
+
+    def first_timed_lap(self, driver: str):
+        return self._row(self.first.get(_norm(driver)))
+
+    def nearest_lap(self, driver: str, lap_number: int | float):
+        drv = _norm(driver)
+        exact = self.rows.get((drv, float(lap_number)))
+        if exact is not None:
+            return self._row(exact)
+
+        entry = self.numbers.get(drv)
+        if entry is None:
+            # No numbered laps: first lap of the driver, if any
+            return self.first_timed_lap(drv)
+
+        nums, rows = entry
+        i = int(np.searchsorted(nums, lap_number))
+        if i >= len(nums):
+            i = len(nums) - 1
+        elif i > 0 and (lap_number - nums[i - 1]) <= (nums[i] - lap_number):
+            i -= 1
+        return self._row(int(rows[i]))
+
+    def _row(self, pos: int | None):
+        if pos is None:
+            return None
+        return self.laps.iloc[pos]
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def get_lap_index(session) -> LapIndex | None:
+    """
+    LapIndex for a loaded session, built once per session (see session_memo).
+    The session loader never reloads a shared session (upgrades replace it and drop its
+    memo), so the session's laps cannot change under a memoized index.
+    None when the session has no laps.
+    """
+    laps = getattr(session, "laps", None) if session is not None else None
+    if laps is None or len(laps) == 0:
+        return None
+    return session_memo(session, "lap_index", lambda: build_lap_index(laps))
+
+
+def build_lap_index(laps: pd.DataFrame) -> LapIndex:
+    n = len(laps)
+    df = pd.DataFrame(
+        {
+            "Driver": laps["Driver"].astype(str).str.strip().str.upper().to_numpy(),
+            "LapNumber": pd.to_numeric(laps["LapNumber"], errors="coerce").to_numpy(dtype=float)
+            if "LapNumber" in laps.columns
+            else np.full(n, np.nan),
+            "LapTime(s)": pd.to_timedelta(laps["LapTime"], errors="coerce").dt.total_seconds().to_numpy()
+            if "LapTime" in laps.columns
+            else np.full(n, np.nan),
+            "PB": laps["IsPersonalBest"].fillna(False).astype(bool).to_numpy()
+            if "IsPersonalBest" in laps.columns
+            else np.zeros(n, dtype=bool),
+            "Pos": np.arange(n),
+        }
+    )
+
+    numbered = df.dropna(subset=["LapNumber"])
+    # Reversed so the first row of a duplicated (driver, lap) wins
+    rows = dict(zip(zip(numbered["Driver"][::-1], numbered["LapNumber"][::-1]), numbered["Pos"][::-1]))
+
+    timed = df.dropna(subset=["LapTime(s)"])
+    fastest = (
+        timed.sort_values(["Driver", "PB", "LapTime(s)", "Pos"], ascending=[True, False, True, True], kind="stable")
+        .drop_duplicates("Driver")
+    )
+
+    first = df.drop_duplicates("Driver").set_index("Driver")["Pos"].to_dict()
+    first.update(timed.drop_duplicates("Driver").set_index("Driver")["Pos"].to_dict())
+
+    srt = numbered.sort_values(["Driver", "LapNumber", "Pos"], kind="stable").drop_duplicates(["Driver", "LapNumber"])
+    numbers = {
+        drv: (g["LapNumber"].to_numpy(dtype=float), g["Pos"].to_numpy(dtype=np.int64))
+        for drv, g in srt.groupby("Driver", sort=False)
+    }
+
+    return LapIndex(
+        laps=laps,
+        rows={(str(d), float(ln)): int(p) for (d, ln), p in rows.items()},
+        fastest={str(d): int(p) for d, p in zip(fastest["Driver"], fastest["Pos"])},
+        first={str(d): int(p) for d, p in first.items()},
+        numbers=numbers,
+    )
+
+
+def _norm(driver: str) -> str:
+    return (driver or "").strip().upper()
@@ -7,6 +7,10 @@ from typing import Iterable, Optional
 import numpy as np
 import pandas as pd
 
+from fpd.analytics.lap_digest import lap_digest
+from fpd.analytics.lap_index import get_lap_index
+from fpd.data.telemetry_store import lap_telemetry
+
 
 # -----------------------------
 # Data models
@@ -35,8 +39,7 @@ def fastest_laps_table(session, drivers: Optional[Iterable[str]] = None) -> pd.D
       Team, Driver, LapNumber, LapTime(s), S1(s), S2(s), S3(s), Compound, TopSpeed(km/h)
 
     Note:
-      - Top speed uses telemetry and may be slow if many drivers are selected.
-      - You can later cache per-driver telemetry results if needed.
+      - Top speed comes from the session LapDigest (no per-lap telemetry).
     """
     if session is None:
         return pd.DataFrame()
@@ -63,9 +66,11 @@ def fastest_laps_table(session, drivers: Optional[Iterable[str]] = None) -> pd.D
             return pd.DataFrame()
         fastest = timed.sort_values("LapTime").groupby("Driver", as_index=False).first()
 
+    top_speeds = top_speed_lookup(session)
+
     rows: list[dict] = []
     for _, lap in fastest.iterrows():
-        rows.append(_fastest_lap_row(lap))
+        rows.append(_fastest_lap_row(lap, top_speeds))
 
     df = pd.DataFrame(rows)
 
@@ -82,44 +87,40 @@ def pick_driver_lap(session, driver: str, lap_number: int | None = None):
       - lap_number None => fastest lap
       - lap_number specified => closest matching lap number
     """
-    if session is None:
-        return None
-    laps = getattr(session, "laps", None)
-    if laps is None or len(laps) == 0:
+    index = get_lap_index(session)
+    if index is None:
         return None
 
     drv = (driver or "").strip().upper()
     if not drv:
         return None
 
-    drv_laps = laps.pick_driver(drv)
-    if drv_laps is None or len(drv_laps) == 0:
-        return None
+    return index.pick(drv, None if lap_number is None else int(lap_number))
 
-    if lap_number is None:
-        try:
-            lap = drv_laps.pick_fastest()
-            if hasattr(lap, "iloc"):
-                lap = lap.iloc[0]
-            return lap
-        except Exception:
-            pass
 
-        timed = drv_laps.dropna(subset=["LapTime"])
-        return timed.iloc[0] if len(timed) > 0 else drv_laps.iloc[0]
+def lap_top_speeds(session) -> pd.DataFrame:
+    """
+    Max car-data speed for every lap of the session (all drivers).
+
+    Output columns:
+      Driver, LapNumber, TopSpeed(km/h)
 
-    # specific lap number (best-effort)
-    nums = pd.to_numeric(drv_laps["LapNumber"], errors="coerce")
-    if nums.isna().all():
-        return drv_laps.iloc[0]
+    A view of the session LapDigest (one vectorized pass over session car data,
+    built once per session), instead of one get_telemetry() merge per lap.
+    """
+    dg = lap_digest(session)
+    return dg[["Driver", "LapNumber", "MaxSpeed(km/h)"]].rename(columns={"MaxSpeed(km/h)": "TopSpeed(km/h)"})
 
-    target = int(lap_number)
-    exact = drv_laps[nums == target]
-    if len(exact) > 0:
-        return exact.iloc[0]
 
-    idx = (nums - target).abs().idxmin()
-    return drv_laps.loc[idx]
+def top_speed_lookup(session) -> dict[tuple[str, int], float]:
+    """
+    {(Driver, LapNumber): top speed} view of lap_top_speeds().
+    """
+    df = lap_top_speeds(session).dropna(subset=["LapNumber", "TopSpeed(km/h)"])
+    return {
+        (str(d), int(n)): float(v)
+        for d, n, v in zip(df["Driver"], df["LapNumber"], df["TopSpeed(km/h)"])
+    }
 
 
 def compute_top_speed_kmh(lap) -> float | None:
@@ -128,7 +129,7 @@ def compute_top_speed_kmh(lap) -> float | None:
     Returns None if telemetry unavailable.
     """
     try:
-        tel = lap.get_telemetry()
+        tel = lap_telemetry(lap, ("Speed",))
     except Exception:
         return None
 
@@ -144,7 +145,7 @@ def compute_top_speed_kmh(lap) -> float | None:
 # -----------------------------
 # Internals
 # -----------------------------
-def _fastest_lap_row(lap) -> dict:
+def _fastest_lap_row(lap, top_speeds: dict[tuple[str, int], float] | None = None) -> dict:
     driver = str(lap.get("Driver", "")).strip()
     team = str(lap.get("Team", "")).strip() if "Team" in lap else None
     compound = str(lap.get("Compound", "")).strip() if "Compound" in lap else None
@@ -155,7 +156,10 @@ def _fastest_lap_row(lap) -> dict:
     s2_s = _td_sec(lap.get("Sector2Time", None))
     s3_s = _td_sec(lap.get("Sector3Time", None))
 
-    top_speed = compute_top_speed_kmh(lap)
+    if top_speeds is not None:
+        top_speed = top_speeds.get((driver.upper(), lap_no)) if lap_no is not None else None
+    else:
+        top_speed = compute_top_speed_kmh(lap)
 
     return {
         "Team": team,
@@ -206,52 +206,46 @@ def _auto_detect_stints(lap_times: pd.DataFrame, min_laps: int = 6) -> pd.DataFr
       - Large lap number gaps (pit / missing data proxy)
 
     This is intentionally simple, but works decently as a baseline.
+    Boundaries for every driver at once: grouped shift/diff flag a new stint,
+    a grouped cumsum of the flags numbers the stints (short stints keep their id).
     """
     min_laps = max(3, int(min_laps))
-    rows = []
-
-    for driver, ddf in lap_times.groupby("Driver", sort=False):
-        ddf = ddf.sort_values("LapNumber").reset_index(drop=True)
+    cols = ["Driver", "StintId", "LapStart", "LapEnd", "Laps", "Compound"]
+    if lap_times.empty:
+        return pd.DataFrame(columns=cols)
 
-        # Identify boundaries: compound change OR lap gap > 1
-        comp = ddf["Compound"].astype(str).fillna("UNK")
-        lapn = ddf["LapNumber"].astype(int).to_numpy()
+    # Drivers keep their first-appearance order (like groupby(sort=False)), laps by number
+    first_seen = pd.factorize(lap_times["Driver"])[0]
+    df = lap_times.iloc[np.lexsort((lap_times["LapNumber"].to_numpy(), first_seen))]
+    by_driver = df["Driver"]
 
-        comp_change = comp.ne(comp.shift(1)).fillna(False).to_numpy()
-        gap_break = np.zeros_like(comp_change, dtype=bool)
-        gap_break[1:] = (lapn[1:] - lapn[:-1]) > 1
+    # Identify boundaries: compound change OR lap gap > 1 (first lap of a driver always starts one)
+    comp = df["Compound"].astype(str).fillna("UNK")
+    lapn = df["LapNumber"].astype(int)
+    comp_change = comp.ne(comp.groupby(by_driver, sort=False).shift(1))
+    gap_break = lapn.groupby(by_driver, sort=False).diff().gt(1)
+    stint_id = (comp_change | gap_break).astype(int).groupby(by_driver, sort=False).cumsum()
 
-        boundary = comp_change | gap_break
-        # start indices of segments
-        start_idxs = np.where(boundary)[0]
-        if len(start_idxs) == 0 or start_idxs[0] != 0:
-            start_idxs = np.insert(start_idxs, 0, 0)
+    grouped = df.assign(StintId=stint_id.to_numpy(), LapNumber=lapn.to_numpy()).groupby(["Driver", "StintId"], sort=False)
+    stints = grouped.agg(
+        LapStart=("LapNumber", "first"),
+        LapEnd=("LapNumber", "last"),
+        Laps=("LapNumber", "size"),
+    ).reset_index()
+    # Majority compound per stint (ngroup(sort=False) numbers groups in agg row order)
+    stints["Compound"] = _group_modes(grouped.ngroup().to_numpy(), grouped.ngroups, df["Compound"])
 
-        # end indices are next start - 1, last to end
-        for stint_id, start in enumerate(start_idxs, start=1):
-            end = (start_idxs[stint_id - 1 + 1] - 1) if (stint_id - 1 + 1) < len(start_idxs) else len(ddf) - 1
-
-            seg = ddf.iloc[start : end + 1]
-            if seg.shape[0] < min_laps:
-                continue
-
-            rows.append(
-                {
-                    "Driver": driver,
-                    "StintId": stint_id,
-                    "LapStart": int(seg["LapNumber"].iloc[0]),
-                    "LapEnd": int(seg["LapNumber"].iloc[-1]),
-                    "Laps": int(seg.shape[0]),
-                    "Compound": _mode_or_none(seg["Compound"]),
-                }
-            )
-
-    return pd.DataFrame(rows)
+    stints = stints[stints["Laps"] >= min_laps].reset_index(drop=True)
+    return stints[cols]
 
 
 def _assign_stint_ids(lap_times: pd.DataFrame, stints: pd.DataFrame) -> pd.DataFrame:
     """
     Adds StintId to each lap row based on stint ranges.
+
+    One sorted interval join: stints are keyed by driver_code * span + LapStart, each lap
+    finds the last stint starting at/before it with np.searchsorted and keeps it if the
+    lap is not past that stint's LapEnd. Assumes a driver's stints do not overlap.
     """
     lap_times = lap_times.copy()
     lap_times["StintId"] = pd.NA
@@ -259,14 +253,24 @@ def _assign_stint_ids(lap_times: pd.DataFrame, stints: pd.DataFrame) -> pd.DataF
     if stints is None or stints.empty:
         return lap_times
 
-    for _, s in stints.iterrows():
-        mask = (
-            (lap_times["Driver"] == s["Driver"])
-            & (lap_times["LapNumber"].between(int(s["LapStart"]), int(s["LapEnd"])))
-        )
-        lap_times.loc[mask, "StintId"] = int(s["StintId"])
+    drivers = pd.Index(pd.unique(stints["Driver"]))
+    s_code = drivers.get_indexer(stints["Driver"])
+    l_code = drivers.get_indexer(lap_times["Driver"])                  # -1: driver without stints
 
-    lap_times["StintId"] = pd.to_numeric(lap_times["StintId"], errors="coerce").astype("Int64")
+    lap_start = stints["LapStart"].to_numpy(dtype=float)
+    lap_end = stints["LapEnd"].to_numpy(dtype=float)
+    lap_no = pd.to_numeric(lap_times["LapNumber"], errors="coerce").to_numpy(dtype=float)
+
+    span = float(np.nanmax(np.r_[lap_end, lap_no, 0.0])) + 2.0
+    s_key = s_code * span + lap_start
+    order = np.argsort(s_key, kind="stable")
+
+    pos = np.searchsorted(s_key[order], l_code * span + lap_no, side="right") - 1
+    hit = order[np.maximum(pos, 0)]
+    ok = (pos >= 0) & (l_code >= 0) & (s_code[hit] == l_code) & (lap_no <= lap_end[hit])
+
+    ids = np.where(ok, stints["StintId"].to_numpy(dtype=float)[hit], np.nan)
+    lap_times["StintId"] = pd.array(ids, dtype="Float64").astype("Int64")
     return lap_times
 
 
@@ -279,58 +283,70 @@ def _compute_stint_metrics(lap_times: pd.DataFrame) -> pd.DataFrame:
       - Slope(s/lap): linear fit lap time vs lap number
       - ConsistencyStd(s): std dev of lap times
       - AvgLap(s): mean lap time
+
+    Every stint at once from grouped sums (n, Σx, Σy, Σxy, Σx², Σy² via np.bincount) and
+    the closed-form least-squares slope / sample std; x and y are taken relative to each
+    stint's first lap so the sums stay small. Compound = most frequent value per stint (grouped value counts).
     """
-    rows = []
+    cols = ["Driver", "StintId", "Laps", "Compound", "Slope(s/lap)", "ConsistencyStd(s)", "AvgLap(s)"]
 
-    valid = lap_times.dropna(subset=["StintId", "LapTime(s)", "LapNumber"]).copy()
+    valid = lap_times.dropna(subset=["StintId", "LapTime(s)", "LapNumber"])
     if valid.empty:
         return pd.DataFrame(columns=["Driver", "StintId", "Slope(s/lap)", "ConsistencyStd(s)", "AvgLap(s)", "Compound", "Laps"])
 
-    for (driver, stint_id), seg in valid.groupby(["Driver", "StintId"], sort=False):
-        y = seg["LapTime(s)"].astype(float).to_numpy()
-        x = seg["LapNumber"].astype(int).to_numpy()
-
-        slope = _linear_slope(x, y)
-        std = float(np.nanstd(y, ddof=1)) if len(y) >= 2 else np.nan
-        avg = float(np.nanmean(y)) if len(y) > 0 else np.nan
-        compound = _mode_or_none(seg["Compound"])
-
-        rows.append(
-            {
-                "Driver": driver,
-                "StintId": int(stint_id),
-                "Laps": int(seg.shape[0]),
-                "Compound": compound,
-                "Slope(s/lap)": slope,
-                "ConsistencyStd(s)": std,
-                "AvgLap(s)": avg,
-            }
-        )
-
-    return pd.DataFrame(rows).sort_values(["Driver", "StintId"]).reset_index(drop=True)
-
-
-def _linear_slope(x: np.ndarray, y: np.ndarray) -> float:
+    keys = ["Driver", "StintId"]
+    grouped = valid.groupby(keys, sort=True)
+    codes = grouped.ngroup().to_numpy()
+    n_groups = grouped.ngroups
+
+    # Per-stint reference (first lap), in ngroup order
+    x0 = grouped["LapNumber"].first().astype(int).to_numpy(dtype=float)
+    y0 = grouped["LapTime(s)"].first().astype(float).to_numpy()
+    x = valid["LapNumber"].astype(int).to_numpy(dtype=float) - x0[codes]
+    y = valid["LapTime(s)"].astype(float).to_numpy() - y0[codes]
+
+    n = np.bincount(codes, minlength=n_groups).astype(float)
+    sx = np.bincount(codes, weights=x, minlength=n_groups)
+    sy = np.bincount(codes, weights=y, minlength=n_groups)
+    sxy = np.bincount(codes, weights=x * y, minlength=n_groups)
+    sxx = np.bincount(codes, weights=x * x, minlength=n_groups)
+    syy = np.bincount(codes, weights=y * y, minlength=n_groups)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = sxx - sx * sx / n
+        slope = np.where((n >= 2) & (denom > 0), (sxy - sx * sy / n) / denom, np.nan)
+        var = np.maximum(syy - sy * sy / n, 0.0) / (n - 1)
+        std = np.where(n >= 2, np.sqrt(var), np.nan)
+        avg = np.where(n > 0, y0 + sy / n, np.nan)
+
+    out = grouped.size().rename("Laps").reset_index()
+    out["Compound"] = _group_modes(codes, n_groups, valid["Compound"])
+    out["Slope(s/lap)"] = slope
+    out["ConsistencyStd(s)"] = std
+    out["AvgLap(s)"] = avg
+    out["StintId"] = out["StintId"].astype(int)
+    out["Laps"] = out["Laps"].astype(int)
+    return out[cols]
+
+
+def _group_modes(codes: np.ndarray, n_groups: int, values: pd.Series) -> list:
     """
-    Robust-ish slope for y ~ a + b*x (returns b).
+    Most frequent non-null value per group (smallest value on ties, like Series.mode()),
+    from one bincount over (group, value) pairs; None where a group has no values.
     """
-    if len(x) < 2:
-        return np.nan
-
-    mask = np.isfinite(x) & np.isfinite(y)
-    x2 = x[mask]
-    y2 = y[mask]
-    if len(x2) < 2:
-        return np.nan
-
-    # Center x for numerical stability
-    x0 = x2 - np.mean(x2)
-    denom = np.sum(x0 * x0)
-    if denom <= 0:
-        return np.nan
-
-    b = float(np.sum(x0 * (y2 - np.mean(y2))) / denom)
-    return b
+    present = values.notna().to_numpy()
+    val_codes, uniques = pd.factorize(values[present].astype(str), sort=True)
+    if len(uniques) == 0:
+        return [None] * n_groups
+
+    counts = np.bincount(
+        codes[present] * len(uniques) + val_codes, minlength=n_groups * len(uniques)
+    ).reshape(n_groups, len(uniques))
+    best = np.argmax(counts, axis=1)                 # first max => smallest value (uniques sorted)
+    has = counts[np.arange(n_groups), best] > 0
+
+    names = np.asarray(uniques, dtype=object)
+    return [str(names[b]) if h else None for b, h in zip(best, has)]
 
 
 # -----------------------------
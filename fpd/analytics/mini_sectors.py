@@ -0,0 +1,229 @@
+# fpd/analytics/mini_sectors.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from fpd.analytics.circuit_geometry import get_circuit_geometry
+from fpd.analytics.lap_index import get_lap_index
+from fpd.analytics.session_samples import SessionSamples, get_session_samples
+from fpd.core.config import CONFIG
+from fpd.data.session_memo import session_memo
+from fpd.data.telemetry_store import lap_telemetry
+
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True, eq=False)
+class MiniSectors:
+    """
+    Mini-sector times for every timed lap of a session.
+
+    - laps: Driver, LapNumber, LapTime(s) — row i <=> times[i]
+    - times: (laps, K) float32 seconds; mini-sector k covers lap fraction [k/K, (k+1)/K)
+    - length_m: reference lap length (median integrated distance of the timed laps)
+    """
+    laps: pd.DataFrame
+    times: np.ndarray
+    length_m: float
+
+    @property
+    def k(self) -> int:
+        return int(self.times.shape[1])
+
+    def boundaries_m(self) -> np.ndarray:
+        return np.linspace(0.0, self.length_m, self.k + 1)
+
+    def fastest(self, drivers: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        MiniSector, Start(m), End(m), Driver, LapNumber, Time(s) — quickest lap per mini-sector
+        (optionally among some drivers only).
+        """
+        cols = ["MiniSector", "Start(m)", "End(m)", "Driver", "LapNumber", "Time(s)"]
+        times = self.times
+        laps = self.laps
+        if drivers is not None:
+            keep = laps["Driver"].isin({d.strip().upper() for d in drivers}).to_numpy()
+            times, laps = times[keep], laps[keep].reset_index(drop=True)
+
+        if len(laps) == 0 or self.k == 0:
+            return pd.DataFrame(columns=cols)
+
+        filled = np.where(np.isnan(times), np.inf, times)
+        best = np.argmin(filled, axis=0)
+        best_t = times[best, np.arange(self.k)]
+        b = self.boundaries_m()
+
+        df = pd.DataFrame(
+            {
+                "MiniSector": np.arange(1, self.k + 1),
+                "Start(m)": b[:-1],
+                "End(m)": b[1:],
+                "Driver": laps["Driver"].to_numpy()[best],
+                "LapNumber": laps["LapNumber"].to_numpy()[best],
+                "Time(s)": best_t.astype(float),
+            },
+            columns=cols,
+        )
+        df.loc[~np.isfinite(df["Time(s)"]), ["Driver", "LapNumber"]] = None
+        return df
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def get_mini_sectors(session, k: int = CONFIG.mini_sectors) -> MiniSectors:
+    """
+    MiniSectors for a loaded session, built once per K (see session_memo).
+    """
+    k = max(1, int(k))
+    return session_memo(session, f"mini_sectors::{k}", lambda: build_mini_sectors(session, k))
+
+
+def build_mini_sectors(session, k: int = CONFIG.mini_sectors) -> MiniSectors:
+    """
+    One vectorized pass over the session samples (see session_samples):
+      - per-sample lap distance from a trapezoidal cumsum of Speed, restarted per lap
+      - distance normalized to lap fraction, so laps line up despite small length differences
+      - elapsed session time at every mini-sector boundary of every lap from one
+        np.searchsorted over lap_index * 2 + fraction (lap start/end times close the ends)
+    """
+    samples = get_session_samples(session)
+    lap_times = _lap_times(session, samples)
+    return _mini_sectors(samples, lap_times, k)
+
+
+def fastest_sector_map(session, drivers: Optional[Iterable[str]] = None, k: int = CONFIG.mini_sectors) -> pd.DataFrame:
+    """
+    Track outline points coloured by the fastest driver of each mini-sector:
+      X, Y, MiniSector, Driver
+    Outline = the circuit DB outline (see circuit_geometry), else X/Y of the fastest lap
+    among the drivers (the session's fastest if drivers is None).
+    """
+    cols = ["X", "Y", "MiniSector", "Driver"]
+    ms = get_mini_sectors(session, k)
+    best = ms.fastest(drivers)
+    if best.empty:
+        return pd.DataFrame(columns=cols)
+
+    outline = _track_outline(session, ms, drivers)
+    if outline is None or outline.empty:
+        return pd.DataFrame(columns=cols)
+
+    dist = outline["Distance"].to_numpy(dtype=float)
+    total = np.nanmax(dist) if len(dist) else np.nan
+    if not np.isfinite(total) or total <= 0:
+        return pd.DataFrame(columns=cols)
+
+    sector = np.clip((dist / total * ms.k).astype(int), 0, ms.k - 1)
+    return pd.DataFrame(
+        {
+            "X": outline["X"].to_numpy(),
+            "Y": outline["Y"].to_numpy(),
+            "MiniSector": sector + 1,
+            "Driver": best["Driver"].to_numpy()[sector],
+        },
+        columns=cols,
+    )
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _track_outline(session, ms: MiniSectors, drivers: Optional[Iterable[str]]) -> pd.DataFrame | None:
+    """
+    Distance, X, Y of the track: circuit DB outline when available, else reference lap telemetry.
+    """
+    try:
+        geometry = get_circuit_geometry(session)
+    except Exception:
+        geometry = None
+    if geometry is not None and not geometry.outline.empty:
+        return geometry.rotated_outline()
+
+    index = get_lap_index(session)
+    pool = ms.laps if drivers is None else ms.laps[ms.laps["Driver"].isin({d.strip().upper() for d in drivers})]
+    if index is None or pool.empty:
+        return None
+    ref = pool.loc[pool["LapTime(s)"].idxmin()]
+    lap = index.get(ref["Driver"], ref["LapNumber"])
+    if lap is None:
+        return None
+
+    try:
+        tel = lap_telemetry(lap, ("X", "Y"))
+    except Exception:
+        return None
+    if tel is None or tel.empty or not {"X", "Y"}.issubset(tel.columns):
+        return None
+    return tel
+
+
+def _lap_times(session, samples: SessionSamples) -> np.ndarray:
+    """
+    LapTime (s) per SessionSamples lap (NaN when untimed).
+    """
+    laps = getattr(session, "laps", None)
+    if laps is None or "LapTime" not in getattr(laps, "columns", []) or samples.n_laps == 0:
+        return np.full(samples.n_laps, np.nan)
+    lt = pd.to_timedelta(laps["LapTime"], errors="coerce").dt.total_seconds().to_numpy(dtype=float)
+    return lt[samples.laps["RowPos"].to_numpy(dtype=np.int64)]
+
+
+def _mini_sectors(samples: SessionSamples, lap_times: np.ndarray, k: int) -> MiniSectors:
+    cols = ["Driver", "LapNumber", "LapTime(s)"]
+    speed = samples.channels.get("Speed")
+    counts = samples.counts()
+    if speed is None or samples.n_laps == 0:
+        return MiniSectors(pd.DataFrame(columns=cols), np.zeros((0, k), dtype=np.float32), np.nan)
+
+    lap_idx = samples.lap_idx
+    t = samples.time_s
+
+    # Distance travelled since the lap's first sample
+    same_lap = lap_idx[1:] == lap_idx[:-1]
+    v_ms = (speed[1:] + speed[:-1]) / 2.0 / 3.6
+    step = np.where(same_lap & np.isfinite(v_ms), v_ms * np.diff(t), 0.0)
+    cum = np.concatenate(([0.0], np.cumsum(step)))
+    dist = cum - cum[samples.offsets[:-1][lap_idx]]
+
+    total = np.full(samples.n_laps, np.nan)
+    nonempty = counts > 0
+    total[nonempty] = dist[samples.offsets[1:][nonempty] - 1]
+
+    sel = np.isfinite(lap_times) & (counts >= 2) & (total > 0)
+    if not sel.any():
+        return MiniSectors(pd.DataFrame(columns=cols), np.zeros((0, k), dtype=np.float32), np.nan)
+
+    frac = dist / np.where(total > 0, total, np.nan)[lap_idx]
+    key = lap_idx * 2.0 + np.nan_to_num(frac, nan=0.0)            # sorted: laps apart, fraction within
+
+    rows = np.nonzero(sel)[0]
+    f = np.arange(1, k) / k
+    q = rows[:, None] * 2.0 + f[None, :]                            # (laps, K - 1)
+
+    start = samples.offsets[:-1][rows][:, None]
+    end = samples.offsets[1:][rows][:, None] - 1
+    hi = np.clip(np.searchsorted(key, q, side="left"), start, end)
+    lo = np.clip(hi - 1, start, end)
+
+    span = key[hi] - key[lo]
+    w = np.divide(q - key[lo], span, out=np.zeros_like(q), where=span > 0)
+    t_inner = t[lo] + (t[hi] - t[lo]) * np.clip(w, 0.0, 1.0)
+
+    lap_start = samples.laps["LapStart(s)"].to_numpy(dtype=float)[rows]
+    lap_end = samples.laps["LapEnd(s)"].to_numpy(dtype=float)[rows]
+    bounds = np.column_stack([lap_start, t_inner, lap_end])
+
+    laps = samples.laps.iloc[rows][["Driver", "LapNumber"]].reset_index(drop=True)
+    laps["LapTime(s)"] = lap_times[rows]
+
+    return MiniSectors(
+        laps=laps,
+        times=np.diff(bounds, axis=1).astype(np.float32),
+        length_m=float(np.median(total[rows])),
+    )
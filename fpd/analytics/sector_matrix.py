@@ -0,0 +1,186 @@
+# fpd/analytics/sector_matrix.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from fpd.data.session_memo import session_memo
+
+
+SECTOR_MATRIX_COLUMNS: tuple[str, ...] = ("S1", "S2", "S3", "Lap")
+
+# Matrix column -> (time column, session time at which that time is set)
+_SOURCE_COLUMNS: dict[str, tuple[str, str]] = {
+    "S1": ("Sector1Time", "Sector1SessionTime"),
+    "S2": ("Sector2Time", "Sector2SessionTime"),
+    "S3": ("Sector3Time", "Sector3SessionTime"),
+    "Lap": ("LapTime", "Time"),
+}
+
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True, eq=False)
+class SectorMatrix:
+    """
+    Sector and lap times of every lap of a session.
+
+    - laps: Driver, LapNumber — row i <=> session.laps row i <=> times[i]
+    - times: (laps, 4) float64 seconds, columns S1, S2, S3, Lap (NaN when missing)
+    - personal_best: (laps, 4) bool, the time improved the driver's best so far ("green")
+    - session_best: (laps, 4) bool, the time improved the session best so far ("purple";
+      a session best is always a personal best too)
+    - deleted: (laps,) bool, the lap was deleted (track limits etc.)
+    "So far" follows the session time each time was set at; deleted laps never set a best.
+    """
+    laps: pd.DataFrame
+    times: np.ndarray
+    personal_best: np.ndarray
+    session_best: np.ndarray
+    deleted: np.ndarray
+
+    @cached_property
+    def driver_rows(self) -> dict[str, np.ndarray]:
+        """
+        DRIVER -> row positions of their laps (session order).
+        """
+        groups = self.laps.groupby("Driver", sort=False).indices
+        return {str(d): np.asarray(rows, dtype=np.int64) for d, rows in groups.items()}
+
+    def rows_for(self, drivers: Optional[Iterable[str]] = None) -> np.ndarray:
+        """
+        Row positions of the given drivers' laps (all laps if drivers is None), sorted.
+        """
+        if drivers is None:
+            return np.arange(len(self.laps))
+        parts = [self.driver_rows.get(d.strip().upper()) for d in drivers if d and d.strip()]
+        parts = [p for p in parts if p is not None]
+        return np.sort(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int64)
+
+    def deltas(self, rows: np.ndarray, baseline_row: int) -> np.ndarray:
+        """
+        (len(rows), 4) times minus the baseline lap's times.
+        """
+        return self.times[rows] - self.times[baseline_row]
+
+    def frame(self, drivers: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """
+        Driver, LapNumber, S1, S2, S3, Lap, then <col> PB / <col> SB flags for each time column.
+        """
+        rows = self.rows_for(drivers)
+        df = self.laps.iloc[rows].reset_index(drop=True)
+        for j, col in enumerate(SECTOR_MATRIX_COLUMNS):
+            df[col] = self.times[rows, j]
+        for j, col in enumerate(SECTOR_MATRIX_COLUMNS):
+            df[f"{col} PB"] = self.personal_best[rows, j]
+            df[f"{col} SB"] = self.session_best[rows, j]
+        return df
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def get_sector_matrix(session) -> SectorMatrix | None:
+    """
+    SectorMatrix for a loaded session, built once per session (see session_memo).
+    Sessions are never reloaded in place (upgrades replace them and drop their memo),
+    so the Deleted flags it was built from are final.
+    None when the session has no laps.
+    """
+    laps = getattr(session, "laps", None) if session is not None else None
+    if laps is None or len(laps) == 0:
+        return None
+    return session_memo(session, "sector_matrix", lambda: build_sector_matrix(laps))
+
+
+def build_sector_matrix(laps: pd.DataFrame) -> SectorMatrix:
+    """
+    All time columns are converted in one pass (stacked timedeltas -> float64 seconds).
+    Running bests are cumulative minima in the order the times were set:
+      - session best: np.minimum.accumulate over all laps
+      - personal best: the same accumulate over laps grouped by driver, each driver's
+        values offset so earlier groups never lower a later group's running minimum
+    """
+    n = len(laps)
+    drivers = laps["Driver"].astype(str).str.strip().str.upper().to_numpy()
+    lap_numbers = (
+        pd.to_numeric(laps["LapNumber"], errors="coerce").to_numpy(dtype=float)
+        if "LapNumber" in laps.columns
+        else np.full(n, np.nan)
+    )
+
+    times = _seconds_matrix(laps, [src for src, _ in _SOURCE_COLUMNS.values()])
+    set_at = _seconds_matrix(laps, [at for _, at in _SOURCE_COLUMNS.values()])
+
+    deleted = (
+        laps["Deleted"].fillna(False).astype(bool).to_numpy()
+        if "Deleted" in laps.columns
+        else np.zeros(n, dtype=bool)
+    )
+    counted = times.copy()
+    counted[deleted] = np.nan
+
+    codes, _ = pd.factorize(drivers)
+    personal = np.zeros((n, len(SECTOR_MATRIX_COLUMNS)), dtype=bool)
+    session = np.zeros_like(personal)
+    for j in range(len(SECTOR_MATRIX_COLUMNS)):
+        session[:, j] = _running_best(counted[:, j], set_at[:, j], np.zeros(n, dtype=np.int64))
+        personal[:, j] = _running_best(counted[:, j], set_at[:, j], codes)
+
+    return SectorMatrix(
+        laps=pd.DataFrame({"Driver": drivers, "LapNumber": lap_numbers}),
+        times=times,
+        personal_best=personal,
+        session_best=session,
+        deleted=deleted,
+    )
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _seconds_matrix(laps: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """
+    Timedelta columns -> (laps, len(columns)) float64 seconds; missing columns are NaN.
+    """
+    n = len(laps)
+    present = [c for c in columns if c in laps.columns]
+    out = np.full((n, len(columns)), np.nan)
+    if not present or n == 0:
+        return out
+    stacked = pd.to_timedelta(laps[present].to_numpy().ravel(order="F"), errors="coerce")
+    secs = (np.asarray(stacked.asi8, dtype=float) / 1e9).reshape(len(present), n).T
+    secs[np.asarray(stacked.isna()).reshape(len(present), n).T] = np.nan
+    for k, c in enumerate(present):
+        out[:, columns.index(c)] = secs[:, k]
+    return out
+
+
+def _running_best(values: np.ndarray, set_at: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    True where values[i] is lower than every earlier value of its group
+    (earlier = smaller set_at; rows without set_at keep their row order, after the rest).
+    """
+    n = len(values)
+    finite = np.isfinite(values)
+    if not finite.any():
+        return np.zeros(n, dtype=bool)
+
+    when = np.where(np.isfinite(set_at), set_at, np.inf)
+    order = np.lexsort((np.arange(n), when, groups))
+    v = np.where(finite, values, np.inf)[order]
+    g = groups[order]
+
+    # Offsets decrease with the group code: a group's values all sit below the previous groups'
+    span = float(np.max(values[finite]) - np.min(values[finite])) + 1.0
+    shifted = v + (g.max() - g) * span
+    prev = np.concatenate(([np.inf], np.minimum.accumulate(shifted)[:-1]))
+
+    out = np.zeros(n, dtype=bool)
+    out[order] = np.isfinite(v) & (shifted < prev)
+    return out
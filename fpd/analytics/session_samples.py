@@ -0,0 +1,193 @@
+# fpd/analytics/session_samples.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from fpd.data.session_memo import session_memo
+
+
+CAR_CHANNELS: tuple[str, ...] = ("Speed", "RPM", "nGear", "Throttle", "Brake", "DRS")
+
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True)
+class SessionSamples:
+    """
+    Every car-data sample of a session, assigned to its (driver, lap).
+
+    - laps: one row per lap, row i <=> lap index i
+        Driver, DriverNumber, LapNumber, LapStart(s), LapEnd(s), RowPos (position in session.laps)
+    - Samples are sorted by lap index, so lap i is the slice [offsets[i], offsets[i + 1])
+    - Samples outside every lap window (garage, between laps) are dropped
+    """
+    laps: pd.DataFrame
+    lap_idx: np.ndarray                # int64 per sample
+    offsets: np.ndarray                # int64, len(laps) + 1
+    time_s: np.ndarray                 # SessionTime (s) per sample
+    channels: dict[str, np.ndarray]    # CAR_CHANNELS present in car_data, float64 per sample
+
+    @property
+    def n_laps(self) -> int:
+        return len(self.laps)
+
+    def counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def reduce(self, values: np.ndarray, ufunc: np.ufunc = np.fmax) -> np.ndarray:
+        """
+        Grouped reduction per lap in one pass (ufunc.reduceat over lap slices).
+        Laps without samples get NaN.
+        """
+        out = np.full(self.n_laps, np.nan, dtype=float)
+        nonempty = self.counts() > 0
+        if not nonempty.any():
+            return out
+        # Empty laps have no samples between their neighbours, so reducing over the
+        # non-empty starts only still gives each non-empty lap exactly its own slice.
+        out[nonempty] = ufunc.reduceat(values, self.offsets[:-1][nonempty])
+        return out
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def get_session_samples(session) -> SessionSamples:
+    """
+    SessionSamples for a loaded session, built once and shared (see session_memo).
+    """
+    return session_memo(session, "session_samples", lambda: build_session_samples(session))
+
+
+def build_session_samples(session) -> SessionSamples:
+    """
+    Assign every car-data sample to a lap with a single np.searchsorted:
+      - laps and samples are keyed by driver_index * span + session_time_s
+      - a sample belongs to the last lap starting at/before it, if it is not past that lap's end
+    """
+    laps = _lap_windows(getattr(session, "laps", None))
+    car = _concat_car_data(session)
+
+    if laps.empty or car is None:
+        return _empty(laps)
+
+    drv_numbers = sorted(set(laps["DriverNumber"]) | set(car["drv"]))
+    drv_pos = {d: i for i, d in enumerate(drv_numbers)}
+
+    span = float(max(np.nanmax(laps["LapEnd(s)"].to_numpy()), np.nanmax(car["time_s"]))) + 1.0
+
+    lap_drv = laps["DriverNumber"].map(drv_pos).to_numpy(dtype=float)
+    lap_start = lap_drv * span + laps["LapStart(s)"].to_numpy(dtype=float)
+    lap_end = lap_drv * span + laps["LapEnd(s)"].to_numpy(dtype=float)
+
+    order = np.argsort(lap_start, kind="stable")
+    laps = laps.iloc[order].reset_index(drop=True)
+    lap_start = lap_start[order]
+    lap_end = lap_end[order]
+
+    sample_key = np.array([drv_pos[d] for d in car["drv"]], dtype=float)[car["drv_idx"]] * span + car["time_s"]
+
+    pos = np.searchsorted(lap_start, sample_key, side="right") - 1
+    valid = pos >= 0
+    valid[valid] = sample_key[valid] <= lap_end[pos[valid]]
+
+    pos = pos[valid]
+    sort = np.argsort(pos, kind="stable")
+    lap_idx = pos[sort].astype(np.int64)
+
+    offsets = np.searchsorted(lap_idx, np.arange(len(laps) + 1), side="left").astype(np.int64)
+
+    return SessionSamples(
+        laps=laps,
+        lap_idx=lap_idx,
+        offsets=offsets,
+        time_s=car["time_s"][valid][sort],
+        channels={c: v[valid][sort] for c, v in car["channels"].items()},
+    )
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _lap_windows(laps) -> pd.DataFrame:
+    cols = ["Driver", "DriverNumber", "LapNumber", "LapStart(s)", "LapEnd(s)", "RowPos"]
+    if laps is None or len(laps) == 0:
+        return pd.DataFrame(columns=cols)
+    if not {"DriverNumber", "LapStartTime", "Time"}.issubset(laps.columns):
+        return pd.DataFrame(columns=cols)
+
+    df = pd.DataFrame(
+        {
+            "Driver": laps["Driver"].astype(str).str.strip().str.upper().to_numpy(),
+            "DriverNumber": laps["DriverNumber"].astype(str).str.strip().to_numpy(),
+            "LapNumber": pd.to_numeric(laps["LapNumber"], errors="coerce").to_numpy(),
+            "LapStart(s)": _seconds(laps["LapStartTime"]),
+            "LapEnd(s)": _seconds(laps["Time"]),
+            "RowPos": np.arange(len(laps)),
+        }
+    )
+    df = df.dropna(subset=["LapStart(s)", "LapEnd(s)"])
+    return df[df["LapEnd(s)"] > df["LapStart(s)"]].reset_index(drop=True)
+
+
+def _concat_car_data(session) -> dict | None:
+    """
+    session.car_data ({driver_number: Telemetry}) -> flat numpy arrays.
+    """
+    try:
+        car_data = session.car_data
+    except Exception:
+        return None
+    if not car_data:
+        return None
+
+    drvs, drv_idx, times = [], [], []
+    chans: dict[str, list[np.ndarray]] = {c: [] for c in CAR_CHANNELS}
+    for drv, tel in car_data.items():
+        if tel is None or len(tel) == 0 or "SessionTime" not in tel.columns:
+            continue
+        drvs.append(str(drv).strip())
+        n = len(tel)
+        drv_idx.append(np.full(n, len(drvs) - 1, dtype=np.int64))
+        times.append(_seconds(tel["SessionTime"]))
+        for c in CAR_CHANNELS:
+            if c in tel.columns:
+                chans[c].append(pd.to_numeric(tel[c], errors="coerce").to_numpy(dtype=float))
+            else:
+                chans[c].append(np.full(n, np.nan))
+
+    if not drvs:
+        return None
+
+    time_s = np.concatenate(times)
+    finite = np.isfinite(time_s)
+    if not finite.any():
+        return None
+    return {
+        "drv": drvs,
+        "drv_idx": np.concatenate(drv_idx)[finite],
+        "time_s": time_s[finite],
+        "channels": {
+            c: np.concatenate(v)[finite]
+            for c, v in chans.items()
+            if not all(np.isnan(a).all() for a in v)
+        },
+    }
+
+
+def _seconds(s: pd.Series) -> np.ndarray:
+    return pd.to_timedelta(s, errors="coerce").dt.total_seconds().to_numpy(dtype=float)
+
+
+def _empty(laps: pd.DataFrame) -> SessionSamples:
+    return SessionSamples(
+        laps=laps,
+        lap_idx=np.zeros(0, dtype=np.int64),
+        offsets=np.zeros(len(laps) + 1, dtype=np.int64),
+        time_s=np.zeros(0, dtype=float),
+        channels={},
+    )
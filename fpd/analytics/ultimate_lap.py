@@ -0,0 +1,162 @@
+# fpd/analytics/ultimate_lap.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from fpd.analytics.mini_sectors import get_mini_sectors
+from fpd.analytics.sector_matrix import SECTOR_MATRIX_COLUMNS, get_sector_matrix
+from fpd.core.config import CONFIG
+
+
+SegmentSource = Literal["sectors", "mini_sectors"]
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True)
+class UltimateLapResult:
+    """
+    Theoretical best lap per driver.
+      - ranking: Rank, Driver, IdealLap(s), FastestLap(s), LostToIdeal(s), GapToFirst(s)
+      - best_segments: Driver, Segment, Time(s), LapNumber (the lap each best segment came from)
+    """
+    ranking: pd.DataFrame
+    best_segments: pd.DataFrame
+    source: SegmentSource
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def ultimate_laps(
+    session,
+    source: SegmentSource = "sectors",
+    k: int = CONFIG.mini_sectors,
+) -> UltimateLapResult:
+    """
+    Each driver's ideal lap = sum of their best segment times across the whole session.
+
+    source:
+      - "sectors": S1/S2/S3 of every lap from the session SectorMatrix (see sector_matrix;
+        laps flagged Deleted are skipped)
+      - "mini_sectors": the session MiniSectors table (K per lap, see mini_sectors;
+        laps the SectorMatrix flags Deleted are skipped)
+    """
+    matrix = get_sector_matrix(session)
+
+    if source == "mini_sectors":
+        ms = get_mini_sectors(session, k)
+        rows = np.flatnonzero(~_deleted_mask(ms.laps, matrix))
+        laps = ms.laps.iloc[rows]
+        return build_ultimate_laps(
+            laps["Driver"].to_numpy(),
+            laps["LapNumber"].to_numpy(dtype=float),
+            laps["LapTime(s)"].to_numpy(dtype=float),
+            ms.times[rows].astype(float),
+            source=source,
+        )
+
+    if matrix is None:
+        return _empty("sectors")
+
+    rows = np.flatnonzero(~matrix.deleted)
+    times = matrix.times[rows]                       # columns S1, S2, S3, Lap
+    return build_ultimate_laps(
+        matrix.laps["Driver"].to_numpy()[rows],
+        matrix.laps["LapNumber"].to_numpy(dtype=float)[rows],
+        times[:, SECTOR_MATRIX_COLUMNS.index("Lap")],
+        times[:, :3],
+        source="sectors",
+    )
+
+
+def build_ultimate_laps(
+    drivers: np.ndarray,
+    lap_numbers: np.ndarray,
+    lap_times: np.ndarray,
+    times: np.ndarray,
+    source: SegmentSource = "sectors",
+) -> UltimateLapResult:
+    """
+    times: (laps, segments) seconds, NaN where missing; drivers/lap_numbers/lap_times per lap.
+    Per-driver minima come from np.minimum.reduceat over laps grouped by driver.
+    """
+    n_seg = times.shape[1] if times.ndim == 2 else 0
+    if len(drivers) == 0 or n_seg == 0:
+        return _empty(source)
+
+    codes, names = pd.factorize(pd.Series(drivers).astype(str).str.strip().str.upper(), sort=True)
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+
+    filled = np.where(np.isnan(times[order]), np.inf, times[order])
+    best = np.minimum.reduceat(filled, starts, axis=0)                       # (drivers, segments)
+
+    # First lap (in session order) reaching each best time
+    rows = np.arange(len(order))[:, None]
+    hit = filled == best[codes]
+    best_row = np.minimum.reduceat(np.where(hit & np.isfinite(filled), rows, len(order)), starts, axis=0)
+
+    ideal = best.sum(axis=1)
+    ideal = np.where(np.isfinite(ideal), ideal, np.nan)
+
+    lt = np.where(np.isnan(lap_times[order]), np.inf, lap_times[order])
+    fastest = np.minimum.reduceat(lt, starts)
+    fastest = np.where(np.isfinite(fastest), fastest, np.nan)
+
+    ranking = pd.DataFrame(
+        {
+            "Driver": np.asarray(names, dtype=object),
+            "IdealLap(s)": ideal,
+            "FastestLap(s)": fastest,
+            "LostToIdeal(s)": fastest - ideal,
+        }
+    )
+    ranking = ranking.sort_values("IdealLap(s)", na_position="last", kind="stable").reset_index(drop=True)
+    ranking["GapToFirst(s)"] = ranking["IdealLap(s)"] - ranking["IdealLap(s)"].min()
+    ranking.insert(0, "Rank", np.arange(1, len(ranking) + 1))
+
+    valid = best_row < len(order)
+    lap_no = np.full(best.shape, np.nan)
+    lap_no[valid] = lap_numbers[order][best_row[valid]]
+
+    n_drv = len(names)
+    best_segments = pd.DataFrame(
+        {
+            "Driver": np.repeat(np.asarray(names, dtype=object), n_seg),
+            "Segment": np.tile(np.arange(1, n_seg + 1), n_drv),
+            "Time(s)": np.where(np.isfinite(best), best, np.nan).ravel(),
+            "LapNumber": lap_no.ravel(),
+        }
+    )
+    best_segments["LapNumber"] = best_segments["LapNumber"].astype("Int64")
+
+    return UltimateLapResult(ranking=ranking, best_segments=best_segments, source=source)
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _deleted_mask(laps: pd.DataFrame, matrix) -> np.ndarray:
+    """
+    (len(laps),) bool: the (Driver, LapNumber) lap is flagged deleted in the SectorMatrix.
+    """
+    if matrix is None or not matrix.deleted.any():
+        return np.zeros(len(laps), dtype=bool)
+    dropped = matrix.laps[matrix.deleted]
+    deleted = pd.MultiIndex.from_arrays([dropped["Driver"].astype(str), dropped["LapNumber"].astype(float)])
+    drivers = laps["Driver"].astype(str).str.strip().str.upper()
+    return pd.MultiIndex.from_arrays([drivers, laps["LapNumber"].astype(float)]).isin(deleted)
+
+
+def _empty(source: SegmentSource) -> UltimateLapResult:
+    return UltimateLapResult(
+        ranking=pd.DataFrame(columns=["Rank", "Driver", "IdealLap(s)", "FastestLap(s)", "LostToIdeal(s)", "GapToFirst(s)"]),
+        best_segments=pd.DataFrame(columns=["Driver", "Segment", "Time(s)", "LapNumber"]),
+        source=source,
+    )
@@ -0,0 +1,83 @@
+# fpd/components/all_time_selectors.py
+from __future__ import annotations
+
+import streamlit as st
+
+from fpd.analytics.compare import LapRef
+from fpd.components.topbar_selectors import _event_label, _safe_index
+from fpd.core.config import CONFIG
+from fpd.data.selectors_data import (
+    get_available_seasons,
+    get_events_for_season,
+    get_sessions_for_event_key,
+)
+
+
+def render_all_time_selectors(max_laps: int = 4) -> list[LapRef]:
+    """
+    All Time Lap Compare selectors: one row per lap (Season / Event / Session / Driver / Lap).
+    The first row is the baseline. Returns the LapRefs of complete rows only.
+    Driver codes are typed (e.g. VER): listing them would need every session loaded first.
+    """
+    st.markdown("### Laps")
+    n = int(st.number_input("Number of laps", min_value=2, max_value=max_laps, value=2, step=1))
+
+    seasons = get_available_seasons(end=CONFIG.default_season)
+    refs: list[LapRef] = []
+    for i in range(n):
+        ref = _render_lap_row(i, seasons)
+        if ref is not None:
+            refs.append(ref)
+    return refs
+
+
+def _render_lap_row(i: int, seasons: list[int]) -> LapRef | None:
+    c1, c2, c3, c4, c5 = st.columns([1, 2.4, 1.4, 1, 1])
+
+    with c1:
+        season = st.selectbox(
+            "Season",
+            options=seasons,
+            index=_safe_index(seasons, CONFIG.default_season - i),
+            key=f"all_time_season_{i}",
+        )
+
+    events = get_events_for_season(season)
+    labels = [_event_label(e) for e in events]
+    with c2:
+        label = st.selectbox(
+            "Event",
+            options=labels if labels else ["(no events found)"],
+            disabled=not labels,
+            key=f"all_time_event_{i}",
+        )
+    event = dict(zip(labels, events)).get(label)
+
+    sessions = get_sessions_for_event_key(season, int(event.key)) if event is not None else []
+    session_labels = [s.label for s in sessions]
+    with c3:
+        session_label = st.selectbox(
+            "Session",
+            options=session_labels if session_labels else ["(no sessions found)"],
+            disabled=not session_labels,
+            key=f"all_time_session_{i}",
+        )
+    session = dict(zip(session_labels, sessions)).get(session_label)
+
+    with c4:
+        driver = st.text_input("Driver", value="", max_chars=3, placeholder="VER", key=f"all_time_driver_{i}")
+    with c5:
+        lap_number = st.number_input("Lap (0 = fastest)", min_value=0, value=0, step=1, key=f"all_time_lap_{i}")
+
+    if event is None or session is None or not driver.strip():
+        return None
+
+    return LapRef(
+        driver=driver.strip().upper(),
+        lap_number=int(lap_number) or None,
+        season=int(season),
+        event_name=event.name,
+        session_name=session.identifier,
+        event_key=int(event.key),
+        test_number=event.test_number if event.type == "testing" else None,
+    )
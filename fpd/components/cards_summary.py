@@ -3,22 +3,32 @@ from __future__ import annotations
 
 import streamlit as st
 
+from fpd.analytics.lap_digest import top_speed_leaderboard
+
 
 def render_summary_cards(session) -> None:
     """
     Small, UI-only summary cards.
 
-    For now these are placeholders ("—").
+    Top straight-line speed comes from the session LapDigest (no raw telemetry).
+    The others are placeholders ("—").
     Later, you’ll feed real values from analytics modules:
-      - straight-line speed/efficiency
       - low/medium/high-speed corner strengths
       - braking efficiency
       - tire degradation resistance
     """
     st.subheader("Session Summary Cards")
 
+    top = top_speed_leaderboard(session) if session is not None else None
+    if top is not None and not top.empty:
+        best = top.iloc[0]
+        top_value = f"{best['TopSpeed(km/h)']:.0f} km/h"
+        top_driver = str(best["Driver"])
+    else:
+        top_value, top_driver = "—", None
+
     row1 = st.columns(3)
-    row1[0].metric("Top straight-line speed", "—")
+    row1[0].metric("Top straight-line speed", top_value, delta=top_driver, delta_color="off")
     row1[1].metric("Best low-speed traction", "—")
     row1[2].metric("Best medium-speed corners", "—")
 
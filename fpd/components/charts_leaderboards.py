@@ -4,6 +4,9 @@ from __future__ import annotations
 import streamlit as st
 import pandas as pd
 
+from fpd.analytics.lap_digest import top_speed_leaderboard
+from fpd.analytics.laps import fastest_laps_table
+
 
 def render_leaderboards(session, is_race: bool) -> None:
     """
@@ -11,6 +14,7 @@ def render_leaderboards(session, is_race: bool) -> None:
 
     - If race: show a "race chart" placeholder (position over laps) + fastest driver/team charts
     - If not race: fastest driver/team charts
+    - Top speed per driver (from the session LapDigest, no raw telemetry)
 
     This module stays UI-only.
     Real calculations should live in fpd/analytics/* and return DataFrames.
@@ -21,11 +25,15 @@ def render_leaderboards(session, is_race: bool) -> None:
         _race_chart_placeholder(session)
         st.divider()
 
-    c1, c2 = st.columns(2)
+    board = fastest_laps_table(session)
+
+    c1, c2, c3 = st.columns(3)
     with c1:
-        _fastest_drivers_placeholder(session)
+        _fastest_drivers(board)
     with c2:
-        _fastest_teams_placeholder(session)
+        _fastest_teams(board)
+    with c3:
+        _top_speeds(session)
 
 
 def _race_chart_placeholder(session) -> None:
@@ -34,27 +42,62 @@ def _race_chart_placeholder(session) -> None:
     st.info("Stub: implement position-over-laps chart here (Plotly).")
 
 
-def _fastest_drivers_placeholder(session) -> None:
+def _fastest_drivers(board: pd.DataFrame) -> None:
     st.markdown("### Fastest Drivers")
     st.caption("Fastest lap ranking by driver (best lap time).")
-    df = pd.DataFrame(
-        [
-            {"Driver": "VER", "LapTime": "1:30.123"},
-            {"Driver": "HAM", "LapTime": "1:30.456"},
-            {"Driver": "LEC", "LapTime": "1:30.700"},
-        ]
+    if board.empty:
+        st.info("No timed laps available for this session.")
+        return
+    df = board[["Driver", "LapTime(s)", "TopSpeed(km/h)"]].dropna(subset=["LapTime(s)"])
+    df = df.assign(LapTime=df["LapTime(s)"].apply(_fmt_seconds))
+    st.dataframe(
+        df[["Driver", "LapTime", "TopSpeed(km/h)"]],
+        use_container_width=True,
+        hide_index=True,
+        column_config={"TopSpeed(km/h)": st.column_config.NumberColumn("Top Speed", help="km/h", format="%.0f")},
     )
-    st.dataframe(df, use_container_width=True, hide_index=True)
 
 
-def _fastest_teams_placeholder(session) -> None:
+def _fastest_teams(board: pd.DataFrame) -> None:
     st.markdown("### Fastest Teams")
     st.caption("Fastest lap ranking by team (best driver lap).")
-    df = pd.DataFrame(
-        [
-            {"Team": "Red Bull", "BestLap": "1:30.123"},
-            {"Team": "Mercedes", "BestLap": "1:30.456"},
-            {"Team": "Ferrari", "BestLap": "1:30.700"},
-        ]
+    if board.empty or "Team" not in board.columns:
+        st.info("No timed laps available for this session.")
+        return
+    df = (
+        board.dropna(subset=["LapTime(s)"])
+        .sort_values("LapTime(s)")
+        .groupby("Team", as_index=False)
+        .first()
+        .sort_values("LapTime(s)")
     )
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    df = df.assign(BestLap=df["LapTime(s)"].apply(_fmt_seconds))
+    st.dataframe(df[["Team", "Driver", "BestLap"]], use_container_width=True, hide_index=True)
+
+
+def _top_speeds(session) -> None:
+    st.markdown("### Top Speed")
+    st.caption("Highest speed reached per driver across the session (from the lap digest).")
+    df = top_speed_leaderboard(session)
+    if df.empty:
+        st.info("Top speed data not available for this session.")
+        return
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "TopSpeed(km/h)": st.column_config.NumberColumn("Top Speed", help="km/h", format="%.0f"),
+            "LapNumber": st.column_config.NumberColumn("Lap #", format="%d"),
+        },
+    )
+
+
+def _fmt_seconds(x) -> str:
+    if x is None or pd.isna(x):
+        return "—"
+    total_ms = int(round(float(x) * 1000))
+    minutes = total_ms // 60000
+    seconds = (total_ms % 60000) // 1000
+    ms = total_ms % 1000
+    return f"{minutes}:{seconds:02d}.{ms:03d}"
@@ -2,8 +2,14 @@
 from __future__ import annotations
 
 import streamlit as st
+import pandas as pd
+import plotly.express as px
 from typing import Iterable
 
+from fpd.analytics.compare import CompareResult
+from fpd.analytics.downsample import DELTA_CHART, compare_plot_payload
+from fpd.analytics.mini_sectors import fastest_sector_map
+
 
 DEFAULT_CHARTS: list[str] = [
     "Speed",
@@ -16,19 +22,31 @@ DEFAULT_CHARTS: list[str] = [
     "Track Map (fastest sectors)",
 ]
 
+# Chart name -> key in the plot payload (see compare_plot_payload)
+_PAYLOAD_CHARTS: dict[str, str] = {
+    "Speed": "Speed",
+    "Throttle": "Throttle",
+    "Brake": "Brake",
+    "Gear": "Gear",
+    "RPM": "RPM",
+    "Delta Time Trace": DELTA_CHART,
+}
+
 
 def render_compare_stack(
     session,
     mode: str,
     charts: Iterable[str] = DEFAULT_CHARTS,
+    result: CompareResult | None = None,
 ) -> None:
     """
     Renders the Lap Compare chart stack as vertical rows (one under another),
     with expanders that start OPEN (pre-loaded feel).
 
-    This is UI-only scaffolding.
-    The real plotting + telemetry prep should live in fpd/analytics/compare.py
-    and return objects/dataframes that you plot here.
+    Telemetry prep lives in fpd/analytics/compare.py (CompareResult).
+    Traces are plotted from a downsampled payload (fpd/analytics/downsample.py);
+    the full-resolution result stays server-side.
+    Charts without data yet stay placeholders.
     """
     st.subheader("Lap Compare Charts")
     st.caption(
@@ -41,9 +59,17 @@ def render_compare_stack(
     # - click-to-zoom toggle
     _render_compare_options()
 
+    payload = compare_plot_payload(result) if result is not None else {}
+
     for chart_name in charts:
         with st.expander(chart_name, expanded=True):
-            _render_chart_placeholder(chart_name, mode)
+            key = _PAYLOAD_CHARTS.get(chart_name)
+            if key is not None and key in payload:
+                _render_trace_chart(payload[key], key)
+            elif chart_name == "Track Map (fastest sectors)" and session is not None and result is not None:
+                _render_fastest_sectors_map(session, result)
+            else:
+                _render_chart_placeholder(chart_name, mode)
 
 
 def _render_compare_options() -> None:
@@ -59,6 +85,44 @@ def _render_compare_options() -> None:
     st.caption("These toggles are placeholders for now (wired in later).")
 
 
+def _render_trace_chart(df: pd.DataFrame, y: str) -> None:
+    if df.empty:
+        st.info("No data for this channel.")
+        return
+
+    fig = px.line(df, x="Distance", y=y, color="Driver", title=None)
+    fig.update_layout(
+        height=280,
+        margin=dict(l=10, r=10, t=10, b=10),
+        xaxis_title="Distance (m)",
+        yaxis_title=None,
+        legend_title_text=None,
+    )
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def _render_fastest_sectors_map(session, result: CompareResult) -> None:
+    try:
+        df = fastest_sector_map(session, drivers=result.traces.drivers)
+    except Exception:
+        df = pd.DataFrame()
+    if df.empty:
+        st.info("Mini-sector data not available for this session.")
+        return
+
+    fig = px.scatter(df, x="X", y="Y", color="Driver", hover_data=["MiniSector"], title=None)
+    fig.update_traces(marker=dict(size=4))
+    fig.update_layout(
+        height=520,
+        margin=dict(l=10, r=10, t=10, b=10),
+        xaxis=dict(showgrid=False, zeroline=False, visible=False),
+        yaxis=dict(showgrid=False, zeroline=False, visible=False, scaleanchor="x", scaleratio=1),
+        legend_title_text=None,
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption("Each mini-sector is coloured by the driver with the quickest time through it.")
+
+
 def _render_chart_placeholder(chart_name: str, mode: str) -> None:
     st.info(
         f"Stub: {chart_name} ({mode})\n\n"
@@ -4,52 +4,83 @@ from __future__ import annotations
 import streamlit as st
 import pandas as pd
 
+from fpd.analytics.corner_sector import compute_sector_summary
+from fpd.analytics.lap_index import get_lap_index
+from fpd.analytics.sector_matrix import get_sector_matrix
+from fpd.core.config import CONFIG
+
 
 def render_sector_summary(session) -> None:
     """
-    UI-only scaffold for Sector Summary.
-
-    Later, replace stub tables with real outputs from:
-      fpd/analytics/corner_sector.py
+    Sector Summary from the session sector matrix (fpd/analytics/sector_matrix.py):
+      - sector winners + margins among the selected drivers
+      - S1/S2/S3/Lap times and deltas vs a baseline driver
+      - every lap of the selected drivers with personal-best / session-best flags
     """
     st.subheader("Sector Summary")
     st.caption("S1 / S2 / S3 time deltas • who wins each sector and by how much")
 
-    # Basic UI controls (stubs)
-    c1, c2 = st.columns([1, 2])
+    matrix = get_sector_matrix(session)
+    index = get_lap_index(session)
+    if matrix is None or index is None or not index.fastest:
+        st.info("Sector data not available for this session.")
+        return
+
+    # Drivers by fastest lap
+    ranked = sorted(index.fastest, key=lambda d: _lap_seconds(index.fastest_lap(d)))
+
+    c1, c2, c3 = st.columns([2, 1, 1])
     with c1:
-        basis = st.selectbox("Delta basis", ["Fastest lap vs fastest lap", "Selected lap vs selected lap"], index=0)
+        drivers = st.multiselect(
+            "Drivers",
+            ranked,
+            default=ranked[: min(2, len(ranked))],
+            max_selections=CONFIG.max_drivers_compare,
+        )
     with c2:
-        st.caption("Later: pick two drivers (or multiple) and compute deltas per sector.")
+        baseline = st.selectbox("Baseline", drivers or ranked[:1], index=0)
+    with c3:
+        basis = st.selectbox("Delta basis", ["Fastest lap vs fastest lap", "First timed lap"], index=0)
+
+    if not drivers:
+        st.info("Pick at least one driver.")
+        return
+
+    try:
+        result = compute_sector_summary(
+            session,
+            drivers,
+            baseline_driver=baseline,
+            use_fastest_laps=basis.startswith("Fastest"),
+        )
+    except ValueError as e:
+        st.info(str(e))
+        return
 
     st.divider()
 
-    # Stub winner table
-    winners_df = pd.DataFrame(
-        [
-            {"Sector": "S1", "Winner": "VER", "Margin (s)": 0.12},
-            {"Sector": "S2", "Winner": "HAM", "Margin (s)": 0.05},
-            {"Sector": "S3", "Winner": "LEC", "Margin (s)": 0.08},
-        ]
-    )
-    st.markdown("### Sector Winners (Stub)")
+    st.markdown("### Sector Winners")
+    winners_df = result.winners.rename(columns={"MarginSeconds": "Margin (s)"})
     st.dataframe(winners_df, use_container_width=True, hide_index=True)
 
-    # Stub delta table (example with two drivers)
-    deltas_df = pd.DataFrame(
-        [
-            {"Driver": "VER", "S1 (s)": 30.10, "S2 (s)": 28.90, "S3 (s)": 31.12, "Lap (s)": 90.12},
-            {"Driver": "HAM", "S1 (s)": 30.22, "S2 (s)": 28.85, "S3 (s)": 31.20, "Lap (s)": 90.27},
-        ]
+    st.markdown("### Sector Times")
+    per = result.per_driver.rename(
+        columns={c: f"{c} (s)" for c in result.per_driver.columns if c != "Driver"}
     )
-    st.markdown("### Sector Times (Stub)")
-    st.dataframe(deltas_df, use_container_width=True, hide_index=True)
-
-    with st.expander("Planned calculation notes", expanded=False):
-        st.markdown(
-            """
-- Pull **sector times** from lap data (`LapTime`, `Sector1Time`, `Sector2Time`, `Sector3Time`)
-- Compute **deltas** relative to a baseline (best lap, selected lap, or a reference driver)
-- “Who wins” = lowest sector time among compared drivers, margin = next best − best
-"""
-        )
+    st.dataframe(per, use_container_width=True, hide_index=True, column_config=_seconds_config(per))
+
+    with st.expander("All laps (PB = personal best, SB = session best at the time)", expanded=False):
+        laps_df = matrix.frame(drivers)
+        st.dataframe(laps_df, use_container_width=True, hide_index=True)
+
+
+def _seconds_config(df: pd.DataFrame) -> dict:
+    return {c: st.column_config.NumberColumn(format="%.3f") for c in df.columns if c.endswith("(s)")}
+
+
+def _lap_seconds(lap) -> float:
+    try:
+        v = pd.to_timedelta(lap.get("LapTime")).total_seconds()
+    except Exception:
+        return float("inf")
+    return v if pd.notna(v) else float("inf")
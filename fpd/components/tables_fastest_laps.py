@@ -4,6 +4,8 @@ from __future__ import annotations
 import streamlit as st
 import pandas as pd
 
+from fpd.analytics.laps import top_speed_lookup
+
 
 def render_fastest_laps_table(session) -> None:
     """
@@ -102,18 +104,14 @@ def _build_fastest_laps_df(laps) -> pd.DataFrame:
 
     base = base.sort_values("LapTime").groupby("Driver", as_index=False).first()
 
-    # Top speed: best effort from telemetry (may be missing for some sessions)
+    # Top speed: field-wide per-lap table (may be missing for some sessions)
+    session = getattr(laps, "session", None)
+    lap_top = top_speed_lookup(session) if session is not None else {}
     top_speeds = {}
     for _, row in base.iterrows():
         drv = row.get("Driver")
-        try:
-            tel = row.get_telemetry()
-            if tel is not None and "Speed" in tel.columns and len(tel["Speed"]) > 0:
-                top_speeds[drv] = float(pd.to_numeric(tel["Speed"], errors="coerce").max())
-            else:
-                top_speeds[drv] = None
-        except Exception:
-            top_speeds[drv] = None
+        lap_no = pd.to_numeric(row.get("LapNumber"), errors="coerce")
+        top_speeds[drv] = None if pd.isna(lap_no) else lap_top.get((str(drv).strip().upper(), int(lap_no)))
 
     df = pd.DataFrame(
         {
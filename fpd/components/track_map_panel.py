@@ -2,23 +2,26 @@
 from __future__ import annotations
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 
+from fpd.analytics.circuit_geometry import get_circuit_geometry
+from fpd.data.circuit_db import CircuitGeometry, rotate_xy
+from fpd.data.telemetry_store import lap_telemetry
+
 
 def render_track_map_panel(session) -> None:
     """
     Track Map Panel (UI + basic working map).
 
     Shows:
-      - Track outline (from fastest lap telemetry X/Y)
-      - Sector boundaries (placeholder for now)
-      - Turn numbers / corner labels (placeholder for now)
+      - Track outline, turn numbers and sector boundaries from the circuit DB
+        (see circuit_geometry; telemetry is only read the first time a circuit is seen)
       - Temperature (best-effort from session.weather_data if available)
 
     Notes:
-      - FastF1 track XY comes from telemetry with add_distance().
-      - True corner numbers/sector shading will be implemented later in analytics.
+      - Falls back to the fastest lap's telemetry X/Y when the circuit geometry cannot be built.
     """
     st.subheader("Track Map")
     _render_temperature_row(session)
@@ -27,7 +30,8 @@ def render_track_map_panel(session) -> None:
         st.warning("No session loaded.")
         return
 
-    telemetry_df = _get_reference_telemetry_xy(session)
+    geometry = _get_geometry(session)
+    telemetry_df = geometry.rotated_outline() if geometry is not None else _get_reference_telemetry_xy(session)
     if telemetry_df is None or telemetry_df.empty:
         st.info("Track map data not available for this session.")
         return
@@ -47,12 +51,55 @@ def render_track_map_panel(session) -> None:
         yaxis=dict(showgrid=False, zeroline=False, visible=False, scaleanchor="x", scaleratio=1),
         showlegend=False,
     )
+    if geometry is not None:
+        _add_geometry_markers(fig, geometry)
 
     st.plotly_chart(fig, use_container_width=True)
 
-    st.caption(
-        "Planned: turn numbers, corner labels (slow/medium/high), and sector boundaries shading."
-    )
+
+def _get_geometry(session) -> CircuitGeometry | None:
+    try:
+        geometry = get_circuit_geometry(session)
+    except Exception:
+        return None
+    if geometry is None or geometry.outline.empty:
+        return None
+    return geometry
+
+
+def _add_geometry_markers(fig, geometry: CircuitGeometry) -> None:
+    """
+    Turn numbers at the apexes + sector boundary markers, rotated like the outline.
+    """
+    corners = geometry.corners_frame(rotated=True)
+    if not corners.empty:
+        fig.add_scatter(
+            x=corners["X"],
+            y=corners["Y"],
+            mode="markers+text",
+            text=corners["Label"],
+            textposition="top center",
+            marker=dict(size=5),
+            hoverinfo="text",
+        )
+
+    if geometry.sector_boundaries_m:
+        outline = geometry.outline
+        b = np.asarray(geometry.sector_boundaries_m, dtype=float)
+        x, y = rotate_xy(
+            np.interp(b, outline["Distance"], outline["X"]),
+            np.interp(b, outline["Distance"], outline["Y"]),
+            geometry.rotation_deg,
+        )
+        fig.add_scatter(
+            x=x,
+            y=y,
+            mode="markers+text",
+            text=[f"S{i + 1}|S{i + 2}" for i in range(len(b))],
+            textposition="bottom center",
+            marker=dict(size=10, symbol="line-ns-open"),
+            hoverinfo="text",
+        )
 
 
 def _get_reference_telemetry_xy(session) -> pd.DataFrame | None:
@@ -77,14 +124,10 @@ def _get_reference_telemetry_xy(session) -> pd.DataFrame | None:
         except Exception:
             lap = laps.iloc[0]
 
-        tel = lap.get_telemetry()
+        tel = lap_telemetry(lap, ("X", "Y"))
         if tel is None or len(tel) == 0:
             return None
 
-        # Ensure distance and xy exist
-        if "Distance" not in tel.columns:
-            tel = tel.add_distance()
-
         if "X" not in tel.columns or "Y" not in tel.columns:
             # Some sessions may not include positional data
             return None
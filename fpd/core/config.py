@@ -19,5 +19,31 @@ class AppConfig:
     max_drivers_compare: int = 4
     show_debug_sidebar: bool = False
 
+    # In-process session cache (shared by all pages/users of this process)
+    session_cache_max_mb: int = 2048
+
+    # Per-session telemetry cache (merged lap telemetry frames kept per session)
+    telemetry_cache_max_laps: int = 256
+
+    # Lap Compare: aligned laps kept per session + channel set (incremental compare)
+    compare_cache_max_laps: int = 64
+
+    # Lap Compare all-time mode: sessions loaded in parallel
+    compare_load_workers: int = 4
+
+    # Plot payloads: each compare chart gets about 2 points per pixel of this width
+    plot_width_px: int = 1200
+
+    # Per-lap telemetry extraction (compare, corner breakdown): "thread" | "process" | "serial"
+    # (overridable per deployment with FPD_EXTRACT_POOL / FPD_EXTRACT_WORKERS, see core/parallel)
+    extract_pool: str = "thread"
+    extract_workers: int = 4
+
+    # Mini-sectors per lap (track map fastest sectors, ultimate lap)
+    mini_sectors: int = 25
+
+    # Field-wide corner breakdown: laps processed per vectorized batch (bounds peak memory)
+    corner_batch_laps: int = 200
+
 
 CONFIG = AppConfig()
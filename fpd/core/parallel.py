@@ -0,0 +1,67 @@
+# fpd/core/parallel.py
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, Literal, TypeVar
+
+from fpd.core.config import CONFIG
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+PoolKind = Literal["thread", "process", "serial"]
+
+# Deployment overrides of CONFIG.extract_pool / CONFIG.extract_workers (CONFIG is frozen)
+POOL_ENV = "FPD_EXTRACT_POOL"
+WORKERS_ENV = "FPD_EXTRACT_WORKERS"
+
+
+def parallel_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    pool: PoolKind | str | None = None,
+    workers: int | None = None,
+) -> list[R]:
+    """
+    fn over items on an executor; results come back in input order.
+
+    pool / workers: the call's own choice, else the FPD_EXTRACT_POOL / FPD_EXTRACT_WORKERS
+    environment variables, else CONFIG.extract_pool / CONFIG.extract_workers.
+    - "thread": default. Telemetry work is mostly pandas/numpy (releases the GIL)
+      and threads share the per-session caches (TelemetryStore, LapIndex).
+    - "process": fn and items must pickle; FastF1 laps pickle their whole session,
+      so this only pays off for plain-data work.
+    - "serial" (or workers <= 1, or a single item): plain loop, no pool.
+    Exceptions raised by fn propagate to the caller.
+    """
+    pool = pool or os.environ.get(POOL_ENV) or CONFIG.extract_pool
+    workers = workers if workers is not None else _env_workers()
+
+    items = list(items)
+    workers = min(int(workers), len(items))
+    if pool == "serial" or workers <= 1:
+        return [fn(x) for x in items]
+
+    with _executor(pool, workers) as executor:
+        return list(executor.map(fn, items))
+
+
+def _env_workers() -> int:
+    value = os.environ.get(WORKERS_ENV)
+    if not value:
+        return CONFIG.extract_workers
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{WORKERS_ENV} must be an integer, got {value!r}") from None
+
+
+def _executor(kind: str, workers: int) -> Executor:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unknown pool kind: {kind}")
@@ -0,0 +1,249 @@
+# fpd/data/circuit_db.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import json
+import os
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from fpd.core.config import CONFIG
+from fpd.core.logging import get_logger
+from fpd.core.utils import slugify
+
+
+log = get_logger(__name__)
+
+# Bump when the file layout changes; older geometry files are then rebuilt.
+CIRCUIT_DB_VERSION = 1
+CIRCUIT_SUBDIR = "fpd_circuits"
+
+# key -> geometry, so each circuit file is parsed once per process
+_GEOMETRY: dict[str, "CircuitGeometry"] = {}
+_LOCK = threading.Lock()
+
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True)
+class CircuitCorner:
+    """
+    One corner in lap distance space (m) + apex position on the track map.
+    """
+    number: int
+    label: str
+    start_m: float
+    end_m: float
+    apex_m: float
+    x: float
+    y: float
+
+
+@dataclass(frozen=True, eq=False)
+class CircuitGeometry:
+    """
+    Static geometry of one circuit layout (see circuit_key):
+      - corners: in lap order
+      - sector_boundaries_m: end of S1 and S2 (m)
+      - outline: Distance, X, Y (downsampled reference lap)
+      - rotation_deg: map rotation that shows the circuit the usual way up
+      - source: "circuit_info" (FastF1 corner list) or "detected" (from telemetry)
+    """
+    key: str
+    location: str
+    season: int | None
+    lap_length_m: float
+    rotation_deg: float
+    corners: tuple[CircuitCorner, ...]
+    sector_boundaries_m: tuple[float, ...]
+    outline: pd.DataFrame
+    source: str
+
+    def rotated_outline(self) -> pd.DataFrame:
+        """
+        Outline with X/Y rotated by rotation_deg (Distance, X, Y).
+        """
+        x, y = rotate_xy(self.outline["X"].to_numpy(dtype=float), self.outline["Y"].to_numpy(dtype=float), self.rotation_deg)
+        return pd.DataFrame({"Distance": self.outline["Distance"].to_numpy(dtype=float), "X": x, "Y": y})
+
+    def corners_frame(self, rotated: bool = False) -> pd.DataFrame:
+        """
+        Corner, Label, Start(m), End(m), Apex(m), X, Y (X/Y optionally rotated like the outline).
+        """
+        df = pd.DataFrame(
+            {
+                "Corner": [c.number for c in self.corners],
+                "Label": [c.label for c in self.corners],
+                "Start(m)": [c.start_m for c in self.corners],
+                "End(m)": [c.end_m for c in self.corners],
+                "Apex(m)": [c.apex_m for c in self.corners],
+                "X": [c.x for c in self.corners],
+                "Y": [c.y for c in self.corners],
+            },
+            columns=["Corner", "Label", "Start(m)", "End(m)", "Apex(m)", "X", "Y"],
+        )
+        if rotated and len(df):
+            df["X"], df["Y"] = rotate_xy(df["X"].to_numpy(dtype=float), df["Y"].to_numpy(dtype=float), self.rotation_deg)
+        return df
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def circuit_key(session) -> str | None:
+    """
+    Layout id from session metadata only (no telemetry): event location + season + event.
+    The season stands in for the layout version (layout changes land between seasons);
+    the event tells apart layouts run at one location in the same season
+    (e.g. Sakhir 2020: Bahrain GP on the GP circuit, Sakhir GP on the outer loop).
+    None when the session has no usable location.
+    """
+    event = getattr(session, "event", None)
+    location = _event_field(event, "Location") or _event_field(event, "EventName")
+    if not location:
+        return None
+
+    season = session_season(session)
+    name = _event_field(event, "EventName") or _event_field(event, "RoundNumber") or "any"
+    return f"{slugify(location)}::{season if season is not None else 'any'}::{slugify(name)}"
+
+
+def session_season(session) -> int | None:
+    event = getattr(session, "event", None)
+    candidates = [getattr(session, "date", None)]
+    try:
+        candidates.append(event.get("EventDate"))
+    except Exception:
+        pass
+    for value in candidates:
+        ts = pd.to_datetime(value, errors="coerce") if value is not None else pd.NaT
+        if not pd.isna(ts):
+            return int(ts.year)
+    return None
+
+
+def circuit_path(key: str, cache_dir: str = CONFIG.cache_dir) -> Path:
+    return Path(cache_dir) / CIRCUIT_SUBDIR / f"{slugify(key)}.json"
+
+
+def read_geometry(key: str) -> CircuitGeometry | None:
+    """
+    Geometry for key from memory, else from disk (then kept in memory). None if not built yet.
+    """
+    with _LOCK:
+        cached = _GEOMETRY.get(key)
+    if cached is not None:
+        return cached
+
+    path = circuit_path(key)
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning("Ignoring unreadable circuit geometry %s: %s", path, e)
+        return None
+    if data.get("version") != CIRCUIT_DB_VERSION or data.get("key") != key:
+        return None
+
+    try:
+        geometry = _from_json(data)
+    except Exception as e:
+        log.warning("Ignoring malformed circuit geometry %s: %s", path, e)
+        return None
+
+    with _LOCK:
+        return _GEOMETRY.setdefault(key, geometry)
+
+
+def write_geometry(geometry: CircuitGeometry) -> None:
+    """
+    Keep geometry in memory and persist it (temp file + rename, so readers never see half a file).
+    """
+    with _LOCK:
+        _GEOMETRY[geometry.key] = geometry
+
+    path = circuit_path(geometry.key)
+    tmp = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex}")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(_to_json(geometry)))
+        os.replace(tmp, path)
+    except Exception as e:
+        log.warning("Could not write circuit geometry %s: %s", path, e)
+        tmp.unlink(missing_ok=True)
+
+
+def rotate_xy(x: np.ndarray, y: np.ndarray, rotation_deg: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rotate points counter-clockwise by rotation_deg about the origin.
+    """
+    a = np.deg2rad(rotation_deg)
+    c, s = np.cos(a), np.sin(a)
+    return x * c - y * s, x * s + y * c
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _event_field(event, field: str) -> str:
+    try:
+        value = event.get(field)
+    except Exception:
+        return ""
+    if value is None or pd.isna(value):
+        return ""
+    return str(value).strip()
+
+
+def _to_json(g: CircuitGeometry) -> dict:
+    return {
+        "version": CIRCUIT_DB_VERSION,
+        "key": g.key,
+        "location": g.location,
+        "season": g.season,
+        "lap_length_m": g.lap_length_m,
+        "rotation_deg": g.rotation_deg,
+        "source": g.source,
+        "corners": [
+            [c.number, c.label, c.start_m, c.end_m, c.apex_m, c.x, c.y] for c in g.corners
+        ],
+        "sector_boundaries_m": list(g.sector_boundaries_m),
+        "outline": {col: _json_floats(g.outline[col]) for col in ("Distance", "X", "Y")},
+    }
+
+
+def _from_json(data: dict) -> CircuitGeometry:
+    corners = tuple(
+        CircuitCorner(
+            number=int(n), label=str(label), start_m=_float(s), end_m=_float(e), apex_m=_float(a), x=_float(x), y=_float(y)
+        )
+        for n, label, s, e, a, x, y in data.get("corners", [])
+    )
+    outline = data.get("outline", {})
+    return CircuitGeometry(
+        key=str(data["key"]),
+        location=str(data.get("location", "")),
+        season=data.get("season"),
+        lap_length_m=_float(data.get("lap_length_m")),
+        rotation_deg=_float(data.get("rotation_deg")) if data.get("rotation_deg") is not None else 0.0,
+        corners=corners,
+        sector_boundaries_m=tuple(_float(b) for b in data.get("sector_boundaries_m", [])),
+        outline=pd.DataFrame({col: np.asarray(outline.get(col, []), dtype=float) for col in ("Distance", "X", "Y")}),
+        source=str(data.get("source", "")),
+    )
+
+
+def _json_floats(values) -> list:
+    # NaN is not valid JSON: store as null, read back as NaN
+    arr = np.asarray(values, dtype=float)
+    return [round(float(v), 2) if np.isfinite(v) else None for v in arr]
+
+
+def _float(value) -> float:
+    return float(value) if value is not None else float("nan")
@@ -6,6 +6,8 @@ import os
 import fastf1
 import streamlit as st
 
+from fpd.data.session_cache import SESSION_CACHE
+
 DEFAULT_CACHE_DIR = "data/cache"
 
 
@@ -84,6 +86,13 @@ def cache_controls_sidebar() -> None:
     size = get_cache_size_mb()
     st.sidebar.caption(f"Cache size: {size} MB")
 
+    stats = SESSION_CACHE.stats()
+    st.sidebar.caption(
+        f"Loaded sessions: {stats.entries} • {stats.size_mb}/{stats.max_mb} MB • "
+        f"hits {stats.hits} / misses {stats.misses} / evictions {stats.evictions}"
+    )
+
     if st.sidebar.button("Clear Cache"):
+        SESSION_CACHE.clear()
         clear_cache()
         st.sidebar.success("Cache cleared. Restart app.")
@@ -0,0 +1,217 @@
+# fpd/data/session_cache.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from typing import Any, Callable, TypeVar
+
+import pandas as pd
+
+from fpd.core.config import CONFIG
+from fpd.core.logging import get_logger
+
+
+log = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Session attributes that hold the bulk of a loaded session's memory.
+# FastF1 raises when an attribute was not loaded, so each one is read best-effort.
+_HEAVY_ATTRS = ("laps", "results", "car_data", "pos_data", "weather_data", "race_control_messages")
+
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_mb: float
+    max_mb: float
+
+
+# -----------------------------
+# Cache
+# -----------------------------
+class SessionCache:
+    """
+    Process-wide LRU cache of loaded sessions.
+
+    - Keyed by make_session_key(...) (season, event, session, test number)
+    - Bounded by the estimated memory footprint of the cached sessions
+    - Every caller gets the same session object until it is evicted
+    - Thread-safe: Streamlit runs each user's script in its own thread
+    """
+
+    def __init__(self, max_mb: float = CONFIG.session_cache_max_mb):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        """
+        Returns the cached session (and marks it most recently used), else None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: str):
+        """
+        Like get(), but does not touch LRU order or hit/miss counters.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def put(self, key: str, session, size_bytes: int | None = None) -> None:
+        """
+        Insert/replace a session, then evict least recently used entries over budget.
+        The newest entry is always kept, even if it alone exceeds the budget.
+        """
+        if size_bytes is None:
+            size_bytes = estimate_session_bytes(session)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size_bytes -= old[1]
+
+            self._entries[key] = (session, int(size_bytes))
+            self._size_bytes += int(size_bytes)
+
+            while self._size_bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, (_, old_size) = self._entries.popitem(last=False)
+                self._size_bytes -= old_size
+                self.evictions += 1
+                log.info("Evicted session %s (%.1f MB)", old_key, old_size / (1024 * 1024))
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size_bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size_mb=round(self._size_bytes / (1024 * 1024), 2),
+                max_mb=round(self.max_bytes / (1024 * 1024), 2),
+            )
+
+
+# -----------------------------
+# Single-flight
+# -----------------------------
+class _InFlight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Per-key request coalescing.
+
+    The first caller for a key runs fn(); concurrent callers for the same key
+    block until it finishes and get the same result (or the same exception).
+    Once the call completes the key is released, so later calls run again
+    (by then they normally hit SESSION_CACHE instead).
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlight()
+                self._calls[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+# Module-level singletons: one cache (and one set of in-flight loads) per Streamlit server process.
+SESSION_CACHE = SessionCache()
+SESSION_FLIGHTS = SingleFlight()
+
+
+# -----------------------------
+# Memory estimate
+# -----------------------------
+def estimate_session_bytes(session) -> int:
+    """
+    Best-effort memory footprint of a loaded session (laps, results, telemetry, weather, messages).
+    """
+    total = 0
+    for attr in _HEAVY_ATTRS:
+        try:
+            value = getattr(session, attr, None)
+        except Exception:
+            continue
+        total += _obj_bytes(value)
+    return total
+
+
+def _obj_bytes(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, dict):
+        return sum(_obj_bytes(v) for v in value.values())
+    if isinstance(value, pd.DataFrame):
+        try:
+            return int(value.memory_usage(index=True, deep=True).sum())
+        except Exception:
+            return 0
+    return 0
@@ -1,13 +1,48 @@
 # fpd/data/session_loader.py
 from __future__ import annotations
 
+import threading
+from typing import Literal
+import weakref
+
 import fastf1
 import streamlit as st
 
-from fpd.ui.state import StateKeys
+from fpd.data import session_store
+from fpd.data.session_cache import SESSION_CACHE, SESSION_FLIGHTS
+from fpd.data.session_memo import drop_session_memo
+from fpd.ui.state import StateKeys, make_session_key
+
+
+LoadProfile = Literal["results", "laps", "laps+telemetry", "full"]
+
+# Parts of a session FastF1 can load independently (Session.load(...) flags).
+# Results are always loaded by FastF1, so "results" needs no flag.
+_PARTS = ("laps", "telemetry", "weather", "messages")
 
+LOAD_PROFILES: dict[str, frozenset[str]] = {
+    "results": frozenset(),
+    "laps": frozenset({"laps"}),
+    "laps+telemetry": frozenset({"laps", "telemetry"}),
+    "full": frozenset(_PARTS),
+}
 
-def load_session(season: int, event_name: str, session_identifier, test_number: int | None = None):
+# FastF1's get_session/load (and its HTTP cache) are not documented as thread-safe:
+# FastF1 loads run one at a time. Store reads and cache hits do not take this lock.
+_FASTF1_LOCK = threading.Lock()
+
+# Which parts each cached session already has (session -> frozenset of parts)
+_LOADED_PARTS: "weakref.WeakKeyDictionary[object, frozenset[str]]" = weakref.WeakKeyDictionary()
+
+
+def load_session(
+    season: int,
+    event_name: str,
+    session_identifier,
+    test_number: int | None = None,
+    event_key: int | None = None,
+    profile: LoadProfile = "full",
+):
     """
     Loads:
       - Race weekends: fastf1.get_session(season, event_name, session_identifier)
@@ -16,33 +51,147 @@ def load_session(season: int, event_name: str, session_identifier, test_number:
     session_identifier:
       - race: str like "FP1", "Q", "R", etc.
       - testing: int 1/2/3 (or string convertible)
+
+    profile: what the page needs (see LOAD_PROFILES)
+      - "results": results only
+      - "laps": + laps
+      - "laps+telemetry": + car/position data
+      - "full": + weather and race control messages
+
+    Loaded sessions are shared through the process-wide SESSION_CACHE,
+    so reruns, other pages and other users get the same object back.
+    A cached session loaded with a lighter profile is replaced by a freshly loaded one
+    (the lighter object is never reloaded; callers still holding it keep a consistent session).
+    On a cold process, sessions are rebuilt from the fpd columnar store
+    (data/cache/fpd_sessions) before falling back to a FastF1 load.
     """
     try:
         is_testing = _is_testing_event_name(event_name)
 
+        # Prefer explicit arguments, else read from state, but only when the state
+        # describes this event (the topbar selection); another event gets no key.
+        is_selected_event = event_name == st.session_state.get(StateKeys.EVENT_NAME)
+        if event_key is None and is_selected_event:
+            event_key = st.session_state.get(getattr(StateKeys, "EVENT_KEY", "fpd_event_key"))
+
+        tn = None
         if is_testing:
-            # Prefer explicit argument, else read from state
             tn = test_number
-            if tn is None:
+            if tn is None and is_selected_event:
                 tn = st.session_state.get(getattr(StateKeys, "TEST_NUMBER", "fpd_test_number"))
 
             if tn is None:
                 st.error("Testing event selected but test_number is missing.")
                 return None
 
-            sn = _to_testing_session_number(session_identifier)  # 1/2/3
-            sess = fastf1.get_testing_session(int(season), int(tn), int(sn))
-        else:
-            sess = fastf1.get_session(int(season), str(event_name), session_identifier)
-
-        sess.load()
-        return sess
+        return fetch_session(
+            season,
+            event_name,
+            session_identifier,
+            test_number=tn,
+            event_key=event_key,
+            profile=profile,
+        )
 
     except Exception as e:
         st.error(f"Failed to load session: {e}")
         return None
 
 
+def fetch_session(
+    season: int,
+    event_name: str,
+    session_identifier,
+    test_number: int | None = None,
+    event_key: int | None = None,
+    profile: LoadProfile = "full",
+):
+    """
+    UI-free loader behind load_session: cache lookup, then FastF1 load on a miss.
+    Raises on failure (no Streamlit calls), so it is safe to use from worker threads.
+    """
+    if profile not in LOAD_PROFILES:
+        raise ValueError(f"Unknown load profile: {profile}")
+    wanted = LOAD_PROFILES[profile]
+
+    is_testing = _is_testing_event_name(event_name)
+    if is_testing and test_number is None:
+        raise ValueError("Testing event selected but test_number is missing.")
+
+    key = make_session_key(
+        int(season),
+        event_name,
+        session_identifier,
+        event_key=event_key,
+        test_number=test_number if is_testing else None,
+    )
+
+    sess = SESSION_CACHE.get(key)
+
+    # Concurrent misses/upgrades for the same key share one FastF1 load.
+    # A waiter may have joined a lighter load than it needs, so re-check and go again.
+    while sess is None or not wanted <= loaded_parts(sess):
+        sess = SESSION_FLIGHTS.do(
+            key,
+            lambda: _load_into_cache(key, season, event_name, session_identifier, test_number, is_testing, wanted),
+        )
+
+    return sess
+
+
+def loaded_parts(session) -> frozenset[str]:
+    """
+    Parts (laps/telemetry/weather/messages) already loaded for a session from this loader.
+    """
+    try:
+        return _LOADED_PARTS.get(session, frozenset())
+    except TypeError:
+        return frozenset()
+
+
+def _load_into_cache(
+    key: str,
+    season: int,
+    event_name: str,
+    session_identifier,
+    test_number,
+    is_testing: bool,
+    wanted: frozenset[str],
+):
+    # Another flight may have finished between our cache miss and becoming leader
+    cached = SESSION_CACHE.peek(key)
+    have = loaded_parts(cached) if cached is not None else frozenset()
+    if cached is not None and wanted <= have:
+        return cached
+
+    # Upgrades never re-load() the cached object: other threads may be reading it, and
+    # FastF1 re-runs its whole post-processing (results, generated laps, deleted flags)
+    # on every load(). A fresh session gets every part instead and replaces it.
+    parts = have | wanted
+
+    stored = session_store.read_session(key, parts)
+    if stored is not None:
+        # Rebuilt from the columnar store without FastF1 parsing
+        sess, parts = stored
+    else:
+        with _FASTF1_LOCK:
+            if is_testing:
+                sn = _to_testing_session_number(session_identifier)  # 1/2/3
+                sess = fastf1.get_testing_session(int(season), int(test_number), int(sn))
+            else:
+                sess = fastf1.get_session(int(season), str(event_name), session_identifier)
+            sess.load(**{part: part in parts for part in _PARTS})
+        session_store.write_session(key, sess, parts)
+
+    _LOADED_PARTS[sess] = parts
+    session_store.bind(sess, key)
+    SESSION_CACHE.put(key, sess)
+    if cached is not None:
+        # Derived tables of the replaced session describe its lighter profile
+        drop_session_memo(cached)
+    return sess
+
+
 def _is_testing_event_name(event_name: str) -> bool:
     s = str(event_name).lower()
     return ("test" in s) or ("testing" in s) or ("pre-season" in s) or ("preseason" in s)
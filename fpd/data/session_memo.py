@@ -0,0 +1,42 @@
+# fpd/data/session_memo.py
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, TypeVar
+import weakref
+
+
+T = TypeVar("T")
+
+# session -> {name: value}. Weak keys: memoized values die with the session
+# (e.g. when it is evicted from SESSION_CACHE).
+_MEMO: "weakref.WeakKeyDictionary[object, dict[str, Any]]" = weakref.WeakKeyDictionary()
+_LOCK = threading.Lock()
+
+
+def session_memo(session, name: str, factory: Callable[[], T]) -> T:
+    """
+    Returns a per-session value, building it with factory() on first use.
+
+    Used for derived per-session structures (telemetry store, indexes, digests)
+    so they are built once and shared by every page/user holding the session.
+    Two threads may race to build the same value; the first one stored wins.
+    """
+    with _LOCK:
+        memo = _MEMO.get(session)
+        if memo is not None and name in memo:
+            return memo[name]
+
+    value = factory()
+
+    with _LOCK:
+        memo = _MEMO.setdefault(session, {})
+        return memo.setdefault(name, value)
+
+
+def drop_session_memo(session) -> None:
+    """
+    Forget every value memoized for session (e.g. when the loader replaces it with an upgraded one).
+    """
+    with _LOCK:
+        _MEMO.pop(session, None)
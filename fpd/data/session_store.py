@@ -0,0 +1,286 @@
+# fpd/data/session_store.py
+from __future__ import annotations
+
+from importlib.util import find_spec
+from pathlib import Path
+import json
+import os
+import shutil
+import uuid
+import weakref
+
+import pandas as pd
+from fastf1.core import Laps, SessionResults, Telemetry
+
+from fpd.core.config import CONFIG
+from fpd.core.logging import get_logger
+from fpd.core.utils import slugify
+
+
+log = get_logger(__name__)
+
+# Bump when the on-disk layout changes; older session dirs are then ignored.
+STORE_VERSION = 1
+STORE_SUBDIR = "fpd_sessions"
+
+# Loader parts (see session_loader.LOAD_PROFILES) -> files that hold them
+_PART_FILES: dict[str, tuple[str, ...]] = {
+    "laps": ("laps",),
+    "telemetry": ("car_data", "pos_data"),
+    "weather": ("weather",),
+    "messages": ("race_control",),
+}
+
+# session -> store key, so derived tables can be persisted next to their session
+_BOUND_KEYS: "weakref.WeakKeyDictionary[object, str]" = weakref.WeakKeyDictionary()
+
+
+# -----------------------------
+# Lightweight session
+# -----------------------------
+class StoredSession:
+    """
+    Stand-in for fastf1.core.Session rebuilt from the columnar store (no FastF1 parsing).
+
+    Exposes the attributes the analytics modules read (laps, results, car_data,
+    pos_data, weather_data) plus the ones FastF1's Laps/Telemetry methods read back
+    from their session (drivers, t0_date, name, event, ...), so lap.get_telemetry()
+    keeps working on laps from a stored session.
+    """
+
+    def __init__(self, manifest: dict, frames: dict[str, pd.DataFrame]):
+        self.name = manifest.get("name")
+        self.event = pd.Series(manifest.get("event", {}), dtype=object)
+        self.date = _ts_or_none(manifest.get("date"))
+        self.t0_date = _ts_or_none(manifest.get("t0_date"))
+        self.session_start_time = _td_or_none(manifest.get("session_start_time"))
+        self.drivers = list(manifest.get("drivers", []))
+        self.f1_api_support = True
+
+        self.results = SessionResults(frames.get("results", pd.DataFrame()))
+
+        laps = frames.get("laps")
+        self.laps = Laps(laps, session=self) if laps is not None else None
+        self.car_data = _split_telemetry(frames.get("car_data"), session=self)
+        self.pos_data = _split_telemetry(frames.get("pos_data"), session=self)
+        self.weather_data = frames.get("weather")
+        self.race_control_messages = frames.get("race_control")
+
+    def load(self, **kwargs) -> None:
+        raise RuntimeError("StoredSession is already loaded; reload through fastf1 to add parts.")
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def is_available() -> bool:
+    """
+    The store needs a Parquet engine (pyarrow); without it the loader falls back to FastF1 only.
+    """
+    return find_spec("pyarrow") is not None
+
+
+def store_dir(key: str, cache_dir: str = CONFIG.cache_dir) -> Path:
+    return Path(cache_dir) / STORE_SUBDIR / slugify(key)
+
+
+def read_session(key: str, wanted: frozenset[str]) -> tuple[StoredSession, frozenset[str]] | None:
+    """
+    Returns (session, stored parts) if the store has every wanted part for key, else None.
+    """
+    if not is_available():
+        return None
+
+    path = store_dir(key)
+    manifest = _read_manifest(path)
+    if manifest is None:
+        return None
+
+    parts = frozenset(manifest.get("parts", []))
+    if not wanted <= parts:
+        return None
+
+    try:
+        frames = {"results": pd.read_parquet(path / "results.parquet")}
+        for part in parts:
+            for name in _PART_FILES[part]:
+                f = path / f"{name}.parquet"
+                if f.exists():
+                    frames[name] = pd.read_parquet(f)
+        return StoredSession(manifest, frames), parts
+    except Exception as e:
+        log.warning("Ignoring unreadable session store %s: %s", path, e)
+        return None
+
+
+def write_session(key: str, session, parts: frozenset[str]) -> None:
+    """
+    Persist a loaded FastF1 session (only the given parts) as Parquet files.
+    Files are written to a temp dir and swapped in, so readers never see half a session.
+    """
+    if not is_available():
+        return
+
+    path = store_dir(key)
+    tmp = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex}")
+    tmp.mkdir(parents=True, exist_ok=True)
+
+    try:
+        frames: dict[str, pd.DataFrame | None] = {"results": _frame(session, "results")}
+        if "laps" in parts:
+            frames["laps"] = _frame(session, "laps")
+        if "telemetry" in parts:
+            frames["car_data"] = _concat_telemetry(_attr(session, "car_data"))
+            frames["pos_data"] = _concat_telemetry(_attr(session, "pos_data"))
+        if "weather" in parts:
+            frames["weather"] = _frame(session, "weather_data")
+        if "messages" in parts:
+            frames["race_control"] = _frame(session, "race_control_messages")
+
+        for name, df in frames.items():
+            if df is not None:
+                pd.DataFrame(df).to_parquet(tmp / f"{name}.parquet")
+
+        # Manifest last: its presence marks a complete session dir
+        (tmp / "manifest.json").write_text(json.dumps(_manifest(session, parts)))
+
+        shutil.rmtree(path, ignore_errors=True)
+        tmp.rename(path)
+    except Exception as e:
+        log.warning("Could not write session store %s: %s", path, e)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bind(session, key: str) -> None:
+    """
+    Remember which store key a loaded session belongs to (done by the session loader).
+    """
+    try:
+        _BOUND_KEYS[session] = key
+    except TypeError:
+        pass
+
+
+def read_extra(session, name: str) -> pd.DataFrame | None:
+    """
+    Read a derived per-session table (e.g. lap_digest) stored next to the session, if any.
+    """
+    path = _extra_path(session, name)
+    if path is None or not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        log.warning("Ignoring unreadable %s: %s", path, e)
+        return None
+
+
+def write_extra(session, name: str, df: pd.DataFrame) -> None:
+    """
+    Persist a derived per-session table next to the session files.
+    No-op when the session is not in the store (e.g. pyarrow missing).
+    Extras are dropped whenever the session itself is rewritten (profile upgrade).
+    """
+    path = _extra_path(session, name)
+    if path is None or not (path.parent / "manifest.json").exists():
+        return
+    tmp = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex}")
+    try:
+        df.to_parquet(tmp)
+        os.replace(tmp, path)
+    except Exception as e:
+        log.warning("Could not write %s: %s", path, e)
+        tmp.unlink(missing_ok=True)
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _extra_path(session, name: str) -> Path | None:
+    if not is_available():
+        return None
+    try:
+        key = _BOUND_KEYS.get(session)
+    except TypeError:
+        return None
+    if key is None:
+        return None
+    return store_dir(key) / f"extra_{slugify(name)}.parquet"
+
+
+def _read_manifest(path: Path) -> dict | None:
+    try:
+        manifest = json.loads((path / "manifest.json").read_text())
+    except Exception:
+        return None
+    if manifest.get("version") != STORE_VERSION:
+        return None
+    return manifest
+
+
+def _manifest(session, parts: frozenset[str]) -> dict:
+    event = _attr(session, "event")
+    start = _attr(session, "session_start_time")
+    return {
+        "version": STORE_VERSION,
+        "parts": sorted(parts),
+        "name": _attr(session, "name"),
+        "event": {str(k): str(v) for k, v in dict(event).items()} if event is not None else {},
+        "date": _iso_or_none(_attr(session, "date")),
+        "t0_date": _iso_or_none(_attr(session, "t0_date")),
+        "session_start_time": pd.to_timedelta(start).total_seconds() if start is not None and not pd.isna(start) else None,
+        "drivers": [str(d) for d in (_attr(session, "drivers") or [])],
+    }
+
+
+def _attr(session, name: str):
+    # FastF1 raises DataNotLoadedError for parts that were not loaded
+    try:
+        return getattr(session, name, None)
+    except Exception:
+        return None
+
+
+def _frame(session, name: str) -> pd.DataFrame | None:
+    df = _attr(session, name)
+    if df is None or not isinstance(df, pd.DataFrame):
+        return None
+    return df
+
+
+def _concat_telemetry(per_driver: dict | None) -> pd.DataFrame | None:
+    """
+    {driver_number: Telemetry} -> one frame with a DriverNumber column.
+    """
+    if not per_driver:
+        return None
+    frames = [pd.DataFrame(tel).assign(DriverNumber=str(drv)) for drv, tel in per_driver.items()]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _split_telemetry(df: pd.DataFrame | None, session) -> dict:
+    if df is None or df.empty or "DriverNumber" not in df.columns:
+        return {}
+    out = {}
+    for drv, ddf in df.groupby("DriverNumber", sort=False):
+        tel = ddf.drop(columns=["DriverNumber"]).reset_index(drop=True)
+        out[str(drv)] = Telemetry(tel, session=session, driver=str(drv))
+    return out
+
+
+def _iso_or_none(x) -> str | None:
+    if x is None or pd.isna(x):
+        return None
+    try:
+        return pd.Timestamp(x).isoformat()
+    except Exception:
+        return None
+
+
+def _ts_or_none(x) -> pd.Timestamp | None:
+    return pd.Timestamp(x) if x else None
+
+
+def _td_or_none(x) -> pd.Timedelta | None:
+    return pd.to_timedelta(x, unit="s") if x is not None else None
@@ -0,0 +1,180 @@
+# fpd/data/telemetry_store.py
+from __future__ import annotations
+
+from collections import OrderedDict
+import threading
+from typing import Iterable, Literal
+
+import pandas as pd
+
+from fpd.core.config import CONFIG
+from fpd.data.session_memo import session_memo
+
+
+TelemetrySource = Literal["merged", "car"]
+
+# (driver, lap number, source, channel set); channel set None => every channel of that source
+TelemetryKey = tuple[str, float, TelemetrySource, tuple[str, ...] | None]
+
+# Channels that only exist after merging car data with position data (get_telemetry()).
+# Anything else is served from car_data alone.
+MERGED_ONLY_CHANNELS = frozenset(
+    {"X", "Y", "Z", "Status", "DriverAhead", "DistanceToDriverAhead", "RelativeDistance"}
+)
+
+
+class TelemetryStore:
+    """
+    Per-session cache of lap telemetry (+ Distance).
+
+    - Channel-aware source per request:
+        * car: lap.get_car_data() + add_distance() when no positional channel is needed
+        * merged: lap.get_telemetry() (car + position merge) for X/Y/track-map uses
+    - Each lap's telemetry is computed once per source, then sliced per channel set
+    - Bounded LRU (CONFIG.telemetry_cache_max_laps entries)
+    - Returned frames are shared between callers: treat them as read-only
+    """
+
+    def __init__(self, session, max_laps: int = CONFIG.telemetry_cache_max_laps):
+        self.session = session
+        self.max_laps = max(1, int(max_laps))
+        self._frames: OrderedDict[TelemetryKey, pd.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, lap, channels: Iterable[str] | None = None) -> pd.DataFrame:
+        """
+        Telemetry for a FastF1 lap row:
+          - channels None => all channels
+          - else Distance + requested channels that exist
+        Raises like lap.get_telemetry() when telemetry is unavailable.
+        """
+        driver, lap_number = _lap_id(lap)
+        ch = _channel_key(channels)
+        source = telemetry_source(ch)
+
+        if lap_number is None:
+            # Laps without a number cannot be keyed safely; compute uncached
+            return _select(_compute(lap, source), ch)
+
+        cached = self._get_cached((driver, lap_number, source, ch))
+        if cached is not None:
+            return cached
+
+        full = self._get_cached((driver, lap_number, source, None))
+        if full is None:
+            full = _compute(lap, source)
+            self._put((driver, lap_number, source, None), full)
+
+        if ch is None:
+            return full
+
+        df = _select(full, ch)
+        self._put((driver, lap_number, source, ch), df)
+        return df
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._frames)
+
+    def _get_cached(self, key: TelemetryKey) -> pd.DataFrame | None:
+        with self._lock:
+            df = self._frames.get(key)
+            if df is not None:
+                self._frames.move_to_end(key)
+            return df
+
+    def _put(self, key: TelemetryKey, df: pd.DataFrame) -> None:
+        with self._lock:
+            self._frames[key] = df
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_laps:
+                self._frames.popitem(last=False)
+
+
+# -----------------------------
+# Public helpers
+# -----------------------------
+def get_telemetry_store(session) -> TelemetryStore:
+    """
+    The TelemetryStore bound to a loaded session (one per session, shared by all callers).
+    """
+    return session_memo(session, "telemetry_store", lambda: TelemetryStore(session))
+
+
+def lap_telemetry(lap, channels: Iterable[str] | None = None) -> pd.DataFrame:
+    """
+    The way analytics/components get lap telemetry.
+    Uses the lap's session store when the lap knows its session.
+    """
+    session = getattr(lap, "session", None)
+    if session is None:
+        ch = _channel_key(channels)
+        return _select(_compute(lap, telemetry_source(ch)), ch)
+
+    return get_telemetry_store(session).get(lap, channels)
+
+
+def telemetry_source(channels: Iterable[str] | None) -> TelemetrySource:
+    """
+    "car" unless a channel needs the position merge (or all channels are requested).
+    """
+    if channels is None:
+        return "merged"
+    return "merged" if MERGED_ONLY_CHANNELS.intersection(channels) else "car"
+
+
+# -----------------------------
+# Internals
+# -----------------------------
+def _compute(lap, source: TelemetrySource) -> pd.DataFrame:
+    return _car_telemetry(lap) if source == "car" else _merged_telemetry(lap)
+
+
+def _car_telemetry(lap) -> pd.DataFrame:
+    """
+    Car data sliced to the lap window, with Distance integrated from Speed.
+    Skips the position merge + resampling that get_telemetry() does.
+    """
+    car = lap.get_car_data()
+    if car is None or len(car) == 0:
+        return pd.DataFrame(columns=["Distance"])
+
+    return car.add_distance()
+
+
+def _merged_telemetry(lap) -> pd.DataFrame:
+    tel = lap.get_telemetry()
+    if tel is None or len(tel) == 0:
+        return pd.DataFrame(columns=["Distance"])
+
+    if "Distance" not in tel.columns:
+        tel = tel.add_distance()
+
+    return tel
+
+
+def _select(full: pd.DataFrame, ch: tuple[str, ...] | None) -> pd.DataFrame:
+    if ch is None:
+        return full
+    return full[["Distance", *[c for c in ch if c in full.columns and c != "Distance"]]]
+
+
+def _lap_id(lap) -> tuple[str, float | None]:
+    driver = str(lap.get("Driver", "")).strip().upper()
+    try:
+        lap_number = float(lap.get("LapNumber"))
+    except Exception:
+        return driver, None
+    if pd.isna(lap_number):
+        return driver, None
+    return driver, lap_number
+
+
+def _channel_key(channels: Iterable[str] | None) -> tuple[str, ...] | None:
+    if channels is None:
+        return None
+    return tuple(sorted({str(c) for c in channels}))
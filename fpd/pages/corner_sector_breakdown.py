@@ -35,7 +35,8 @@ def render() -> None:
     # Load session
     # -------------------------
     with st.spinner("Loading session data..."):
-        session = load_session(season, event_name, session_identifier)
+        # Load profile: corner metrics need telemetry
+        session = load_session(season, event_name, session_identifier, profile="laps+telemetry")
 
     if session is None:
         st.stop()
@@ -40,7 +40,8 @@ def render() -> None:
     # Load session
     # -------------------------
     with st.spinner("Loading session data..."):
-        session = load_session(season, event_name, session_identifier)
+        # Load profile: track map + temperatures + top speed need telemetry and weather
+        session = load_session(season, event_name, session_identifier, profile="full")
 
     if session is None:
         st.stop()
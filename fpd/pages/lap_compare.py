@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import streamlit as st
 
+from fpd.components.all_time_selectors import render_all_time_selectors
 from fpd.components.topbar_selectors import render_topbar
 from fpd.components.compare_charts import render_compare_stack
+from fpd.analytics.compare import CompareRequest, LapRef, build_compare
 
 from fpd.data.session_loader import load_session
 from fpd.data.validators import validate_topbar, validate_driver_selection
@@ -19,8 +21,9 @@ def render() -> None:
       - Charts stacked vertically (handled by render_compare_stack)
 
     Note:
-      - This is the UI scaffold. Real telemetry overlays will be wired in later using
-        fpd/analytics/compare.py
+      - Both modes come from fpd/analytics/compare.py (build_compare).
+      - All Time mode: one Season / Event / Session / Driver row per lap; sessions or
+        laps that could not be loaded are listed above the charts.
     """
     st.header("Lap Compare")
 
@@ -33,7 +36,8 @@ def render() -> None:
             st.stop()
 
         with st.spinner("Loading session data..."):
-            session = load_session(season, event_name, session_identifier)
+            # Load profile: telemetry overlays need car/position data
+            session = load_session(season, event_name, session_identifier, profile="laps+telemetry")
 
         if session is None:
             st.stop()
@@ -62,17 +66,31 @@ def render() -> None:
         if not validate_driver_selection(selected_drivers):
             st.stop()
 
+        result = None
+        try:
+            req = CompareRequest(mode="current", laps=[LapRef(driver=d) for d in selected_drivers])
+            result = build_compare(session, req)
+        except Exception as e:
+            st.warning(f"Could not build lap comparison: {e}")
+
         st.divider()
-        render_compare_stack(session=session, mode="current")
+        render_compare_stack(session=session, mode="current", result=result)
 
     else:
-        st.info(
-            "All Time mode scaffold:\n\n"
-            "- Select Year + Drivers + fastest lap\n"
-            "- Add another year with a '+' button\n\n"
-            "We’ll implement this after current-session compare is fully working."
-        )
-
-        # Still show chart stack placeholders in all_time mode
+        refs = render_all_time_selectors()
+        if len(refs) < 2:
+            st.info("Fill in Season, Event, Session and Driver for at least two laps.")
+            st.stop()
+
+        result = None
+        try:
+            with st.spinner("Loading sessions..."):
+                result = build_compare(None, CompareRequest(mode="all_time", laps=refs))
+        except Exception as e:
+            st.warning(f"Could not build lap comparison: {e}")
+
+        if result is not None and result.skipped:
+            st.warning("Left out of the comparison:\n\n" + "\n".join(f"- {s}" for s in result.skipped))
+
         st.divider()
-        render_compare_stack(session=None, mode="all_time")
+        render_compare_stack(session=None, mode="all_time", result=result)
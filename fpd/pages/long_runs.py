@@ -34,7 +34,8 @@ def render() -> None:
     # Load session
     # -------------------------
     with st.spinner("Loading session data..."):
-        session = load_session(season, event_name, session_identifier)
+        # Load profile: lap times only
+        session = load_session(season, event_name, session_identifier, profile="laps")
 
     if session is None:
         st.stop()
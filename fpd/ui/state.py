@@ -45,11 +45,26 @@ def init_state() -> None:
     st.session_state.setdefault(StateKeys.EVENT_KEY, None)
 
 
-def make_session_key(season: int, event_name: str, session_name: str) -> str:
+def make_session_key(
+    season: int,
+    event_name: str,
+    session_name: str | int,
+    event_key: int | None = None,
+    test_number: int | None = None,
+) -> str:
     """
-    A stable identifier for the currently loaded session.
+    A stable identifier for a session.
+
+    Identity is (season, event, session, test number):
+      - event_key (unique schedule row) is preferred over event_name when known
+      - test_number is only part of the key for testing sessions
+    Also used as the key of the process-wide session cache.
     """
-    return f"{season}::{event_name.strip()}::{session_name.strip()}"
+    event = str(int(event_key)) if event_key is not None else str(event_name).strip()
+    key = f"{season}::{event}::{str(session_name).strip()}"
+    if test_number is not None:
+        key = f"{key}::T{int(test_number)}"
+    return key
 
 
 def has_session_changed(season: int, event_name: str, session_name: str) -> bool:
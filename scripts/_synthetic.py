@@ -0,0 +1,173 @@
+# scripts/_synthetic.py
+"""
+Synthetic sessions for the benchmark scripts (no network, no FastF1 cache needed).
+
+make_session() returns a fpd StoredSession built from generated frames, so laps are real
+fastf1.core.Laps / Telemetry objects: lap.get_car_data(), lap.get_telemetry() and every
+fpd analytics module work on it like on a loaded FastF1 session.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fpd.data.session_store import StoredSession  # noqa: E402
+
+
+TRACK_LENGTH_M = 5400.0
+CORNER_APEXES_M = np.array([350, 900, 1400, 1750, 2300, 2700, 3300, 3900, 4300, 4900], dtype=float)
+T0_DATE = pd.Timestamp("2024-03-02 15:00:00")
+
+
+def track_speed(dist_m: np.ndarray) -> np.ndarray:
+    """
+    km/h along the lap: 320 on straights, dips of 120-220 km/h at each corner.
+    """
+    d = np.asarray(dist_m, dtype=float)[:, None] % TRACK_LENGTH_M
+    depth = np.linspace(120.0, 220.0, len(CORNER_APEXES_M))[None, :]
+    dips = depth * np.exp(-((d - CORNER_APEXES_M[None, :]) ** 2) / (2 * 70.0**2))
+    return np.maximum(320.0 - dips.sum(axis=1), 70.0)
+
+
+def track_xy(dist_m: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    th = np.asarray(dist_m, dtype=float) / TRACK_LENGTH_M * 2 * np.pi
+    return 1600.0 * np.cos(th) + 300.0 * np.cos(3 * th), 900.0 * np.sin(th) + 200.0 * np.sin(2 * th)
+
+
+def make_session(
+    n_drivers: int = 4,
+    n_laps: int = 10,
+    car_hz: float = 4.0,
+    pos_hz: float = 4.0,
+    seed: int = 0,
+) -> StoredSession:
+    rng = np.random.default_rng(seed)
+    lap_rows, result_rows, car_frames, pos_frames = [], [], [], []
+
+    # One reference lap: session time offset within the lap at every metre
+    grid = np.arange(0.0, TRACK_LENGTH_M + 1.0, 1.0)
+    v = track_speed(grid) / 3.6
+    lap_t = np.concatenate(([0.0], np.cumsum(np.diff(grid) / ((v[1:] + v[:-1]) / 2.0))))
+    lap_s = float(lap_t[-1])
+
+    # Like the F1 live timing feed, every car is sampled on the same session clock
+    session_end = 60.0 + 2.0 * n_drivers + n_laps * lap_s * (1.0 + 0.004 * n_drivers) + 10.0
+    clocks = {
+        source: np.arange(50.0, session_end, 1.0 / hz) + rng.uniform(0, 0.5 / hz)
+        for source, hz in (("car", car_hz), ("pos", pos_hz))
+    }
+
+    for k in range(n_drivers):
+        number, code = str(k + 1), f"D{k:02d}"
+        pace = 1.0 + 0.004 * k
+        start = 60.0 + 2.0 * k
+        laps_start = start + np.arange(n_laps) * lap_s * pace
+
+        for frames, source in ((car_frames, "car"), (pos_frames, "pos")):
+            t = clocks[source]
+            lap_pos = np.maximum(t - start, 0.0) / pace
+            dist = np.interp(lap_pos % lap_s, lap_t, grid) + np.floor(lap_pos / lap_s) * TRACK_LENGTH_M
+            base = {
+                "Date": T0_DATE + pd.to_timedelta(t, unit="s"),
+                "SessionTime": pd.to_timedelta(t, unit="s"),
+                "Time": pd.to_timedelta(t - t[0], unit="s"),
+            }
+            if source == "car":
+                speed = track_speed(dist) + rng.normal(0.0, 1.0, len(t))
+                frames.append(
+                    pd.DataFrame(
+                        {
+                            **base,
+                            "RPM": speed * 38.0,
+                            "Speed": speed,
+                            "nGear": np.clip(speed // 40.0, 1, 8).astype(int),
+                            "Throttle": np.clip((speed - 120.0) / 2.0, 0.0, 100.0),
+                            "Brake": np.gradient(speed) < -1.5,
+                            "DRS": 0,
+                            "Source": "car",
+                            "DriverNumber": number,
+                        }
+                    )
+                )
+            else:
+                x, y = track_xy(dist)
+                frames.append(
+                    pd.DataFrame(
+                        {**base, "X": x, "Y": y, "Z": 0.0, "Status": "OnTrack", "Source": "pos", "DriverNumber": number}
+                    )
+                )
+
+        best = np.inf
+        for i, ls in enumerate(laps_start):
+            lt = lap_s * pace + rng.normal(0.0, 0.2)
+            is_pb, best = lt < best, min(best, lt)
+            s1, s2 = lt * 0.33, lt * 0.34
+            lap_rows.append(
+                {
+                    "Time": pd.to_timedelta(ls + lt, unit="s"),
+                    "Driver": code,
+                    "DriverNumber": number,
+                    "LapTime": pd.to_timedelta(lt, unit="s"),
+                    "LapNumber": float(i + 1),
+                    "Stint": 1.0,
+                    "PitOutTime": pd.NaT,
+                    "PitInTime": pd.NaT,
+                    "Sector1Time": pd.to_timedelta(s1, unit="s"),
+                    "Sector2Time": pd.to_timedelta(s2, unit="s"),
+                    "Sector3Time": pd.to_timedelta(lt - s1 - s2, unit="s"),
+                    "Sector1SessionTime": pd.to_timedelta(ls + s1, unit="s"),
+                    "Sector2SessionTime": pd.to_timedelta(ls + s1 + s2, unit="s"),
+                    "Sector3SessionTime": pd.to_timedelta(ls + lt, unit="s"),
+                    "IsPersonalBest": bool(is_pb),
+                    "Compound": "SOFT" if i < n_laps // 2 else "MEDIUM",
+                    "TyreLife": float(i + 1),
+                    "FreshTyre": True,
+                    "Team": f"Team {k // 2}",
+                    "LapStartTime": pd.to_timedelta(ls, unit="s"),
+                    "LapStartDate": T0_DATE + pd.to_timedelta(ls, unit="s"),
+                    "TrackStatus": "1",
+                    "Position": np.nan,
+                    "Deleted": False,
+                    "DeletedReason": "",
+                    "FastF1Generated": False,
+                    "IsAccurate": True,
+                }
+            )
+        result_rows.append({"DriverNumber": number, "Abbreviation": code, "TeamName": f"Team {k // 2}", "Position": float(k + 1)})
+
+    manifest = {
+        "name": "Qualifying",
+        "event": {"EventName": "Synthetic Grand Prix", "Location": "Synthetic", "EventDate": "2024-03-02"},
+        "date": str(T0_DATE),
+        "t0_date": str(T0_DATE),
+        "session_start_time": 0.0,
+        "drivers": [str(k + 1) for k in range(n_drivers)],
+    }
+    frames = {
+        "results": pd.DataFrame(result_rows),
+        "laps": pd.DataFrame(lap_rows),
+        "car_data": pd.concat(car_frames, ignore_index=True),
+        "pos_data": pd.concat(pos_frames, ignore_index=True),
+    }
+    return StoredSession(manifest, frames)
+
+
+def timeit(fn: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Best wall time of fn() over repeat runs (s).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
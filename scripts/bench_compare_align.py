@@ -0,0 +1,103 @@
+# scripts/bench_compare_align.py
+"""
+Lap Compare alignment (user-009): per-lap/per-channel np.interp into a long DataFrame
+(the pre-user-009 _align_all_to_grid, copied below) vs one batched _interp_batch.
+
+    python scripts/bench_compare_align.py --laps 2 5 10 20 --step 1 0.25
+
+Telemetry is extracted once from a synthetic session (not timed); only the alignment
+onto the shared distance grid is timed.
+"""
+from __future__ import annotations
+
+import argparse
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+import _synthetic as syn
+
+from fpd.analytics.compare import (
+    DEFAULT_CHANNELS,
+    ELAPSED_CHANNEL,
+    _channel_matrix,
+    _distance_grid,
+    _extract_telemetry_distance,
+    _interp_batch,
+)
+
+
+# -----------------------------
+# Baseline (before user-009)
+# -----------------------------
+def _old_align_all_to_grid(per_driver_tel: list[pd.DataFrame], grid: np.ndarray, channels: Iterable[str]) -> pd.DataFrame:
+    out_frames = []
+    channels = tuple(channels)
+    for df in per_driver_tel:
+        driver = str(df.get("Driver", pd.Series(["UNK"])).iloc[0])
+        aligned = pd.DataFrame({"Distance": grid})
+        x = df["Distance"].to_numpy(dtype=float)
+        for c in channels:
+            if c not in df.columns:
+                aligned[c] = np.nan
+                continue
+            y = pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float)
+            aligned[c] = _old_interp_1d(x, y, grid)
+        aligned["Driver"] = driver
+        out_frames.append(aligned)
+
+    wide = pd.concat(out_frames, ignore_index=True)
+    if "Gear" in wide.columns:
+        wide["Gear"] = pd.to_numeric(wide["Gear"], errors="coerce").round().astype("Int64")
+    return wide[["Distance", "Driver", *[c for c in channels if c in wide.columns]]]
+
+
+def _old_interp_1d(x: np.ndarray, y: np.ndarray, x_new: np.ndarray) -> np.ndarray:
+    mask = np.isfinite(x) & np.isfinite(y)
+    x2, y2 = x[mask], y[mask]
+    if len(x2) < 2:
+        return np.full_like(x_new, np.nan, dtype=float)
+    order = np.argsort(x2)
+    return np.interp(x_new, x2[order], y2[order])
+
+
+def _old(tels: list[pd.DataFrame], step_m: float, channels: tuple[str, ...]) -> pd.DataFrame:
+    grid = np.arange(0.0, min(float(t["Distance"].max()) for t in tels) + step_m, step_m)
+    return _old_align_all_to_grid(tels, grid, channels)
+
+
+# -----------------------------
+# Current
+# -----------------------------
+def _new(tels: list[pd.DataFrame], step_m: float, channels: tuple[str, ...]) -> np.ndarray:
+    grid = _distance_grid(max(float(t["Distance"].max()) for t in tels), step_m)
+    xs = [t["Distance"].to_numpy(dtype=float) for t in tels]
+    ys = [_channel_matrix(t, channels) for t in tels]
+    return _interp_batch(xs, ys, grid, dtype=np.float64)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--laps", type=int, nargs="+", default=[2, 5, 10, 20])
+    p.add_argument("--step", type=float, nargs="+", default=[1.0, 0.25])
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    channels = (*DEFAULT_CHANNELS, ELAPSED_CHANNEL)
+    n_max = max(args.laps)
+    session = syn.make_session(n_drivers=n_max, n_laps=2)
+    laps = [lap for _, lap in session.laps.iterlaps()][:n_max]
+    tels = [_extract_telemetry_distance(lap, channels).assign(Driver=lap["Driver"]) for lap in laps]
+
+    print(f"{'laps':>5} {'step':>6} {'old ms':>9} {'new ms':>9} {'speedup':>8}")
+    for step in args.step:
+        for n in args.laps:
+            sub = tels[:n]
+            old = syn.timeit(lambda: _old(sub, step, channels), args.repeat)
+            new = syn.timeit(lambda: _new(sub, step, channels), args.repeat)
+            print(f"{n:>5} {step:>6} {old * 1e3:>9.2f} {new * 1e3:>9.2f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# scripts/bench_corner_metrics.py
+"""
+Corner metrics (user-019): the per-corner filter/copy loop (pre-user-019, copied below)
+vs the vectorized _corner_metrics_frame.
+
+    python scripts/bench_corner_metrics.py --hz 4 50 240 --corners 18
+
+One lap of a synthetic session is sampled at each --hz (4 Hz is raw FastF1 car data;
+higher rates stand in for resampled/merged telemetry) and both implementations run
+on the same telemetry and corners. Results are checked to be equal before timing.
+"""
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import _synthetic as syn
+
+from fpd.analytics.corner_sector import (
+    CornerMetrics,
+    _corner_metrics_frame,
+    _get_tel,
+    build_fallback_corners,
+)
+
+
+# -----------------------------
+# Baseline (before user-019)
+# -----------------------------
+def _old_corner_metrics(driver: str, tel: pd.DataFrame, corners, thresholds) -> pd.DataFrame:
+    per_corner = []
+    for c in corners:
+        seg = tel[(tel["Distance"] >= c.start_m) & (tel["Distance"] <= c.end_m)].copy()
+        if seg.empty:
+            per_corner.append(CornerMetrics(c.corner_number, "Medium-speed", None, None, None, None, None, None))
+            continue
+        per_corner.append(_old_compute(seg, c.corner_number, thresholds))
+    return pd.DataFrame([_old_row(driver, m) for m in per_corner])
+
+
+def _old_compute(seg: pd.DataFrame, corner_no: int, thresholds) -> CornerMetrics:
+    low_max, med_max = thresholds
+    speed = seg["Speed"].to_numpy(dtype=float)
+    dist = seg["Distance"].to_numpy(dtype=float)
+    k = max(3, len(speed) // 10)
+    entry, exit_, min_speed = float(np.nanmean(speed[:k])), float(np.nanmean(speed[-k:])), float(np.nanmin(speed))
+    if np.isnan(min_speed):
+        group = "Medium-speed"
+    elif min_speed <= low_max:
+        group = "Low-speed"
+    elif min_speed <= med_max:
+        group = "Medium-speed"
+    else:
+        group = "High-speed"
+
+    seg_time = np.nan
+    if len(dist) >= 2:
+        d = np.diff(dist, prepend=dist[0])
+        d[0] = d[1]
+        seg_time = float(np.nansum(d / np.maximum(0.1, speed / 3.6)))
+
+    brake = np.nan
+    idx = np.where(seg["Brake"].to_numpy(dtype=float) > 0.1)[0]
+    if len(idx) == 0:
+        idx = np.where(np.diff(speed, prepend=speed[0]) < -2.5)[0]
+    if len(idx):
+        brake = float(dist[idx[0]])
+
+    throttle_on = np.nan
+    if len(speed) >= 3:
+        apex = int(np.nanargmin(speed))
+        after = np.where(seg["Throttle"].to_numpy(dtype=float)[apex:] > 0.6)[0]
+        if len(after):
+            throttle_on = float(dist[apex + after[0]])
+
+    return CornerMetrics(
+        corner_no, group, _nan_to_none(entry), _nan_to_none(min_speed), _nan_to_none(exit_),
+        _nan_to_none(brake), _nan_to_none(throttle_on), _nan_to_none(seg_time),
+    )
+
+
+def _nan_to_none(x: float) -> float | None:
+    return None if np.isnan(x) else float(x)
+
+
+def _old_row(driver: str, m: CornerMetrics) -> dict:
+    return {
+        "Driver": driver,
+        "Corner": m.corner_number,
+        "Type": m.group,
+        "EntrySpeed": m.entry_speed,
+        "MinSpeed": m.min_speed,
+        "ExitSpeed": m.exit_speed,
+        "BrakeStart(m)": m.brake_start_m,
+        "ThrottleOn(m)": m.throttle_on_m,
+        "CornerTime(s)": m.segment_time_s,
+    }
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--hz", type=float, nargs="+", default=[4.0, 50.0, 240.0])
+    p.add_argument("--corners", type=int, default=18)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    thresholds = (120.0, 190.0)
+    print(f"{'Hz':>5} {'samples':>8} {'loop ms':>8} {'vector ms':>10} {'speedup':>8}")
+    for hz in args.hz:
+        session = syn.make_session(n_drivers=1, n_laps=1, car_hz=hz)
+        tel = _get_tel(session.laps.iloc[0])
+        corners = build_fallback_corners(float(tel["Distance"].max()), n_corners=args.corners)
+
+        old = _old_corner_metrics("D00", tel, corners, thresholds)
+        new = _corner_metrics_frame("D00", tel, corners, thresholds)
+        pd.testing.assert_frame_equal(old.astype({c: float for c in old.columns[3:]}), new, check_dtype=False)
+
+        t_old = syn.timeit(lambda: _old_corner_metrics("D00", tel, corners, thresholds), args.repeat)
+        t_new = syn.timeit(lambda: _corner_metrics_frame("D00", tel, corners, thresholds), args.repeat)
+        print(f"{hz:>5.0f} {len(tel):>8,} {t_old * 1e3:>8.2f} {t_new * 1e3:>10.2f} {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
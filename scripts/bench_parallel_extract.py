@@ -0,0 +1,64 @@
+# scripts/bench_parallel_extract.py
+"""
+Concurrent lap extraction (user-015): parallel_map "serial" vs "thread" over laps.
+
+    python scripts/bench_parallel_extract.py --laps 4 10 20 --workers 4
+
+Extracts every lap with Lap Compare's _extract_telemetry_distance, for the car-only
+channels Lap Compare uses and for X/Y (the merged get_telemetry path the corner
+breakdown and track maps use). The session TelemetryStore is cleared before every
+run, so each run computes telemetry instead of reading the cache.
+
+The machine's CPU count is printed first. With a single CPU, threads cannot overlap
+any work, so the speedup column is left out (times are still reported).
+"""
+from __future__ import annotations
+
+import argparse
+from functools import partial
+import os
+
+import _synthetic as syn
+
+from fpd.analytics.compare import DEFAULT_CHANNELS, _extract_telemetry_distance
+from fpd.core.parallel import parallel_map
+from fpd.data.telemetry_store import get_telemetry_store
+
+
+CHANNEL_SETS = {
+    "car": DEFAULT_CHANNELS,
+    "merged": ("Speed", "X", "Y"),
+}
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--laps", type=int, nargs="+", default=[4, 10, 20])
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--drivers", type=int, default=20)
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    session = syn.make_session(n_drivers=args.drivers, n_laps=max(1, -(-max(args.laps) // args.drivers)))
+    laps = [lap for _, lap in session.laps.iterlaps()]
+    store = get_telemetry_store(session)
+    cpus = os.cpu_count() or 1
+    print(f"synthetic session: {args.drivers} drivers, {len(laps)} laps, {cpus} CPUs, {args.workers} workers")
+    if cpus < 2:
+        print("only 1 CPU available: no speedup is expected or reported")
+
+    def run(kind: str, n: int, channels: tuple[str, ...]) -> None:
+        store.clear()
+        parallel_map(partial(_extract_telemetry_distance, channels=channels), laps[:n], pool=kind, workers=args.workers)
+
+    print(f"{'source':>7} {'laps':>5} {'serial ms':>10} {'thread ms':>10}" + (f" {'speedup':>8}" if cpus > 1 else ""))
+    for source, channels in CHANNEL_SETS.items():
+        for n in args.laps:
+            serial = syn.timeit(lambda: run("serial", n, channels), args.repeat)
+            thread = syn.timeit(lambda: run("thread", n, channels), args.repeat)
+            speedup = f" {serial / thread:>7.1f}x" if cpus > 1 else ""
+            print(f"{source:>7} {n:>5} {serial * 1e3:>10.0f} {thread * 1e3:>10.0f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
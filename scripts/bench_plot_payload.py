@@ -0,0 +1,90 @@
+# scripts/bench_plot_payload.py
+"""
+Lap Compare plot payload (user-014): full-resolution traces vs compare_plot_payload.
+
+    python scripts/bench_plot_payload.py --drivers 2 4 10 --step 1 0.25
+
+For every chart of the compare stack this builds the plotly figure the page would send
+(px.line, then .to_json(), what Streamlit ships to the browser) from:
+  - full: the CompareResult long frames (one point per grid step and lap)
+  - payload: compare_plot_payload (about POINTS_PER_PX x CONFIG.plot_width_px points per chart)
+and reports points, JSON size, px.line build time and serialize time (payload serialize
+time includes the downsampling). px.line has a fixed cost per figure whatever the point
+count, so it is reported apart; at 2 laps / 1 m it dominates and the total time is
+about even, the saving there is the JSON size. The comparison itself comes from a
+synthetic session (not timed). With --check, every row must ship at least 3x less JSON.
+"""
+from __future__ import annotations
+
+import argparse
+
+import plotly.express as px
+
+import _synthetic as syn
+
+from fpd.analytics.compare import DEFAULT_CHANNELS, CompareRequest, LapRef, build_compare
+from fpd.analytics.downsample import DELTA_CHART, compare_plot_payload
+
+
+def _full_frames(result) -> dict:
+    long = result.telemetry
+    out = {ch: long[["Distance", "Driver", ch]] for ch in result.traces.channels}
+    out[DELTA_CHART] = result.delta
+    return out
+
+
+def _figures(frames: dict) -> list:
+    return [px.line(df, x="Distance", y=name, color="Driver") for name, df in frames.items()]
+
+
+def _to_json(figures: list) -> list[str]:
+    return [fig.to_json() for fig in figures]
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--drivers", type=int, nargs="+", default=[2, 4, 10])
+    p.add_argument("--step", type=float, nargs="+", default=[1.0, 0.25])
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--check", action="store_true", help="fail unless the payload JSON is at least 3x smaller")
+    args = p.parse_args()
+
+    session = syn.make_session(n_drivers=max(args.drivers), n_laps=2)
+    codes = sorted(session.laps["Driver"].unique())
+
+    print(
+        f"{'laps':>5} {'step':>6} {'full pts':>10} {'full MB':>8} {'build ms':>9} {'json ms':>8}"
+        f" {'pay pts':>8} {'pay MB':>7} {'build ms':>9} {'json ms':>8} {'size':>6} {'json':>6}"
+    )
+    failures = []
+    for step in args.step:
+        for n in args.drivers:
+            req = CompareRequest(mode="current", laps=[LapRef(driver=d) for d in codes[:n]], channels=DEFAULT_CHANNELS, resample_m=step)
+            result = build_compare(session, req)
+
+            full = _full_frames(result)
+            full_figs = _figures(full)
+            full_mb = sum(map(len, _to_json(full_figs))) / 1e6
+            full_build = syn.timeit(lambda: _figures(full), args.repeat)
+            full_json = syn.timeit(lambda: _to_json(full_figs), args.repeat)
+
+            payload = compare_plot_payload(result)
+            pay_figs = _figures(payload)
+            pay_mb = sum(map(len, _to_json(pay_figs))) / 1e6
+            pay_build = syn.timeit(lambda: _figures(payload), args.repeat)
+            pay_json = syn.timeit(lambda: (compare_plot_payload(result), _to_json(pay_figs)), args.repeat)
+
+            print(
+                f"{n:>5} {step:>6} {sum(map(len, full.values())):>10,} {full_mb:>8.2f} {full_build * 1e3:>9.0f} {full_json * 1e3:>8.0f}"
+                f" {sum(map(len, payload.values())):>8,} {pay_mb:>7.2f} {pay_build * 1e3:>9.0f} {pay_json * 1e3:>8.0f}"
+                f" {full_mb / pay_mb:>5.1f}x {full_json / pay_json:>5.1f}x"
+            )
+            if full_mb < 3 * pay_mb:
+                failures.append(f"{n} laps at {step} m")
+
+    if args.check and failures:
+        raise SystemExit("payload JSON not 3x smaller than the full frames: " + ", ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
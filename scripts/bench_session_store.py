@@ -0,0 +1,120 @@
+# scripts/bench_session_store.py
+"""
+Session store (user-004): time reading a session back from the fpd Parquet store.
+
+    python scripts/bench_session_store.py                         # synthetic session
+    python scripts/bench_session_store.py --drivers 20 --laps 57  # race-sized
+    python scripts/bench_session_store.py --fastf1 2024 Bahrain R # real FastF1 side
+
+Synthetic mode writes a generated session to a temp store twice (a "laps" and a
+"laps+telemetry" profile) and times read_session of each, next to pickle.loads of the same frames (the
+deserialization floor FastF1's own cache starts from).
+
+What the store replaces is FastF1's warm-cache load: unpickling the raw live-timing
+responses *and* re-running FastF1's parsing (lap assembly, telemetry merge). That
+parsing only runs on real API payloads, so it cannot be reproduced from generated
+frames; --fastf1 times it on a real session (needs network on the first run, then the
+FastF1 cache under CONFIG.cache_dir) against the store read of that same session.
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import pickle
+import tempfile
+import time
+
+import _synthetic as syn
+
+from fpd.data import session_store
+
+
+PARTS = {
+    "laps": frozenset({"laps"}),
+    "laps+telemetry": frozenset({"laps", "telemetry"}),
+}
+
+
+def _use_temp_store(root: Path) -> None:
+    session_store.store_dir = lambda key, cache_dir=str(root): Path(cache_dir) / "fpd_sessions" / key
+
+
+def _write_profiles(session) -> None:
+    # One store dir per profile, keyed by the profile name
+    for name, parts in PARTS.items():
+        session_store.write_session(name, session, parts)
+
+
+def _frames(session) -> dict:
+    return {
+        "laps": session_store._frame(session, "laps"),
+        "car_data": session_store._concat_telemetry(session.car_data),
+        "pos_data": session_store._concat_telemetry(session.pos_data),
+    }
+
+
+def bench_synthetic(drivers: int, laps: int, repeat: int) -> None:
+    session = syn.make_session(n_drivers=drivers, n_laps=laps)
+    frames = _frames(session)
+    rows = sum(len(df) for df in frames.values())
+    print(f"synthetic session: {drivers} drivers x {laps} laps, {rows:,} rows")
+
+    with tempfile.TemporaryDirectory() as root:
+        _use_temp_store(Path(root))
+        _write_profiles(session)
+        size = sum(f.stat().st_size for f in session_store.store_dir("laps+telemetry").iterdir())
+        blob = pickle.dumps(frames, protocol=pickle.HIGHEST_PROTOCOL)
+        print(f"store size: {size / 1e6:.1f} MB, pickle size: {len(blob) / 1e6:.1f} MB")
+
+        for name, parts in PARTS.items():
+            t = syn.timeit(lambda: session_store.read_session(name, parts), repeat)
+            print(f"  read_session {name:<17} {t * 1e3:8.1f} ms")
+        t = syn.timeit(lambda: pickle.loads(blob), repeat)
+        print(f"  pickle.loads (all frames)      {t * 1e3:8.1f} ms")
+
+
+def bench_fastf1(season: int, event: str, identifier: str) -> None:
+    import fastf1
+
+    from fpd.data.fastf1_cache import ensure_cache
+
+    ensure_cache()
+
+    def load():
+        s = fastf1.get_session(season, event, identifier)
+        s.load(laps=True, telemetry=True, weather=False, messages=False)
+        return s
+
+    t = time.perf_counter()
+    session = load()
+    print(f"fastf1 first load (cold or warm cache): {time.perf_counter() - t:8.2f} s")
+    t = time.perf_counter()
+    load()
+    print(f"fastf1 warm-cache load:                 {time.perf_counter() - t:8.2f} s")
+
+    with tempfile.TemporaryDirectory() as root:
+        _use_temp_store(Path(root))
+        _write_profiles(session)
+        for name, parts in PARTS.items():
+            t = syn.timeit(lambda: session_store.read_session(name, parts), 3)
+            print(f"store read_session {name:<15}   {t:8.2f} s")
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--drivers", type=int, default=20)
+    p.add_argument("--laps", type=int, default=20)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--fastf1", nargs=3, metavar=("SEASON", "EVENT", "SESSION"))
+    args = p.parse_args()
+
+    if not session_store.is_available():
+        raise SystemExit("pyarrow is not installed; the session store is disabled.")
+    if args.fastf1:
+        bench_fastf1(int(args.fastf1[0]), args.fastf1[1], args.fastf1[2])
+    else:
+        bench_synthetic(args.drivers, args.laps, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# scripts/bench_telemetry_paths.py
+"""
+Car-only telemetry path (user-006): lap.get_car_data().add_distance() vs lap.get_telemetry().
+
+    python scripts/bench_telemetry_paths.py --drivers 20 --laps 10
+
+Times both TelemetryStore sources on every lap of a synthetic session. The merged path
+also merges/resamples position data and computes DriverAhead against every other car,
+which is why its cost grows with the field size while the car path does not.
+"""
+from __future__ import annotations
+
+import argparse
+
+import _synthetic as syn
+
+from fpd.data.telemetry_store import _car_telemetry, _merged_telemetry
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--drivers", type=int, default=20)
+    p.add_argument("--laps", type=int, default=5)
+    p.add_argument("--sample", type=int, default=10, help="laps timed per path")
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    session = syn.make_session(n_drivers=args.drivers, n_laps=args.laps)
+    laps = [lap for _, lap in session.laps.iloc[: args.sample].iterlaps()]
+    print(f"synthetic session: {args.drivers} drivers x {args.laps} laps, timing {len(laps)} laps")
+
+    results = {}
+    for name, fn in (("car (get_car_data)", _car_telemetry), ("merged (get_telemetry)", _merged_telemetry)):
+        t = syn.timeit(lambda: [fn(lap) for lap in laps], args.repeat)
+        results[name] = t
+        print(f"  {name:<24} {t / len(laps) * 1e3:8.1f} ms/lap")
+
+    car, merged = results.values()
+    print(f"  speedup: {merged / car:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import pytest
+
+from fpd.analytics import compare
+from fpd.analytics.compare import CompareRequest, LapRef, build_compare
+from tests.test_compare_payload import _fastf1_lap_telemetry, _session
+
+
+@pytest.fixture
+def fake_sessions(monkeypatch):
+    """
+    fetch_session returns a two-driver session for 2023 and fails for 2021.
+    """
+    calls = []
+
+    def fetch_session(season, event_name, session_name, test_number=None, event_key=None, profile="full"):
+        calls.append((season, event_name, session_name, event_key, test_number, profile))
+        if season == 2021:
+            raise RuntimeError("no data")
+        return _session()
+
+    def lap_telemetry(lap, channels=None):
+        tel = _fastf1_lap_telemetry(0.0 if lap["Driver"] == "VER" else -2.0)
+        return tel[["Distance", *[c for c in channels if c in tel.columns]]]
+
+    monkeypatch.setattr(compare, "fetch_session", fetch_session)
+    monkeypatch.setattr(compare, "lap_telemetry", lap_telemetry)
+    return calls
+
+
+def _ref(driver: str, season: int, **kw) -> LapRef:
+    return LapRef(driver=driver, season=season, event_name="Bahrain Grand Prix", session_name="Q", **kw)
+
+
+def test_all_time_compare_reports_skipped_sessions_and_laps(fake_sessions):
+    req = CompareRequest(
+        mode="all_time",
+        laps=[_ref("VER", 2023, event_key=1), _ref("HAM", 2023, event_key=1), _ref("VER", 2021), _ref("ALO", 2023, event_key=1)],
+    )
+
+    result = build_compare(None, req)
+
+    assert result.traces.drivers == ("VER 2023", "HAM 2023")
+    assert len(result.skipped) == 2
+    assert any("2021 Bahrain Grand Prix Q" in s and "no data" in s for s in result.skipped)
+    assert any(s.startswith("ALO 2023") for s in result.skipped)
+    # One load per distinct session, with the LapRef's event key
+    assert sorted(c[0] for c in fake_sessions) == [2021, 2023]
+    assert (2023, "Bahrain Grand Prix", "Q", 1, None, "laps+telemetry") in fake_sessions
+
+
+def test_all_time_compare_raises_with_reasons_when_nothing_loads(fake_sessions):
+    req = CompareRequest(mode="all_time", laps=[_ref("VER", 2021)])
+
+    with pytest.raises(ValueError, match="no data"):
+        build_compare(None, req)
@@ -0,0 +1,68 @@
+import pandas as pd
+
+from fpd.analytics import circuit_geometry
+from fpd.data.circuit_db import circuit_key
+
+
+class _Session:
+    def __init__(self, **event):
+        self.event = pd.Series(event, dtype=object)
+        self.date = pd.Timestamp(event.get("EventDate"))
+
+
+def test_circuit_key_separates_layouts_at_one_location_and_season():
+    bahrain = _Session(Location="Sakhir", EventName="Bahrain Grand Prix", RoundNumber=15, EventDate="2020-11-29")
+    sakhir = _Session(Location="Sakhir", EventName="Sakhir Grand Prix", RoundNumber=16, EventDate="2020-12-06")
+
+    assert circuit_key(bahrain) != circuit_key(sakhir)
+    assert circuit_key(bahrain).startswith("sakhir::2020::")
+
+
+def test_circuit_key_is_stable_across_sessions_of_one_event():
+    quali = _Session(Location="Monza", EventName="Italian Grand Prix", EventDate="2024-09-01")
+    race = _Session(Location="Monza", EventName="Italian Grand Prix", EventDate="2024-09-01")
+
+    assert circuit_key(quali) == circuit_key(race)
+
+
+def test_circuit_key_needs_a_location():
+    assert circuit_key(_Session(EventDate="2024-09-01")) is None
+
+
+# -----------------------------
+# get_circuit_geometry
+# -----------------------------
+def _timed_session() -> _Session:
+    session = _Session(Location="Monza", EventName="Italian Grand Prix", EventDate="2024-09-01")
+    # Lap 2 is the fastest but deleted
+    session.laps = pd.DataFrame(
+        {
+            "Driver": ["VER", "VER", "LEC"],
+            "LapNumber": [1.0, 2.0, 1.0],
+            "LapTime": pd.to_timedelta([81.0, 80.0, 80.5], unit="s"),
+            "Deleted": [False, True, False],
+        }
+    )
+    return session
+
+
+def test_circuit_geometry_builds_from_the_fastest_valid_lap_and_remembers_misses(monkeypatch):
+    built = []
+
+    def build(session, key, lap=None):
+        built.append((lap, circuit_geometry._fastest_valid_lap(session)))
+        return None
+
+    monkeypatch.setattr(circuit_geometry, "_MISSES", set())
+    monkeypatch.setattr(circuit_geometry, "read_geometry", lambda key: None)
+    monkeypatch.setattr(circuit_geometry, "build_circuit_geometry", build)
+    session = _timed_session()
+
+    assert circuit_geometry.get_circuit_geometry(session, lap=session.laps.iloc[0]) is None
+    assert circuit_geometry.get_circuit_geometry(session) is None
+
+    # One build, without the caller's lap; the failure is not retried
+    assert len(built) == 1
+    lap, fastest = built[0]
+    assert lap is None
+    assert (fastest["Driver"], fastest["LapNumber"]) == ("LEC", 1.0)
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from fpd.analytics import compare
+from fpd.analytics.compare import CompareRequest, LapRef, build_compare
+from fpd.analytics.downsample import compare_plot_payload
+from fpd.components.compare_charts import _PAYLOAD_CHARTS
+
+
+def _fastf1_lap_telemetry(driver_offset: float) -> pd.DataFrame:
+    """
+    One lap of car telemetry with FastF1 column names (nGear, not Gear).
+    """
+    dist = np.arange(0.0, 5000.0, 5.0)
+    speed = 200.0 + 80.0 * np.sin(dist / 400.0) + driver_offset
+    elapsed = np.concatenate(([0.0], np.cumsum(np.diff(dist) / (speed[1:] / 3.6))))
+    return pd.DataFrame(
+        {
+            "Distance": dist,
+            "Time": pd.to_timedelta(elapsed, unit="s"),
+            "Speed": speed,
+            "Throttle": np.clip(speed - 150.0, 0.0, 100.0),
+            "Brake": speed < 160.0,
+            "nGear": np.clip(speed // 40.0, 1, 8).astype(int),
+            "RPM": speed * 50.0,
+        }
+    )
+
+
+class _Session:
+    def __init__(self, laps: pd.DataFrame):
+        self.laps = laps
+
+
+def _session() -> _Session:
+    laps = pd.DataFrame(
+        {
+            "Driver": ["VER", "HAM"],
+            "LapNumber": [1.0, 1.0],
+            "LapTime": pd.to_timedelta([90.0, 90.5], unit="s"),
+        }
+    )
+    return _Session(laps)
+
+
+def test_gear_payload_reads_fastf1_ngear(monkeypatch):
+    frames = {"VER": _fastf1_lap_telemetry(0.0), "HAM": _fastf1_lap_telemetry(-2.0)}
+
+    def fake_lap_telemetry(lap, channels=None):
+        tel = frames[lap["Driver"]]
+        return tel[["Distance", *[c for c in channels if c in tel.columns]]]
+
+    monkeypatch.setattr(compare, "lap_telemetry", fake_lap_telemetry)
+
+    req = CompareRequest(mode="current", laps=[LapRef(driver="VER"), LapRef(driver="HAM")])
+    result = build_compare(_session(), req)
+    payload = compare_plot_payload(result, width_px=100)
+
+    gear = payload[_PAYLOAD_CHARTS["Gear"]]
+    assert not gear.empty
+    assert set(gear["Driver"]) == {"VER", "HAM"}
+    assert gear[_PAYLOAD_CHARTS["Gear"]].between(1, 8).all()
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from fpd.analytics.lap_index import get_lap_index
+from fpd.data.session_memo import drop_session_memo
+
+
+class _Session:
+    def __init__(self, laps: pd.DataFrame):
+        self.laps = laps
+
+
+def _laps(pb_lap: float) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Driver": ["VER", "VER", "VER"],
+            "LapNumber": [1.0, 2.0, 3.0],
+            "LapTime": pd.to_timedelta([92.0, 90.0, 91.0], unit="s"),
+            "IsPersonalBest": [n == pb_lap for n in (1.0, 2.0, 3.0)],
+        }
+    )
+
+
+def test_lap_index_is_built_once_per_session():
+    session = _Session(_laps(pb_lap=2.0))
+
+    index = get_lap_index(session)
+
+    assert get_lap_index(session) is index
+    assert index.fastest_lap("VER")["LapNumber"] == 2.0
+
+
+def test_lap_index_follows_a_dropped_memo():
+    session = _Session(_laps(pb_lap=2.0))
+    stale = get_lap_index(session)
+
+    # What the loader does when it replaces a session: the memo goes, the index is rebuilt
+    session.laps = _laps(pb_lap=3.0)
+    drop_session_memo(session)
+
+    index = get_lap_index(session)
+    assert index is not stale
+    assert index.fastest_lap("VER")["LapNumber"] == 3.0
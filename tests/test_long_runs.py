@@ -0,0 +1,19 @@
+import pandas as pd
+
+from fpd.analytics.long_runs import _auto_detect_stints
+
+
+def test_auto_detect_stints_keeps_driver_first_appearance_order():
+    laps = pd.DataFrame(
+        {
+            "Driver": ["VER"] * 6 + ["ALO"] * 6,
+            "LapNumber": list(range(6, 0, -1)) + list(range(1, 7)),
+            "Compound": ["SOFT"] * 6 + ["MEDIUM"] * 6,
+        }
+    )
+
+    stints = _auto_detect_stints(laps, min_laps=6)
+
+    assert stints["Driver"].tolist() == ["VER", "ALO"]
+    assert stints[["LapStart", "LapEnd", "Laps"]].values.tolist() == [[1, 6, 6], [1, 6, 6]]
+    assert stints["Compound"].tolist() == ["SOFT", "MEDIUM"]
@@ -0,0 +1,36 @@
+import threading
+
+import pytest
+
+from fpd.core import parallel
+from fpd.core.parallel import parallel_map
+
+
+def _thread_names(monkeypatch, env: dict, **kwargs) -> set[str]:
+    for name in (parallel.POOL_ENV, parallel.WORKERS_ENV):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return set(parallel_map(lambda _: threading.current_thread().name, range(8), **kwargs))
+
+
+def test_parallel_map_keeps_input_order():
+    assert parallel_map(lambda x: x * x, range(10), pool="thread", workers=3) == [x * x for x in range(10)]
+
+
+def test_parallel_map_env_overrides_config(monkeypatch):
+    main = threading.current_thread().name
+    assert _thread_names(monkeypatch, {parallel.POOL_ENV: "serial"}) == {main}
+    assert _thread_names(monkeypatch, {parallel.WORKERS_ENV: "1"}) == {main}
+
+
+def test_parallel_map_arguments_override_env(monkeypatch):
+    main = threading.current_thread().name
+    assert _thread_names(monkeypatch, {parallel.POOL_ENV: "thread"}, pool="serial") == {main}
+    assert _thread_names(monkeypatch, {parallel.POOL_ENV: "serial"}, pool="thread", workers=2) != {main}
+
+
+def test_parallel_map_rejects_bad_worker_env(monkeypatch):
+    monkeypatch.setenv(parallel.WORKERS_ENV, "many")
+    with pytest.raises(ValueError, match=parallel.WORKERS_ENV):
+        parallel_map(str, [1, 2])
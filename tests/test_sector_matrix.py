@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from fpd.analytics.sector_matrix import get_sector_matrix
+from fpd.data.session_memo import drop_session_memo
+
+
+class _Session:
+    def __init__(self, laps: pd.DataFrame):
+        self.laps = laps
+
+
+def _laps(deleted: list[bool]) -> pd.DataFrame:
+    s1 = np.array([30.0, 29.0, 29.5])
+    start = np.array([0.0, 100.0, 200.0])
+    return pd.DataFrame(
+        {
+            "Driver": ["VER", "VER", "VER"],
+            "LapNumber": [1.0, 2.0, 3.0],
+            "Sector1Time": pd.to_timedelta(s1, unit="s"),
+            "Sector1SessionTime": pd.to_timedelta(start + s1, unit="s"),
+            "Deleted": deleted,
+        }
+    )
+
+
+def test_deleted_lap_never_sets_a_best():
+    matrix = get_sector_matrix(_Session(_laps([False, True, False])))
+
+    assert matrix.deleted.tolist() == [False, True, False]
+    # Lap 2 (29.0) is deleted: lap 3 (29.5) improves on lap 1 instead
+    assert matrix.personal_best[:, 0].tolist() == [True, False, True]
+
+
+def test_sector_matrix_is_memoized_per_session():
+    session = _Session(_laps([False, False, False]))
+    stale = get_sector_matrix(session)
+    assert get_sector_matrix(session) is stale
+
+    # Replaced sessions get their memo dropped; the matrix then follows the new flags
+    session.laps = _laps([False, True, False])
+    drop_session_memo(session)
+
+    assert get_sector_matrix(session).deleted.tolist() == [False, True, False]
@@ -0,0 +1,207 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from fpd.data import session_loader
+from fpd.data.session_cache import SESSION_CACHE, SingleFlight
+from fpd.data.session_memo import session_memo
+
+
+N_CALLERS = 8
+
+
+def _run_concurrently(fn, n: int = N_CALLERS) -> list:
+    """
+    fn() on n threads released together; returns each thread's result or exception.
+    """
+    start = threading.Barrier(n)
+    out: list = [None] * n
+
+    def worker(i: int) -> None:
+        start.wait()
+        try:
+            out[i] = fn()
+        except BaseException as e:  # noqa: BLE001 - collected for the assertions
+            out[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return out
+
+
+# -----------------------------
+# SingleFlight
+# -----------------------------
+def test_single_flight_runs_once_and_shares_result():
+    flights = SingleFlight()
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    results = _run_concurrently(lambda: flights.do("key", slow_load))
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flights.in_flight() == 0
+
+
+def test_single_flight_error_reaches_waiters():
+    flights = SingleFlight()
+    calls = []
+
+    def failing_load():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("load failed")
+
+    results = _run_concurrently(lambda: flights.do("key", failing_load))
+
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert all(r is results[0] for r in results)
+
+    # The key is released: the next call runs again
+    assert flights.do("key", lambda: "ok") == "ok"
+
+
+# -----------------------------
+# fetch_session
+# -----------------------------
+class _SlowSession:
+    """
+    Stand-in for fastf1.core.Session: load() is slow and records its flags.
+    Like FastF1, every load() re-runs lap post-processing on the session's laps:
+    a generated lap is appended and PB flags are rewritten in place.
+    """
+
+    def __init__(self, loads: list, fail: bool = False):
+        self.loads = loads
+        self.fail = fail
+        self.laps = pd.DataFrame({"Driver": ["VER"], "LapNumber": [1.0], "IsPersonalBest": [True]})
+
+    def load(self, **flags) -> None:
+        self.loads.append(flags)
+        time.sleep(0.2)
+        if self.fail:
+            raise RuntimeError("fastf1 load failed")
+        generated = pd.DataFrame({"Driver": ["VER"], "LapNumber": [2.0], "IsPersonalBest": [True]})
+        self.laps = pd.concat([self.laps[self.laps["LapNumber"] < 2], generated], ignore_index=True)
+        self.laps.loc[self.laps["LapNumber"] < 2, "IsPersonalBest"] = False
+
+
+@pytest.fixture
+def fake_fastf1(monkeypatch):
+    """
+    fastf1.get_session returns _SlowSession objects; the fpd store is bypassed.
+    Yields (get_session calls, load flag dicts, set_fail).
+    """
+    SESSION_CACHE.clear()
+    created, loads = [], []
+    state = {"fail": False}
+
+    def get_session(season, event_name, identifier):
+        sess = _SlowSession(loads, fail=state["fail"])
+        created.append(sess)
+        return sess
+
+    monkeypatch.setattr(session_loader.fastf1, "get_session", get_session)
+    monkeypatch.setattr(session_loader.session_store, "read_session", lambda key, wanted: None)
+    monkeypatch.setattr(session_loader.session_store, "write_session", lambda key, sess, parts: None)
+
+    yield created, loads, lambda fail: state.update(fail=fail)
+    SESSION_CACHE.clear()
+
+
+def test_fetch_session_concurrent_callers_share_one_load(fake_fastf1):
+    created, loads, _ = fake_fastf1
+
+    results = _run_concurrently(lambda: session_loader.fetch_session(2024, "Bahrain", "Q", profile="laps"))
+
+    assert len(created) == 1
+    assert len(loads) == 1
+    assert all(r is created[0] for r in results)
+
+
+def test_fetch_session_error_reaches_waiters(fake_fastf1):
+    created, loads, set_fail = fake_fastf1
+    set_fail(True)
+
+    results = _run_concurrently(lambda: session_loader.fetch_session(2024, "Bahrain", "R", profile="laps"))
+
+    assert len(loads) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert "2024::Bahrain::R" not in SESSION_CACHE
+
+
+def test_fetch_session_profile_upgrade_loads_a_fresh_session(fake_fastf1):
+    created, loads, _ = fake_fastf1
+    results: dict[str, object] = {}
+
+    def fetch(profile: str) -> None:
+        results[profile] = session_loader.fetch_session(2024, "Bahrain", "FP1", profile=profile)
+
+    light = threading.Thread(target=fetch, args=("laps",))
+    light.start()
+    # Join while the "laps" load is in flight
+    while not loads:
+        time.sleep(0.01)
+    full = threading.Thread(target=fetch, args=("full",))
+    full.start()
+    light.join(timeout=10)
+    full.join(timeout=10)
+
+    # The upgrade loads every part into a new session; the cached one is never reloaded
+    assert len(created) == 2
+    assert loads == [
+        {"laps": True, "telemetry": False, "weather": False, "messages": False},
+        {"laps": True, "telemetry": True, "weather": True, "messages": True},
+    ]
+    assert results["laps"] is created[0]
+    assert results["full"] is created[1]
+    assert session_loader.fetch_session(2024, "Bahrain", "FP1", profile="laps") is created[1]
+    assert session_loader.loaded_parts(created[1]) == session_loader.LOAD_PROFILES["full"]
+
+
+def test_fetch_session_upgrade_does_not_touch_readers_laps(fake_fastf1):
+    created, _, _ = fake_fastf1
+
+    light = session_loader.fetch_session(2024, "Bahrain", "Q", profile="laps")
+    laps_before = light.laps
+    snapshot = laps_before.copy()
+    session_memo(light, "lap_count", lambda: len(light.laps))
+
+    full = session_loader.fetch_session(2024, "Bahrain", "Q", profile="full")
+
+    assert full is not light
+    # Readers of the lighter session see the same, unmodified laps frame
+    assert light.laps is laps_before
+    pd.testing.assert_frame_equal(light.laps, snapshot)
+    # The upgraded session has each lap once
+    assert not full.laps.duplicated(["Driver", "LapNumber"]).any()
+    # Memoized values of the replaced session are dropped
+    assert session_memo(light, "lap_count", lambda: -1) == -1
+
+
+# -----------------------------
+# load_session state fallback
+# -----------------------------
+@pytest.mark.parametrize(
+    ("event_name", "expected_key"),
+    [("Bahrain Grand Prix", 1), ("Monaco Grand Prix", None)],
+)
+def test_load_session_reads_event_key_from_state_only_for_the_selected_event(monkeypatch, event_name, expected_key):
+    calls = []
+    monkeypatch.setattr(session_loader.st, "session_state", {"event_name": "Bahrain Grand Prix", "fpd_event_key": 1})
+    monkeypatch.setattr(session_loader, "fetch_session", lambda *a, **kw: calls.append(kw["event_key"]))
+
+    session_loader.load_session(2024, event_name, "R")
+
+    assert calls == [expected_key]
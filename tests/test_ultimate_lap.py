@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from fpd.analytics import ultimate_lap
+from fpd.analytics.mini_sectors import MiniSectors
+
+
+class _Session:
+    def __init__(self, laps: pd.DataFrame):
+        self.laps = laps
+
+
+def test_mini_sector_ultimate_lap_skips_deleted_laps(monkeypatch):
+    # Lap 2 is deleted (track limits) and holds the best mini-sector 1 and lap time
+    laps = pd.DataFrame(
+        {
+            "Driver": ["VER", "VER", "VER"],
+            "LapNumber": [1.0, 2.0, 3.0],
+            "LapTime": pd.to_timedelta([90.0, 88.0, 89.5], unit="s"),
+            "Deleted": [False, True, False],
+        }
+    )
+    ms = MiniSectors(
+        laps=pd.DataFrame({"Driver": ["VER"] * 3, "LapNumber": [1.0, 2.0, 3.0], "LapTime(s)": [90.0, 88.0, 89.5]}),
+        times=np.array([[45.0, 45.0], [43.0, 45.0], [44.5, 45.0]], dtype=np.float32),
+        length_m=5000.0,
+    )
+    monkeypatch.setattr(ultimate_lap, "get_mini_sectors", lambda session, k: ms)
+
+    result = ultimate_lap.ultimate_laps(_Session(laps), source="mini_sectors", k=2)
+
+    row = result.ranking.iloc[0]
+    assert row["IdealLap(s)"] == 89.5
+    assert row["FastestLap(s)"] == 89.5
+    assert result.best_segments["LapNumber"].tolist() == [3, 1]